@@ -9,17 +9,49 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import sqlite3
+import tempfile
+import threading
+import time
 import warnings
+from collections import OrderedDict, namedtuple
+from contextlib import closing, suppress
 from functools import update_wrapper
 from glob import glob
 from pathlib import Path
 from typing import Any, Callable
 
+import numpy as np
+
 import pyresample
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses"])
+
+# Name of the database file of the 'sqlite' backend in the cache directory
+SQLITE_FILENAME = "slices.sqlite"
+# Seconds to wait for other processes to release a lock on the database
+SQLITE_TIMEOUT = 60.0
+# Errors of the cache stores that make a call fall back to running uncached
+_CACHE_ERRORS = (OSError, sqlite3.Error)
+
+
 class JSONCacheHelper:
-    """Decorator class to cache results to a JSON file on-disk."""
+    """Decorator class to cache JSON-serializable results on-disk.
+
+    Results are stored with the backend chosen by the
+    ``cache_geometry_slices_backend`` configuration option, either as one
+    JSON file per result (``"json"``) or as rows of a single SQLite database
+    file (``"sqlite"``). Both backends write entries atomically so concurrent
+    processes sharing the cache directory never read partially written
+    results. If ``cache_geometry_slices_max_entries`` is set then the least
+    recently used entries are removed when more entries are stored. If the
+    cache can't be read or written, for example because the database is
+    locked by another process for longer than ``SQLITE_TIMEOUT`` seconds or
+    the cache file is damaged, a warning is issued and the result is computed
+    without the cache.
+
+    """
 
     def __init__(
             self,
@@ -31,25 +63,38 @@ class JSONCacheHelper:
         self._cache_config_key = cache_config_key
         self._cache_version = cache_version
         self._uncacheable_arg_type_names = ("",)
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
 
     @staticmethod
     def cache_clear(cache_dir: str | None = None):
-        """Remove all on-disk files associated with this function.
+        """Remove all on-disk entries associated with this function.
 
         Intended to mimic the :func:`functools.cache` behavior.
         """
         cache_path = _get_cache_dir_from_config(cache_dir=cache_dir, cache_version="*")
         for json_file in glob(str(cache_path / "*.json")):
             os.remove(json_file)
+        for db_file in glob(str(cache_path / SQLITE_FILENAME)):
+            _SQLiteStore(Path(db_file).parent).clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Get the number of cache hits and misses in this process.
+
+        Intended to mimic the :func:`functools.lru_cache` behavior.
+        """
+        with self._stats_lock:
+            return CacheInfo(self._hits, self._misses)
 
     def __call__(self, *args):
-        """Call decorated function and cache the result to JSON."""
+        """Call decorated function and cache the result."""
         should_cache = pyresample.config.get(self._cache_config_key, False)
         if not should_cache:
             return self._callable(*args)
 
         try:
-            arg_hash = _hash_args(args)
+            arg_hash = _hash_args((f"{self._callable.__module__}.{self._callable.__qualname__}",) + args)
         except TypeError as err:
             warnings.warn("Cannot cache function due to unhashable argument: " + str(err),
                           stacklevel=2)
@@ -58,18 +103,260 @@ class JSONCacheHelper:
         return self._run_and_cache(arg_hash, args)
 
     def _run_and_cache(self, arg_hash: str, args: tuple[Any]) -> Any:
-        base_cache_dir = _get_cache_dir_from_config(cache_version=self._cache_version)
-        json_path = base_cache_dir / f"{arg_hash}.json"
-        if not json_path.is_file():
-            res = self._callable(*args)
-            json_path.parent.mkdir(exist_ok=True)
-            with open(json_path, "w") as json_cache:
-                json.dump(res, json_cache, cls=_JSONEncoderWithSlice)
+        store = _get_cache_store_from_config(self._cache_version)
+        can_store = True
+        try:
+            res_json = store.load(arg_hash)
+        except KeyError:
+            res_json = None
+        except _CACHE_ERRORS as err:
+            # a locked, damaged, or unreachable cache shouldn't stop the caller
+            warnings.warn(f"Cannot read from the cache, running uncached: {err}", stacklevel=3)
+            res_json = None
+            can_store = False
+
+        self._count(hit=res_json is not None)
+        if res_json is None:
+            res_json = json.dumps(self._callable(*args), cls=_JSONEncoderWithSlice)
+            if can_store:
+                try:
+                    store.store(arg_hash, res_json)
+                except _CACHE_ERRORS as err:
+                    warnings.warn(f"Cannot write to the cache: {err}", stacklevel=3)
+
+        # for consistency, always return the deserialized result
+        return json.loads(res_json, object_hook=_object_hook)
+
+    def _count(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+
+class _JSONFileStore:
+    """Store every entry as a JSON file named after its key."""
+
+    def __init__(self, cache_path: Path, max_entries: int | None = None):
+        self._cache_path = cache_path
+        self._max_entries = max_entries
+
+    def load(self, key: str) -> str:
+        json_path = self._cache_path / f"{key}.json"
+        try:
+            with open(json_path, "r") as json_cache:
+                res_json = json_cache.read()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        if self._max_entries is not None:
+            # mark as recently used for eviction
+            with suppress(FileNotFoundError):
+                os.utime(json_path)
+        return res_json
+
+    def store(self, key: str, value: str) -> None:
+        self._cache_path.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so readers never see partial files
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{key}-", suffix=".tmp", dir=self._cache_path)
+        try:
+            with os.fdopen(fd, "w") as json_cache:
+                json_cache.write(value)
+            os.replace(tmp_path, self._cache_path / f"{key}.json")
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        self._evict(keep=key)
+
+    def _evict(self, keep: str) -> None:
+        if self._max_entries is None:
+            return
+        json_paths = glob(str(self._cache_path / "*.json"))
+        if len(json_paths) <= self._max_entries:
+            return
+        mtimes = {}
+        for json_path in json_paths:
+            with suppress(FileNotFoundError):
+                mtimes[json_path] = os.stat(json_path).st_mtime
+        num_to_remove = len(mtimes) - self._max_entries
+        for json_path in sorted(mtimes, key=mtimes.get):
+            if num_to_remove <= 0:
+                break
+            if Path(json_path).stem == keep:
+                continue
+            with suppress(FileNotFoundError):
+                os.remove(json_path)
+            num_to_remove -= 1
+
+
+class _SQLiteStore:
+    """Store all entries in a single SQLite database file.
+
+    Every operation runs in its own transaction on a new connection so the
+    store can be shared by threads and by processes. Without a maximum
+    number of entries, loading an entry only needs a read-only connection so
+    concurrent readers never wait for each other. SQLite relies on file
+    locks which some network file systems don't implement reliably.
+    """
+
+    def __init__(self, cache_path: Path, max_entries: int | None = None):
+        self._db_path = cache_path / SQLITE_FILENAME
+        self._max_entries = max_entries
+
+    def _connect(self) -> sqlite3.Connection:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=SQLITE_TIMEOUT)
+        conn.execute("CREATE TABLE IF NOT EXISTS entries "
+                     "(key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)")
+        return conn
+
+    def load(self, key: str) -> str:
+        if self._max_entries is None:
+            return self._read(key)
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                raise KeyError(key)
+            # mark as recently used for eviction
+            conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def _read(self, key: str) -> str:
+        if not self._db_path.is_file():
+            raise KeyError(key)
+        db_uri = self._db_path.absolute().as_uri() + "?mode=ro"
+        with closing(sqlite3.connect(db_uri, uri=True, timeout=SQLITE_TIMEOUT)) as conn:
+            try:
+                row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            except sqlite3.OperationalError as err:
+                if "no such table" not in str(err):
+                    raise
+                row = None
+        if row is None:
+            raise KeyError(key)
+        return row[0]
 
-        # for consistency, always load the cached result
-        with open(json_path, "r") as json_cache:
-            res = json.load(json_cache, object_hook=_object_hook)
-        return res
+    def store(self, key: str, value: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT INTO entries VALUES (?, ?, ?) "
+                         "ON CONFLICT(key) DO UPDATE SET last_used = excluded.last_used",
+                         (key, value, time.time()))
+            if self._max_entries is not None:
+                conn.execute("DELETE FROM entries WHERE key != ? AND key NOT IN "
+                             "(SELECT key FROM entries ORDER BY last_used DESC LIMIT ?)",
+                             (key, self._max_entries))
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM entries")
+
+
+_CACHE_STORES = {
+    "json": _JSONFileStore,
+    "sqlite": _SQLiteStore,
+}
+
+
+class LRUCache:
+    """Thread-safe in-memory cache holding a maximum number of entries.
+
+    When a new entry would make the cache hold more than ``max_entries``
+    entries then the least recently used entry is removed.
+
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get the cached value for ``key`` or ``default`` if not cached."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Any, value: Any) -> None:
+        """Add ``value`` to the cache, removing the least recently used entries if needed."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class LonLatCache:
+    """Process-wide, size-bounded in-memory cache of longitude/latitude arrays.
+
+    Entries are stored in least recently used order. When a new entry would
+    make the total size of the cached numpy arrays larger than the
+    ``cache_lonlats_max_size`` configuration value (in bytes) then the least
+    recently used entries are removed. Dask arrays only hold a task graph and
+    are not counted in the size of the cache.
+
+    Cached numpy arrays are made read-only so that every user of the cache
+    shares the same buffers without being able to modify them.
+
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict = OrderedDict()
+        self._sizes: dict = {}
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Get the total number of bytes used by numpy arrays in the cache."""
+        return sum(self._sizes.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> tuple | None:
+        """Get the cached ``(lons, lats)`` for ``key`` or ``None`` if not cached."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Any, lons: Any, lats: Any) -> tuple:
+        """Add ``lons`` and ``lats`` to the cache and return the cached arrays."""
+        max_size = pyresample.config.get("cache_lonlats_max_size")
+        numpy_arrs = [arr for arr in (lons, lats) if isinstance(arr, np.ndarray)]
+        entry_size = sum(arr.nbytes for arr in numpy_arrs)
+        if max_size is not None and entry_size > max_size:
+            # not cached so not shared, leave the arrays writable
+            return lons, lats
+        for arr in numpy_arrs:
+            arr.flags.writeable = False
+        with self._lock:
+            self._entries[key] = (lons, lats)
+            self._sizes[key] = entry_size
+            while max_size is not None and self.size > max_size:
+                old_key, _ = self._entries.popitem(last=False)
+                del self._sizes[old_key]
+        return lons, lats
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+
+lonlat_cache = LonLatCache()
 
 
 def _get_cache_dir_from_config(cache_dir: str | None = None, cache_version: int | str = 1) -> Path:
@@ -80,6 +367,19 @@ def _get_cache_dir_from_config(cache_dir: str | None = None, cache_version: int
     return Path(cache_dir) / subdir
 
 
+def _get_cache_store_from_config(cache_version: int = 1) -> _JSONFileStore | _SQLiteStore:
+    backend = pyresample.config.get("cache_geometry_slices_backend", "json")
+    try:
+        store_class = _CACHE_STORES[backend]
+    except KeyError:
+        raise ValueError(f"Unknown geometry slices cache backend: {backend!r}. "
+                         f"Use one of {', '.join(repr(name) for name in _CACHE_STORES)}.") from None
+    max_entries = pyresample.config.get("cache_geometry_slices_max_entries", None)
+    if max_entries is not None:
+        max_entries = int(max_entries)
+    return store_class(_get_cache_dir_from_config(cache_version=cache_version), max_entries)
+
+
 def _hash_args(args: tuple[Any]) -> str:
     from pyresample.future.geometry import AreaDefinition, SwathDefinition
     from pyresample.geometry import AreaDefinition as LegacyAreaDefinition
@@ -110,18 +410,21 @@ def _object_hook(obj: object) -> Any:
     return obj
 
 
-def cache_to_json_if(cache_config_key: str) -> Callable:
-    """Decorate a function and cache the results to a JSON file on disk.
+def cache_to_json_if(cache_config_key: str, cache_version: int = 1) -> Callable:
+    """Decorate a function and cache the results as JSON on disk.
 
     This caching only happens if the ``pyresample.config`` boolean value for
     the provided key is ``True`` as well as some other conditions. See
-    :class:`JSONCacheHelper` for more information. Most importantly this
-    decorator does not limit how many items can be cached and does not clear
-    out old entries. It is up to the user to manage the size of the cache.
+    :class:`JSONCacheHelper` for more information. Unless the
+    ``cache_geometry_slices_max_entries`` option is set, this decorator does
+    not limit how many items can be cached and does not clear out old
+    entries. Entries are stored in a ``geometry_slices_v<cache_version>``
+    subdirectory of the cache directory, so ``cache_version`` should be
+    increased whenever the cached results or their keys change.
 
     """
     def _decorator(func: Callable) -> Callable:
-        zarr_cacher = JSONCacheHelper(func, cache_config_key)
+        zarr_cacher = JSONCacheHelper(func, cache_config_key, cache_version=cache_version)
         wrapper = update_wrapper(zarr_cacher, func)
         return wrapper
 
@@ -37,6 +37,11 @@ config = Config(
     defaults=[{
         "cache_dir": platformdirs.user_cache_dir("pyresample", "pytroll"),
         "cache_geometry_slices": False,
+        "cache_geometry_slices_backend": "json",
+        "cache_geometry_slices_max_entries": None,
+        "cache_lonlats": False,
+        "cache_lonlats_max_size": 2 * 1024 ** 3,
+        "geometry_hash_method": "sha1",
         "features": {
             "future_geometries": False,
         },
@@ -0,0 +1,123 @@
+# Copyright (C) 2024 Pyresample developers
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Digests of the coordinate arrays used to hash geometry definitions.
+
+The method used is chosen with the ``geometry_hash_method`` configuration
+option. See :ref:`config_geometry_hash_method` for the available methods.
+"""
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Approximate number of bytes hashed at once by one thread
+BLOCK_NBYTES = 16 * 1024 ** 2
+# Number of array elements hashed by the 'fingerprint' method
+FINGERPRINT_SAMPLE_SIZE = 4096
+
+
+def _xxhash_factory():
+    if xxhash is None:
+        raise ImportError("The 'xxhash' geometry hash method requires the 'xxhash' package.")
+    return xxhash.xxh3_128()
+
+
+def _blake2b_factory():
+    return hashlib.blake2b(digest_size=20)
+
+
+def _update_with_layout(the_hash, arr: np.ndarray, strides: bool = False) -> None:
+    layout = (arr.dtype.str, arr.shape, arr.strides if strides else None)
+    the_hash.update(repr(layout).encode("utf-8"))
+
+
+def _block_digest(hash_factory: Callable, block: np.ndarray) -> bytes:
+    block_hash = hash_factory()
+    block_hash.update(np.ascontiguousarray(block).view(np.uint8))
+    return block_hash.digest()
+
+
+def block_hash(arr: np.ndarray, hash_factory: Callable, num_threads: int = 1) -> bytes:
+    """Hash the whole array, one block of rows at a time.
+
+    The digests of the blocks are hashed together with the dtype and shape
+    of the array. Blocks are hashed in a thread pool if ``num_threads`` is
+    larger than one, the result does not depend on the number of threads.
+    """
+    rows = arr.reshape((arr.shape[0], -1)) if arr.ndim > 1 else arr.reshape((-1, 1))
+    row_nbytes = max(rows.shape[1] * rows.itemsize, 1)
+    rows_per_block = max(BLOCK_NBYTES // row_nbytes, 1)
+    blocks = [rows[start:start + rows_per_block] for start in range(0, rows.shape[0], rows_per_block)]
+
+    if num_threads > 1 and len(blocks) > 1:
+        with ThreadPoolExecutor(min(num_threads, len(blocks))) as executor:
+            digests = list(executor.map(lambda block: _block_digest(hash_factory, block), blocks))
+    else:
+        digests = [_block_digest(hash_factory, block) for block in blocks]
+
+    arr_hash = hash_factory()
+    _update_with_layout(arr_hash, arr)
+    for digest in digests:
+        arr_hash.update(digest)
+    return arr_hash.digest()
+
+
+def fingerprint(arr: np.ndarray, num_threads: int = 1) -> bytes:
+    """Hash the layout of the array and a deterministic sample of its values.
+
+    Only the dtype, shape and strides of the array and
+    ``FINGERPRINT_SAMPLE_SIZE`` evenly spaced elements (including the first
+    and the last) are hashed. Arrays differing only outside of the sample
+    get the same fingerprint.
+    """
+    arr_hash = _blake2b_factory()
+    _update_with_layout(arr_hash, arr, strides=True)
+    if arr.size:
+        flat_index = np.unique(np.linspace(0, arr.size - 1, FINGERPRINT_SAMPLE_SIZE).astype(np.int64))
+        sample = arr[np.unravel_index(flat_index, arr.shape)]
+        arr_hash.update(np.ascontiguousarray(sample).view(np.uint8))
+    return arr_hash.digest()
+
+
+HASH_METHODS = {
+    "blake2b": lambda arr, num_threads=1: block_hash(arr, _blake2b_factory, num_threads),
+    "xxhash": lambda arr, num_threads=1: block_hash(arr, _xxhash_factory, num_threads),
+    "fingerprint": fingerprint,
+}
+
+
+def get_hash_method(method: str | Callable) -> Callable | None:
+    """Get the function computing the digest of a numpy array.
+
+    Returns ``None`` for the ``"sha1"`` method where the whole array buffer is
+    fed to the hash of the geometry. Callables are returned as is.
+    """
+    if callable(method):
+        return method
+    if method == "sha1":
+        return None
+    try:
+        return HASH_METHODS[method]
+    except KeyError:
+        raise ValueError(f"Unknown geometry hash method: {method!r}. Use 'sha1', "
+                         f"{', '.join(repr(name) for name in HASH_METHODS)} or a callable.") from None
@@ -40,69 +40,48 @@ R = 6370997.0
 
 
 class cKDTree_MP(object):
-    """Multiprocessing cKDTree subclass, shared memory."""
+    """Multithreaded KD-tree using one shared :class:`scipy.spatial.cKDTree`.
+
+    The tree is built once and queried from ``nprocs`` threads using SciPy's
+    ``workers`` keyword argument. All threads share the same tree and input
+    data so no data is copied between processes. Indices are returned as
+    64-bit integers so more than 2^31 points are supported.
+
+    """
 
     def __init__(self, data, leafsize=10, nprocs=2, chunk=None,
                  schedule='guided'):
-        """Prepare shared memory for KDTree operations.
+        """Build the shared KD-tree.
 
-        Same as cKDTree.__init__ except that an internal copy of data to shared memory is made.
-
-        Extra keyword arguments:
-        chunk : Minimum chunk size for the load balancer.
-        schedule: Strategy for balancing work load
-        ('static', 'dynamic' or 'guided').
+        Same as cKDTree.__init__ with the extra keyword argument ``nprocs``
+        for the number of threads to use when querying (-1 uses all CPUs).
+        ``data`` can be 32 or 64-bit floats. The ``chunk`` and ``schedule``
+        keyword arguments are accepted for backwards compatibility and are
+        ignored.
         """
-        self.n, self.m = data.shape
-        # Allocate shared memory for data
-        self.shmem_data = mp.RawArray(ctypes.c_double, self.n * self.m)
-
-        # View shared memory as ndarray, and copy over the data.
-        # The RawArray objects have information about the dtype and
-        # buffer size.
-        _data = shmem_as_ndarray(self.shmem_data).reshape((self.n, self.m))
-        _data[:, :] = data
-
-        # Initialize parent, we must do this last because
-        # cKDTree stores a reference to the data array. We pass in
-        # the copy in shared memory rather than the origial data.
+        from scipy.spatial import cKDTree
+
+        self.data = np.asarray(data)
+        if not np.issubdtype(self.data.dtype, np.floating):
+            self.data = self.data.astype(np.float64)
+        self.n, self.m = self.data.shape
         self.leafsize = leafsize
         self._nprocs = nprocs
-        self._chunk = chunk
-        self._schedule = schedule
+        self._kdtree = cKDTree(self.data, leafsize=leafsize)
 
     def query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf):
-        """Query for points at index 'x' parallelized with multiple processes and shared memory."""
-        # allocate shared memory for x and result
-        nx = x.shape[0]
-        shmem_x = mp.RawArray(ctypes.c_double, nx * self.m)
-        shmem_d = mp.RawArray(ctypes.c_double, nx * k)
-        shmem_i = mp.RawArray(ctypes.c_int, nx * k)
-
-        # view shared memory as ndarrays
-        _x = shmem_as_ndarray(shmem_x).reshape((nx, self.m))
-        if k == 1:
-            _d = shmem_as_ndarray(shmem_d)
-            _i = shmem_as_ndarray(shmem_i)
-        else:
-            _d = shmem_as_ndarray(shmem_d).reshape((nx, k))
-            _i = shmem_as_ndarray(shmem_i).reshape((nx, k))
+        """Query for the ``k`` nearest neighbours of ``x`` using multiple threads.
 
-        # copy x to shared memory
-        _x[:] = x
-
-        # set up a scheduler to load balance the query
-        scheduler = Scheduler(nx, self._nprocs, chunk=self._chunk,
-                              schedule=self._schedule)
-
-        # query with multiple processes
-        query_args = [scheduler, self.shmem_data, self.n, self.m,
-                      self.leafsize, shmem_x, nx, shmem_d, shmem_i,
-                      k, eps, p, distance_upper_bound]
-
-        _run_jobs(_parallel_query, query_args, self._nprocs)
-        # return results (private memory)
-        return _d.copy(), _i.copy()
+        Distances are returned with the same floating point type as the tree
+        data. Missing neighbours have an index of ``self.n`` and an infinite
+        distance.
+        """
+        if distance_upper_bound is None:
+            distance_upper_bound = np.inf
+        distances, indices = self._kdtree.query(
+            x, k=k, eps=eps, p=p, distance_upper_bound=distance_upper_bound,
+            workers=self._nprocs)
+        return distances.astype(self.data.dtype, copy=False), indices.astype(np.int64, copy=False)
 
 
 class Proj_MP:
@@ -193,44 +172,6 @@ def _run_jobs(target, args, nprocs):
 # This is executed in an external process:
 
 
-def _parallel_query(scheduler,  # scheduler for load balancing
-                    # data needed to reconstruct the kd-tree
-                    data, ndata, ndim, leafsize,
-                    x, nx, d, i,  # query data and results
-                    k, eps, p, dub,  # auxillary query parameters
-                    ierr, warn_msg):  # return values (0 on success)
-
-    try:
-        # View shared memory as ndarrays.
-        _data = shmem_as_ndarray(data).reshape((ndata, ndim))
-        _x = shmem_as_ndarray(x).reshape((nx, ndim))
-        if k == 1:
-            _d = shmem_as_ndarray(d)
-            _i = shmem_as_ndarray(i)
-        else:
-            _d = shmem_as_ndarray(d).reshape((nx, k))
-            _i = shmem_as_ndarray(i).reshape((nx, k))
-
-        # Reconstruct the kd-tree from the data.
-        import scipy.spatial as sp
-        kdtree = sp.cKDTree(_data, leafsize=leafsize)
-
-        # Query for nearest neighbours, using slice ranges,
-        # from the load balancer.
-        for s in scheduler:
-            if k == 1:
-                _d[s], _i[s] = kdtree.query(_x[s, :], k=1, eps=eps, p=p,
-                                            distance_upper_bound=dub)
-            else:
-                _d[s, :], _i[s, :] = kdtree.query(_x[s, :], k=k, eps=eps, p=p,
-                                                  distance_upper_bound=dub)
-    # An error occured, increment the return value ierr.
-    # Access to ierr is serialized by multiprocessing.
-    except Exception as e:
-        ierr.value += 1
-        warn_msg.value = str(e).encode()
-
-
 def _parallel_proj(scheduler, data1, data2, res1, res2, proj_args, proj_kwargs,
                    inverse, radians, errcheck, ierr, warn_msg):
     try:
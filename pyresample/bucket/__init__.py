@@ -18,7 +18,8 @@
 """Code for resampling using bucket resampling."""
 
 import logging
-import math
+import os
+import tempfile
 
 import dask
 import dask.array as da
@@ -26,68 +27,92 @@ import numpy as np
 import xarray as xr
 from pyproj import Proj
 
-LOG = logging.getLogger(__name__)
-
-
-def _sort_weights(statistic_method, weights):
-    """Sort idxs and weights based on weights.
-
-    By default the method for sorting is `'min'`.
-    """
-    order = np.argsort(weights)
-    if statistic_method == 'max':
-        return order[::-1]
-    return order
-
-
-def _get_bin_statistic(bins, idxs_sorted, weights_sorted):
-    """Get the statistic of each bin."""
-    (unique_bin, unique_idx) = _find_unique_bins_and_indices(bins, idxs_sorted)
-
-    return _expand_bin_statistics(bins, unique_bin, unique_idx, weights_sorted)
+from pyresample.bucket._bucket import COUNT, MAX, MIN, NAN_COUNT, NUM_STATISTICS, SUM, bucket_statistics
 
+LOG = logging.getLogger(__name__)
 
-def _find_unique_bins_and_indices(bins, idxs_sorted):
-    """Get unique bins and corresponding indices."""
-    # get where the `idxs_sorted` located in `bins`
-    binned_values = np.digitize(idxs_sorted, bins, right=True)
 
-    # mask value outside of bin
-    binned_values_masked = np.ma.masked_array(binned_values,
-                                              (idxs_sorted < bins.min()) | (idxs_sorted > bins.max()))
+STATISTICS = ("sum", "count", "min", "max", "abs_max", "average", "fractions")
 
-    # get the first index and value in each bin
-    return np.unique(binned_values_masked, return_index=True)
 
+def _chunk_statistics(data, idxs, out_size, categories=None):
+    """Get the bucket statistics of one chunk of data.
 
-def _expand_bin_statistics(bins, unique_bin, unique_idx, weights_sorted):
-    """Expand bin statistics to cover all bins."""
-    # create the full index array
-    weight_idx = np.full(len(bins), -1, dtype=np.int32)
+    If ``categories`` are provided the number of occurrences of each
+    category in each bucket are added as extra rows after the statistics
+    calculated by :func:`pyresample.bucket._bucket.bucket_statistics`.
 
-    # assign the valid index to array
-    weight_idx[unique_bin[~unique_bin.mask].data] = unique_idx[~unique_bin.mask]
+    """
+    if data.dtype not in (np.float32, np.float64):
+        data = data.astype(np.float64)
+    idxs = np.ascontiguousarray(idxs, dtype=np.int64)
+    statistics = bucket_statistics(np.ascontiguousarray(data), idxs, out_size)
+    if categories is None:
+        return statistics
+    category_idxs = np.full(data.shape, -1, dtype=np.int64)
+    for category_idx, category in enumerate(categories):
+        category_idxs[data == category] = category_idx
+    valid = (category_idxs >= 0) & (idxs >= 0) & (idxs < out_size)
+    category_counts = np.bincount(category_idxs[valid] * out_size + idxs[valid],
+                                  minlength=len(categories) * out_size)
+    return np.concatenate([statistics, category_counts.reshape((len(categories), out_size))])
 
-    return weights_sorted[weight_idx]  # last value of weights_sorted always nan
 
+def _combine_statistics(stats1, stats2):
+    """Combine the bucket statistics of two chunks of data."""
+    res = stats1 + stats2
+    res[MIN] = np.fmin(stats1[MIN], stats2[MIN])
+    res[MAX] = np.fmax(stats1[MAX], stats2[MAX])
+    return res
 
-@dask.delayed(pure=True)
-def _get_statistics(statistic_method, data, idxs, out_shape):
-    """Help method to get bin max/min in a dask delayed manner."""
-    (idxs_sorted, data_sorted) = _get_sorted_indices_and_data(statistic_method, data, idxs)
-    out_size = math.prod(out_shape)
 
-    bins = np.linspace(0, out_size - 1, out_size, dtype=np.int64)
+def _get_bucket_statistics(data, idxs, out_size, categories=None):
+    """Get the statistics of each bucket in a dask delayed manner.
 
-    return _get_bin_statistic(bins, idxs_sorted, data_sorted).reshape(out_shape)
+    The statistics of every chunk are calculated in a single pass over the
+    data and then combined pairwise. See
+    :func:`pyresample.bucket._bucket.bucket_statistics` and
+    :func:`_chunk_statistics` for the rows of the returned array.
 
+    """
+    partials = [dask.delayed(_chunk_statistics, pure=True)(data_chunk, idxs_chunk, out_size, categories)
+                for data_chunk, idxs_chunk in zip(data.to_delayed().ravel(), idxs.to_delayed().ravel())]
+    while len(partials) > 1:
+        pairs = [partials[i:i + 2] for i in range(0, len(partials), 2)]
+        partials = [dask.delayed(_combine_statistics, pure=True)(*pair) if len(pair) == 2 else pair[0]
+                    for pair in pairs]
+    num_rows = NUM_STATISTICS + (0 if categories is None else len(categories))
+    return da.from_delayed(partials[0], shape=(num_rows, out_size), dtype=np.float64)
+
+
+def _statistics_to_dataset(statistics, stats, shape, categories, fill_value, skipna):
+    """Convert numpy or dask bucket statistics to a dataset of the requested statistics."""
+    counts = statistics[COUNT]
+    hits = counts + statistics[NAN_COUNT]
+    has_missing = statistics[NAN_COUNT] > 0
+    results = {
+        "sum": statistics[SUM],
+        "count": hits.astype(np.int64),
+        "min": statistics[MIN],
+        "max": statistics[MAX],
+    }
+    if not skipna:
+        for name in ("sum", "min", "max"):
+            results[name] = np.where(has_missing, np.nan, results[name])
+    results["abs_max"] = np.where(-results["min"] > results["max"], results["min"], results["max"])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        average = statistics[SUM] / np.where(counts == 0, np.nan, counts)
+        if not skipna:
+            average = np.where(has_missing, np.nan, average)
+        results["average"] = np.where(np.isnan(average), fill_value, average)
 
-def _get_sorted_indices_and_data(statistic_method, data, idxs):
-    # sort idxs and data
-    order = _sort_weights(statistic_method, data)
-    idxs_sorted = idxs[order]
-    data_sorted = np.append(data[order], np.nan)
-    return (idxs_sorted, data_sorted)
+        data_vars = {name: (("y", "x"), results[name].reshape(shape)) for name in stats if name != "fractions"}
+        if categories is None:
+            return xr.Dataset(data_vars)
+        fractions = statistics[NUM_STATISTICS:] / hits
+        fractions = np.where(hits == 0, fill_value, fractions)
+    data_vars["fractions"] = (("category", "y", "x"), fractions.reshape((len(categories),) + shape))
+    return xr.Dataset(data_vars, coords={"category": list(categories)})
 
 
 class BucketResampler(object):
@@ -129,6 +154,11 @@ class BucketResampler(object):
 
     >>> average = resampler.get_average(data)
 
+    Several statistics can be calculated with a single pass over the data.
+    They are returned as variables of an :class:`xarray.Dataset`:
+
+    >>> stats = resampler.get_statistics(data, stats=["count", "min", "max", "average"])
+
     Calculate fractions of occurrences of different values in each grid
     location.  The data needs to be categorical (in integers), so
     we'll create some categorical data from the brightness temperature
@@ -266,24 +296,25 @@ class BucketResampler(object):
             statistic = da.where(missing_val_bins > 0, fill_value, statistic)
         return statistic
 
-    def _call_bin_statistic(self, statistic_method, data, fill_value=None, skipna=None):
-        """Calculate statistics (min/max) for each bin with drop-in-a-bucket resampling."""
+    def _get_bucket_statistics(self, data, categories=None):
+        """Calculate sum, count, NaN count, min and max of each bin in one pass over the data."""
         if isinstance(data, xr.DataArray):
             data = data.data
-        data = data.ravel()
+        data = da.asarray(data).ravel()
 
         # Rechunk indices to match the data chunking
         if data.chunks != self.idxs.chunks:
             self.idxs = da.rechunk(self.idxs, data.chunks)
 
-        out_shape = self.target_area.shape
-
-        statistics = da.from_delayed(
-            _get_statistics(statistic_method, data, self.idxs, out_shape),
-            shape=out_shape,
-            dtype=np.float64)
+        return _get_bucket_statistics(data, self.idxs, self.target_area.size, categories=categories)
 
-        return statistics
+    def _call_bin_statistic(self, statistic_method, data, fill_value=None, skipna=True):
+        """Calculate statistics (min/max) for each bin with drop-in-a-bucket resampling."""
+        statistics = self._get_bucket_statistics(data)
+        statistic = statistics[MIN if statistic_method == 'min' else MAX]
+        if not skipna:
+            statistic = da.where(statistics[NAN_COUNT] > 0, np.nan, statistic)
+        return statistic.reshape(self.target_area.shape)
 
     def get_min(self, data, fill_value=np.nan, skipna=True):
         """Calculate minimums for each bin with drop-in-a-bucket resampling.
@@ -420,13 +451,71 @@ class BucketResampler(object):
         if not np.isnan(fill_value):
             data = da.where(data == fill_value, np.nan, data)
 
-        sums = self.get_sum(data, skipna=skipna)
-        counts = self.get_sum(np.logical_not(np.isnan(data)).astype(np.int64))
-
-        average = sums / da.where(counts == 0, np.nan, counts)
+        statistics = self._get_bucket_statistics(data)
+        counts = statistics[COUNT]
+        average = statistics[SUM] / da.where(counts == 0, np.nan, counts)
+        if not skipna:
+            average = da.where(statistics[NAN_COUNT] > 0, np.nan, average)
         average = da.where(np.isnan(average), fill_value, average)
 
-        return average
+        return average.reshape(self.target_area.shape)
+
+    def get_statistics(self, data, stats=("sum", "count", "min", "max", "average"),
+                       categories=None, fill_value=np.nan, skipna=True):
+        """Calculate multiple bucket statistics in a single pass over the data.
+
+        All requested statistics are derived from one set of per-chunk
+        reductions so the input data is only read once when the returned
+        dataset is computed. The results are the same as the ones from the
+        corresponding ``get_*`` methods.
+
+        Parameters
+        ----------
+        data : Numpy or Dask array
+            Data to be binned.
+        stats : iterable of str
+            Statistics to calculate. Any of ``'sum'``, ``'count'``,
+            ``'min'``, ``'max'``, ``'abs_max'``, ``'average'`` and
+            ``'fractions'``.
+        categories : iterable or None
+            Categories for the ``'fractions'`` statistic. If None and
+            fractions are requested, the categories are determined by
+            computing the data. See :meth:`get_fractions`.
+        fill_value : float
+            Fill value marking missing values in the input data. It is also
+            used for empty buckets in the ``'average'`` and ``'fractions'``
+            results. Default: np.nan
+        skipna : bool
+            If True, skips missing values. If False, buckets containing
+            missing values are NaN in the ``'sum'``, ``'min'``, ``'max'``,
+            ``'abs_max'`` and ``'average'`` results. Default: True
+
+        Returns
+        -------
+        statistics : xarray.Dataset
+            Dataset with one ``('y', 'x')`` variable for every requested
+            statistic. Fractions are a ``('category', 'y', 'x')`` variable.
+        """
+        unknown_stats = set(stats) - set(STATISTICS)
+        if unknown_stats:
+            raise ValueError(f"Unknown bucket statistics: {sorted(unknown_stats)}")
+        LOG.info("Get %s of values in each location", ", ".join(stats))
+        if isinstance(data, xr.DataArray):
+            data = data.data
+        data = da.asarray(data)
+        if not np.isnan(fill_value):
+            data = da.where(data == fill_value, np.nan, data)
+        if "fractions" in stats:
+            if categories is None:
+                LOG.warning("No categories given, need to compute the data.")
+                categories = np.asarray(np.unique(data))
+            categories = list(categories)
+        else:
+            categories = None
+
+        statistics = self._get_bucket_statistics(data, categories=categories)
+        return _statistics_to_dataset(statistics, stats, self.target_area.shape, categories,
+                                      fill_value, skipna)
 
     def get_fractions(self, data, categories=None, fill_value=np.nan):
         """Get fraction of occurrences for each given categorical value.
@@ -469,6 +558,126 @@ class BucketResampler(object):
         return results
 
 
+class BucketAccumulator(object):
+    """Accumulate bucket statistics of many granules on one target grid.
+
+    Instead of concatenating all source data before resampling, granules are
+    added one at a time with :meth:`add`. Only the running sums, counts,
+    minimums and maximums (and category counts) on the target grid are kept
+    in memory, so memory usage does not grow with the number of granules.
+    The state can be saved with :meth:`save` and restored with :meth:`load`
+    to checkpoint long running jobs.
+
+    >>> from pyresample.bucket import BucketAccumulator
+    >>> accumulator = BucketAccumulator(target_area)
+    >>> for lons, lats, data in granules:
+    ...     accumulator.add(lons, lats, data)
+    >>> accumulator.save("composite_checkpoint.npz")
+    >>> stats = accumulator.get_statistics(stats=["count", "average"])
+
+    Parameters
+    ----------
+    target_area : AreaDefinition
+        Area to accumulate the data on.
+    categories : iterable or None
+        Categories to count for the ``'fractions'`` statistic. Fractions
+        are only available if categories are provided.
+    fill_value : float
+        Fill value marking missing values in the input data. It is also
+        used for empty buckets in the ``'average'`` and ``'fractions'``
+        results. Default: np.nan
+    """
+
+    def __init__(self, target_area, categories=None, fill_value=np.nan):
+        self.target_area = target_area
+        self.categories = None if categories is None else list(categories)
+        self.fill_value = fill_value
+        num_rows = NUM_STATISTICS + (0 if self.categories is None else len(self.categories))
+        self.statistics = np.zeros((num_rows, target_area.size), dtype=np.float64)
+        self.statistics[MIN:MAX + 1] = np.nan
+        self.num_granules = 0
+
+    def add(self, source_lons, source_lats, data):
+        """Add the statistics of one granule to the accumulated statistics.
+
+        Parameters
+        ----------
+        source_lons : Numpy or Dask array
+            Longitudes of the granule.
+        source_lats : Numpy or Dask array
+            Latitudes of the granule.
+        data : Numpy, Dask or xarray array
+            Data of the granule with the same shape as the coordinates.
+        """
+        if isinstance(data, xr.DataArray):
+            data = data.data
+        data = da.asarray(data)
+        source_lons = da.asarray(source_lons).rechunk(data.chunks)
+        source_lats = da.asarray(source_lats).rechunk(data.chunks)
+        if not np.isnan(self.fill_value):
+            data = da.where(data == self.fill_value, np.nan, data)
+        resampler = BucketResampler(self.target_area, source_lons, source_lats)
+        granule_statistics = resampler._get_bucket_statistics(data, categories=self.categories).compute()
+        self.statistics[:MIN] += granule_statistics[:MIN]
+        self.statistics[MAX + 1:] += granule_statistics[MAX + 1:]
+        np.fmin(self.statistics[MIN], granule_statistics[MIN], out=self.statistics[MIN])
+        np.fmax(self.statistics[MAX], granule_statistics[MAX], out=self.statistics[MAX])
+        self.num_granules += 1
+
+    def get_statistics(self, stats=("sum", "count", "min", "max", "average"), skipna=True):
+        """Get the accumulated statistics.
+
+        See :meth:`BucketResampler.get_statistics` for the available
+        statistics and the meaning of ``skipna``.
+
+        Returns
+        -------
+        statistics : xarray.Dataset
+            Dataset of numpy arrays with one variable per requested statistic.
+        """
+        unknown_stats = set(stats) - set(STATISTICS)
+        if unknown_stats:
+            raise ValueError(f"Unknown bucket statistics: {sorted(unknown_stats)}")
+        if "fractions" in stats and self.categories is None:
+            raise ValueError("'fractions' require 'categories' to be provided when creating the accumulator.")
+        return _statistics_to_dataset(self.statistics, stats, self.target_area.shape, self.categories,
+                                      self.fill_value, skipna)
+
+    def save(self, filename):
+        """Save the accumulated state to a ``.npz`` file.
+
+        The file is written to a temporary file first and then moved in to
+        place so an interrupted save never corrupts an existing checkpoint.
+        """
+        dirname = os.path.dirname(os.path.abspath(filename))
+        fd, tmp_filename = tempfile.mkstemp(dir=dirname, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                np.savez(tmp_file,
+                         statistics=self.statistics,
+                         num_granules=self.num_granules,
+                         fill_value=self.fill_value,
+                         categories=np.array([] if self.categories is None else self.categories),
+                         has_categories=self.categories is not None,
+                         target_area_hash=str(hash(self.target_area)))
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            os.remove(tmp_filename)
+            raise
+
+    @classmethod
+    def load(cls, filename, target_area):
+        """Restore an accumulator saved with :meth:`save` for ``target_area``."""
+        with np.load(filename) as saved:
+            if str(saved["target_area_hash"]) != str(hash(target_area)):
+                raise ValueError("Saved bucket statistics were accumulated on a different target area.")
+            categories = saved["categories"].tolist() if bool(saved["has_categories"]) else None
+            accumulator = cls(target_area, categories=categories, fill_value=float(saved["fill_value"]))
+            accumulator.statistics[:] = saved["statistics"]
+            accumulator.num_granules = int(saved["num_granules"])
+        return accumulator
+
+
 def _get_invalid_mask(data, fill_value):
     """Get a boolean array where values equal to fill_value in data are True."""
     if np.isnan(fill_value):
@@ -0,0 +1,86 @@
+# pyresample, Resampling of remote sensing image data in python
+#
+# Copyright (C) 2024  Pyresample developers
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Compiled kernels for bucket resampling."""
+
+import numpy as np
+
+cimport cython
+cimport numpy as np
+from libc.math cimport NAN, isnan
+
+ctypedef fused data_type:
+    np.float64_t
+    np.float32_t
+
+np.import_array()
+
+# rows of the array returned by 'bucket_statistics'
+SUM = 0
+COUNT = 1
+NAN_COUNT = 2
+MIN = 3
+MAX = 4
+NUM_STATISTICS = 5
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def bucket_statistics(const data_type[::1] data, const np.int64_t[::1] idxs, Py_ssize_t out_size):
+    """Calculate the statistics of the data falling in to each bucket in one pass.
+
+    Args:
+        data: 1D data values.
+        idxs: 1D bucket index of every data value. Indexes outside of
+            ``[0, out_size)`` are ignored.
+        out_size: Number of buckets.
+
+    Returns:
+        2D float64 array with shape ``(NUM_STATISTICS, out_size)``. The rows
+        are the sum of the valid (non-NaN) values, the number of valid
+        values, the number of NaN values, the minimum and the maximum of the
+        valid values of each bucket (see the module level row constants).
+        Minimum and maximum are NaN for buckets without valid values.
+
+    """
+    cdef np.ndarray[np.float64_t, ndim=2] res = np.empty((NUM_STATISTICS, out_size), dtype=np.float64)
+    cdef np.float64_t[:, ::1] res_view = res
+    cdef Py_ssize_t num_values = data.shape[0]
+    cdef Py_ssize_t i, idx
+    cdef np.float64_t val
+    if idxs.shape[0] != num_values:
+        raise ValueError("'data' and 'idxs' must have the same size")
+    with nogil:
+        res_view[0, :] = 0
+        res_view[1, :] = 0
+        res_view[2, :] = 0
+        res_view[3, :] = NAN
+        res_view[4, :] = NAN
+        for i in range(num_values):
+            idx = idxs[i]
+            if idx < 0 or idx >= out_size:
+                continue
+            val = data[i]
+            if isnan(val):
+                res_view[2, idx] += 1
+                continue
+            res_view[0, idx] += val
+            res_view[1, idx] += 1
+            if res_view[1, idx] == 1 or val < res_view[3, idx]:
+                res_view[3, idx] = val
+            if res_view[1, idx] == 1 or val > res_view[4, idx]:
+                res_view[4, idx] = val
+    return res
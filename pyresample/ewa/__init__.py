@@ -66,7 +66,7 @@ For more information on these steps see the documentation for the
 corresponding modules.
 """
 
-from .ewa import fornav, ll2cr  # noqa
+from .ewa import ewa_parameters, fornav, ll2cr  # noqa
 
 try:
     from ._legacy_dask_ewa import LegacyDaskEWAResampler  # noqa
@@ -21,6 +21,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Resampling swath data to uniform grid using an Elliptical Weighted Averaging
 (EWA) algorithm."""
+from libc.math cimport isnan
 from libc.stdlib cimport calloc, free, malloc
 
 import numpy
@@ -121,7 +122,7 @@ cdef int fornav(unsigned int * valid_list, size_t chan_count, size_t swath_cols,
                 image_dtype ** input_arrays, grid_dtype ** output_arrays,
                 image_dtype input_fill, grid_dtype output_fill, size_t rows_per_scan,
                 unsigned int weight_count, weight_type weight_min, weight_type weight_distance_max, weight_type weight_delta_max,
-                weight_type weight_sum_min, bint maximum_weight_mode) nogil except -1:
+                weight_type weight_sum_min, bint maximum_weight_mode, ewa_parameters * precomputed_ewap) nogil except -1:
     cdef unsigned int row_idx
     cdef unsigned int idx
     cdef bint got_point = 0
@@ -132,6 +133,7 @@ cdef int fornav(unsigned int * valid_list, size_t chan_count, size_t swath_cols,
     cdef image_dtype ** input_images
     cdef ewa_weight ewaw
     cdef ewa_parameters * ewap
+    cdef ewa_parameters * scan_ewap
 
     # other defaults
     if weight_sum_min == -1.0:
@@ -170,18 +172,22 @@ cdef int fornav(unsigned int * valid_list, size_t chan_count, size_t swath_cols,
             input_images[idx] = &input_arrays[idx][row_idx * swath_cols]
         # print "Current input 0 pointer: %d" % (<int>input_images[idx],)
 
-        # Calculate EWA parameters for each column index
-        func_result = compute_ewa_parameters(swath_cols, rows_per_scan, tmp_cols_pointer, tmp_rows_pointer, & ewaw, ewap)
-        if func_result < 0:
-            got_point = got_point or 0
-            # raise RuntimeError("Could compute EWA parameters for EWA resampling")
-            continue
+        if precomputed_ewap is not NULL:
+            scan_ewap = &precomputed_ewap[(row_idx // rows_per_scan) * swath_cols]
+        else:
+            # Calculate EWA parameters for each column index
+            scan_ewap = ewap
+            func_result = compute_ewa_parameters(swath_cols, rows_per_scan, tmp_cols_pointer, tmp_rows_pointer, & ewaw, ewap)
+            if func_result < 0:
+                got_point = got_point or 0
+                # raise RuntimeError("Could compute EWA parameters for EWA resampling")
+                continue
 
         # NOTE: In the C version this is where the image array data is loaded
         tmp_got_point = compute_ewa(chan_count, maximum_weight_mode,
                                     swath_cols, rows_per_scan, grid_cols, grid_rows,
                                     tmp_cols_pointer, tmp_rows_pointer,
-                                    input_images, input_fill, grid_accums, grid_weights, & ewaw, ewap)
+                                    input_images, input_fill, grid_accums, grid_weights, & ewaw, scan_ewap)
 
         got_point = got_point or tmp_got_point
 
@@ -203,6 +209,209 @@ cdef int fornav(unsigned int * valid_list, size_t chan_count, size_t swath_cols,
     return 0
 
 
+# number of values in the ewa_parameters structure
+EWA_PARAMETERS_SIZE = 6
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def compute_ewa_parameters_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
+                                   numpy.ndarray[cr_dtype, ndim=2, mode='c'] rows_array,
+                                   size_t rows_per_scan,
+                                   unsigned int weight_count=10000, weight_type weight_min=0.01,
+                                   weight_type weight_distance_max=1.0, weight_type weight_delta_max=10.0,
+                                   **kwargs):
+    """Compute the EWA parameters of every scan of the swath.
+
+    The ellipse parameters of every swath column only depend on the column
+    and row arrays (not on the data or the grid offset) and on the weight
+    parameters. Passing the result as ``ewa_params`` to the fornav wrappers
+    avoids recomputing them for every data array or output grid chunk.
+    Other keyword arguments accepted by the fornav wrappers are ignored.
+
+    :param cols_array: numpy array of grid column coordinates for each input swath pixel
+    :param rows_array: numpy array of grid row coordinates for each input swath pixel
+    :param rows_per_scan: number of input swath rows making up one scan line or all of the rows in the swath
+    :return: float32 array of shape ``(num_scans, swath_cols, EWA_PARAMETERS_SIZE)``
+    """
+    cdef size_t swath_cols = cols_array.shape[1]
+    cdef size_t swath_rows = cols_array.shape[0]
+    if rows_per_scan < 2 or swath_rows % rows_per_scan != 0:
+        raise ValueError("EWA requires 2 or more rows_per_scan and must be a factor of the total number of input rows")
+    cdef size_t num_scans = swath_rows // rows_per_scan
+    ewa_params = numpy.empty((num_scans, swath_cols, EWA_PARAMETERS_SIZE), dtype=numpy.float32)
+    if swath_cols == 0:
+        return ewa_params
+    cdef numpy.float32_t[:, :, ::1] params_view = ewa_params
+    cdef cr_dtype * cols_pointer = &cols_array[0, 0]
+    cdef cr_dtype * rows_pointer = &rows_array[0, 0]
+    cdef size_t scan_idx
+    cdef ewa_weight ewaw
+    cdef int func_result = initialize_weight(1, weight_count, weight_min, weight_distance_max, weight_delta_max,
+                                             weight_min, & ewaw)
+    if func_result < 0:
+        deinitialize_weight(& ewaw)
+        raise RuntimeError("Could not initialize weight structure for EWA resampling")
+    with nogil:
+        for scan_idx in range(num_scans):
+            compute_ewa_parameters(swath_cols, rows_per_scan,
+                                   &cols_pointer[scan_idx * rows_per_scan * swath_cols],
+                                   &rows_pointer[scan_idx * rows_per_scan * swath_cols],
+                                   & ewaw, <ewa_parameters *> &params_view[scan_idx, 0, 0])
+    deinitialize_weight(& ewaw)
+    return ewa_params
+
+
+cdef ewa_parameters * _ewa_params_pointer(numpy.ndarray[numpy.float32_t, ndim=3, mode='c'] ewa_params,
+                                          size_t swath_cols, size_t swath_rows, size_t rows_per_scan) except? NULL:
+    """Check precomputed EWA parameters and get a pointer to them (``NULL`` if not provided)."""
+    if ewa_params is None:
+        return NULL
+    if (ewa_params.shape[0] != swath_rows // rows_per_scan or ewa_params.shape[1] != swath_cols or
+            ewa_params.shape[2] != EWA_PARAMETERS_SIZE):
+        raise ValueError("'ewa_params' shape does not match the swath and 'rows_per_scan'")
+    if swath_cols == 0 or ewa_params.shape[0] == 0:
+        return NULL
+    return <ewa_parameters *> &ewa_params[0, 0, 0]
+
+
+@cython.cdivision(True)
+cdef Py_ssize_t _ewa_weights(size_t swath_cols, size_t swath_rows, size_t rows_per_scan,
+                             Py_ssize_t grid_cols, Py_ssize_t grid_rows,
+                             cr_dtype * uimg, cr_dtype * vimg, ewa_weight * ewaw, ewa_parameters * ewap,
+                             numpy.int64_t * grid_indexes, numpy.int64_t * swath_indexes,
+                             numpy.float32_t * weights) noexcept nogil:
+    """Find the weight of every swath pixel for every grid cell inside its ellipse.
+
+    This follows the loops of ``compute_ewa_single`` without any image data.
+    If the output pointers are ``NULL`` the weights are only counted.
+
+    :return: number of weights
+    """
+    cdef Py_ssize_t num_weights = 0
+    cdef size_t swath_offset
+    cdef ewa_parameters * this_ewap
+    cdef int iu1, iu2, iv1, iv2, iu, iv, iw
+    cdef cr_dtype u0, v0
+    cdef weight_type ddq, dq, q, u, v, a2up1, au2, bu
+    for swath_offset in range(swath_rows * swath_cols):
+        this_ewap = &ewap[(swath_offset // (rows_per_scan * swath_cols)) * swath_cols + swath_offset % swath_cols]
+        u0 = uimg[swath_offset]
+        v0 = vimg[swath_offset]
+        if u0 < -this_ewap.u_del or v0 < -this_ewap.v_del or isnan(u0) or isnan(v0):
+            continue
+
+        iu1 = <int>(u0 - this_ewap.u_del)
+        iu2 = <int>(u0 + this_ewap.u_del)
+        iv1 = <int>(v0 - this_ewap.v_del)
+        iv2 = <int>(v0 + this_ewap.v_del)
+        if iu1 < 0:
+            iu1 = 0
+        if iu2 >= grid_cols:
+            iu2 = grid_cols - 1
+        if iv1 < 0:
+            iv1 = 0
+        if iv2 >= grid_rows:
+            iv2 = grid_rows - 1
+        if iu1 >= grid_cols or iu2 < 0 or iv1 >= grid_rows or iv2 < 0:
+            continue
+
+        ddq = 2.0 * this_ewap.a
+        u = iu1 - u0
+        a2up1 = this_ewap.a * ((2.0 * u) + 1.0)
+        bu = this_ewap.b * u
+        au2 = this_ewap.a * u * u
+        for iv in range(iv1, iv2 + 1):
+            v = iv - v0
+            dq = a2up1 + (this_ewap.b * v)
+            q = (((this_ewap.c * v) + bu) * v) + au2
+            for iu in range(iu1, iu2 + 1):
+                if q >= 0.0 and q < this_ewap.f:
+                    if weights != NULL:
+                        iw = <int>(q * ewaw.qfactor)
+                        if iw >= ewaw.count:
+                            iw = ewaw.count - 1
+                        grid_indexes[num_weights] = iv * grid_cols + iu
+                        swath_indexes[num_weights] = swath_offset
+                        weights[num_weights] = ewaw.wtab[iw]
+                    num_weights += 1
+                q += dq
+                dq += ddq
+    return num_weights
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def ewa_weights_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
+                        numpy.ndarray[cr_dtype, ndim=2, mode='c'] rows_array,
+                        size_t grid_rows, size_t grid_cols, size_t rows_per_scan,
+                        unsigned int weight_count=10000, weight_type weight_min=0.01,
+                        weight_type weight_distance_max=1.0, weight_type weight_delta_max=10.0,
+                        numpy.ndarray[numpy.float32_t, ndim=3, mode='c'] ewa_params=None):
+    """Get the weight of every swath pixel for every grid cell it contributes to.
+
+    These are the weights the fornav functions use to average the swath
+    pixels in to the grid. Weights of the same swath pixel and grid cell pair
+    are not combined.
+
+    :param cols_array: numpy array of grid column coordinates for each input swath pixel
+    :param rows_array: numpy array of grid row coordinates for each input swath pixel
+    :param grid_rows: number of rows of the output grid
+    :param grid_cols: number of columns of the output grid
+    :param rows_per_scan: number of input swath rows making up one scan line or all of the rows in the swath
+    :param ewa_params: EWA parameters of every scan from
+             :func:`compute_ewa_parameters_wrapper`. Computed if not provided.
+    :return: tuple of 1D arrays of the flat grid cell indexes, the flat swath
+             pixel indexes and the float32 weights
+    """
+    cdef size_t swath_cols = cols_array.shape[1]
+    cdef size_t swath_rows = cols_array.shape[0]
+    if rows_per_scan < 2 or swath_rows % rows_per_scan != 0:
+        raise ValueError("EWA requires 2 or more rows_per_scan and must be a factor of the total number of input rows")
+    if ewa_params is None:
+        ewa_params = compute_ewa_parameters_wrapper(cols_array, rows_array, rows_per_scan,
+                                                    weight_count=weight_count, weight_min=weight_min,
+                                                    weight_distance_max=weight_distance_max,
+                                                    weight_delta_max=weight_delta_max)
+    cdef ewa_parameters * ewap = _ewa_params_pointer(ewa_params, swath_cols, swath_rows, rows_per_scan)
+    grid_indexes = numpy.empty(0, dtype=numpy.int64)
+    swath_indexes = numpy.empty(0, dtype=numpy.int64)
+    weights = numpy.empty(0, dtype=numpy.float32)
+    if ewap == NULL:
+        return grid_indexes, swath_indexes, weights
+
+    cdef cr_dtype * cols_pointer = &cols_array[0, 0]
+    cdef cr_dtype * rows_pointer = &rows_array[0, 0]
+    cdef numpy.int64_t[::1] grid_view
+    cdef numpy.int64_t[::1] swath_view
+    cdef numpy.float32_t[::1] weights_view
+    cdef Py_ssize_t num_weights
+    cdef ewa_weight ewaw
+    if initialize_weight(1, weight_count, weight_min, weight_distance_max, weight_delta_max,
+                         weight_min, & ewaw) < 0:
+        deinitialize_weight(& ewaw)
+        raise RuntimeError("Could not initialize weight structure for EWA resampling")
+    try:
+        with nogil:
+            num_weights = _ewa_weights(swath_cols, swath_rows, rows_per_scan, grid_cols, grid_rows,
+                                       cols_pointer, rows_pointer, & ewaw, ewap, NULL, NULL, NULL)
+        if num_weights == 0:
+            return grid_indexes, swath_indexes, weights
+        grid_indexes = numpy.empty(num_weights, dtype=numpy.int64)
+        swath_indexes = numpy.empty(num_weights, dtype=numpy.int64)
+        weights = numpy.empty(num_weights, dtype=numpy.float32)
+        grid_view = grid_indexes
+        swath_view = swath_indexes
+        weights_view = weights
+        with nogil:
+            _ewa_weights(swath_cols, swath_rows, rows_per_scan, grid_cols, grid_rows,
+                         cols_pointer, rows_pointer, & ewaw, ewap,
+                         &grid_view[0], &swath_view[0], &weights_view[0])
+    finally:
+        deinitialize_weight(& ewaw)
+    return grid_indexes, swath_indexes, weights
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def fornav_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
@@ -210,7 +419,8 @@ def fornav_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
                    tuple input_arrays, tuple output_arrays, input_fill, output_fill,
                    size_t rows_per_scan,
                    unsigned int weight_count=10000, weight_type weight_min=0.01, weight_type weight_distance_max=1.0, weight_type weight_delta_max=10.0, weight_type weight_sum_min=-1.0,
-                   cpython.bool maximum_weight_mode=False):
+                   cpython.bool maximum_weight_mode=False,
+                   numpy.ndarray[numpy.float32_t, ndim=3, mode='c'] ewa_params=None):
     """Python wrapper around the C interface to fornav.
 
     The main difficulty is that the C code can operate on multiple input
@@ -251,6 +461,10 @@ def fornav_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
              If -m is present, the swath cell having the maximum weight of all
              swath cells that map to a particular grid cell is used. The -m
              option should be used for coded data, i.e. snow cover.
+    :param ewa_params: EWA parameters of every scan from
+             :func:`compute_ewa_parameters_wrapper` computed with the same
+             cols, rows and weight parameters. Computed on the fly if not
+             provided.
     :return: tuple of valid grid points written for each output array
     """
     cdef size_t num_items = len(input_arrays)
@@ -275,6 +489,7 @@ def fornav_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
         raise ValueError("Input arrays must all be of the same data type")
     if not all(output_array.dtype == out_type for output_array in output_arrays):
         raise ValueError("Input arrays must all be of the same data type")
+    cdef ewa_parameters * ewap_pointer = _ewa_params_pointer(ewa_params, swath_cols, swath_rows, rows_per_scan)
 
     cdef void** input_pointer = <void ** >malloc(num_items * sizeof(void * ))
     if not input_pointer:
@@ -313,7 +528,7 @@ def fornav_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
                                  < numpy.float32_t ** >input_pointer, < numpy.float32_t ** >output_pointer,
                                  output_fill_f32, output_fill_f32, rows_per_scan,
                                  weight_count, weight_min, weight_distance_max, weight_delta_max, weight_sum_min,
-                                 mwm)
+                                 mwm, ewap_pointer)
     elif in_type == numpy.float64:
         input_fill_f64 = <numpy.float64_t>input_fill
         output_fill_f64 = <numpy.float64_t>output_fill
@@ -328,7 +543,7 @@ def fornav_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
                                  < numpy.float64_t ** >input_pointer, < numpy.float64_t ** >output_pointer,
                                  input_fill_f64, output_fill_f64, rows_per_scan,
                                  weight_count, weight_min, weight_distance_max, weight_delta_max, weight_sum_min,
-                                 mwm)
+                                 mwm, ewap_pointer)
     elif in_type == numpy.int8:
         input_fill_i8 = <numpy.int8_t>input_fill
         output_fill_i8 = <numpy.int8_t>output_fill
@@ -343,7 +558,7 @@ def fornav_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
                                  < numpy.int8_t ** >input_pointer, < numpy.int8_t ** >output_pointer,
                                  input_fill_i8, output_fill_i8, rows_per_scan,
                                  weight_count, weight_min, weight_distance_max, weight_delta_max, weight_sum_min,
-                                 mwm)
+                                 mwm, ewap_pointer)
     else:
         raise ValueError("Unknown input and output data type")
 
@@ -364,7 +579,7 @@ cdef int fornav_weights_and_sums(
         image_dtype * input_array, weight_type * grid_weights, accum_type * grid_accums,
         image_dtype input_fill, grid_dtype output_fill, size_t rows_per_scan,
         unsigned int weight_count, weight_type weight_min, weight_type weight_distance_max, weight_type weight_delta_max,
-        weight_type weight_sum_min, bint maximum_weight_mode) nogil except -1:
+        weight_type weight_sum_min, bint maximum_weight_mode, ewa_parameters * precomputed_ewap) nogil except -1:
     """Get the weights and sums arrays from the fornav algorithm.
 
     Typically fornav performs the entire operation of computing the weights
@@ -385,6 +600,7 @@ cdef int fornav_weights_and_sums(
     cdef image_dtype * tmp_img_pointer
     cdef ewa_weight ewaw
     cdef ewa_parameters * ewap
+    cdef ewa_parameters * scan_ewap
 
     # other defaults
     if weight_sum_min == -1.0:
@@ -407,19 +623,23 @@ cdef int fornav_weights_and_sums(
         tmp_img_pointer = &input_array[row_idx * swath_cols]
         # print "Current cols pointer: %d" % (<int>tmp_cols_pointer,)
 
-        # Calculate EWA parameters for each column index
-        func_result = compute_ewa_parameters(swath_cols, rows_per_scan, tmp_cols_pointer, tmp_rows_pointer, & ewaw, ewap)
-        if func_result < 0:
-            got_point = got_point or 0
-            # raise RuntimeError("Could compute EWA parameters for EWA resampling")
-            continue
+        if precomputed_ewap is not NULL:
+            scan_ewap = &precomputed_ewap[(row_idx // rows_per_scan) * swath_cols]
+        else:
+            # Calculate EWA parameters for each column index
+            scan_ewap = ewap
+            func_result = compute_ewa_parameters(swath_cols, rows_per_scan, tmp_cols_pointer, tmp_rows_pointer, & ewaw, ewap)
+            if func_result < 0:
+                got_point = got_point or 0
+                # raise RuntimeError("Could compute EWA parameters for EWA resampling")
+                continue
 
         # NOTE: In the C version this is where the image array data is loaded
         tmp_got_point = compute_ewa_single(
             maximum_weight_mode,
             swath_cols, rows_per_scan, grid_cols, grid_rows,
             tmp_cols_pointer, tmp_rows_pointer,
-            tmp_img_pointer, input_fill, grid_accums, grid_weights, & ewaw, ewap)
+            tmp_img_pointer, input_fill, grid_accums, grid_weights, & ewaw, scan_ewap)
 
         got_point = got_point or tmp_got_point
 
@@ -441,7 +661,8 @@ def fornav_weights_and_sums_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] co
                                     image_dtype input_fill, grid_dtype output_fill,
                                     size_t rows_per_scan,
                                     unsigned int weight_count=10000, weight_type weight_min=0.01, weight_type weight_distance_max=1.0, weight_type weight_delta_max=10.0, weight_type weight_sum_min=-1.0,
-                                    cpython.bool maximum_weight_mode=False):
+                                    cpython.bool maximum_weight_mode=False,
+                                    numpy.ndarray[numpy.float32_t, ndim=3, mode='c'] ewa_params=None):
     """Python wrapper around the C interface to fornav weights and sums steps.
 
     The main difficulty is that the C code can operate on multiple input
@@ -483,6 +704,10 @@ def fornav_weights_and_sums_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] co
              If -m is present, the swath cell having the maximum weight of all
              swath cells that map to a particular grid cell is used. The -m
              option should be used for coded data, i.e. snow cover.
+    :param ewa_params: EWA parameters of every scan from
+             :func:`compute_ewa_parameters_wrapper` computed with the same
+             cols, rows and weight parameters. Computed on the fly if not
+             provided.
     :return: boolean if any input data was used on a any output grid cell
     """
     cdef size_t swath_cols = cols_array.shape[1]
@@ -492,6 +717,7 @@ def fornav_weights_and_sums_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] co
     cdef unsigned int i
     if rows_per_scan < 2 or swath_rows % rows_per_scan != 0:
         raise ValueError("EWA requires 2 or more rows_per_scan and must be a factor of the total number of input rows")
+    cdef ewa_parameters * ewap_pointer = _ewa_params_pointer(ewa_params, swath_cols, swath_rows, rows_per_scan)
 
     cdef cr_dtype * cols_pointer = &cols_array[0, 0]
     cdef cr_dtype * rows_pointer = &rows_array[0, 0]
@@ -506,7 +732,156 @@ def fornav_weights_and_sums_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] co
                                           input_pointer, weights_pointer, accums_pointer,
                                           input_fill, output_fill, rows_per_scan,
                                           weight_count, weight_min, weight_distance_max, weight_delta_max, weight_sum_min,
-                                          mwm)
+                                          mwm, ewap_pointer)
+
+    succeeded = ret_val == 0
+    return succeeded
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int fornav_weights_and_sums_multi(
+        size_t chan_count, size_t swath_cols, size_t swath_rows, size_t grid_cols, size_t grid_rows,
+        cr_dtype * cols_pointer, cr_dtype * rows_pointer,
+        image_dtype ** input_arrays, weight_type ** grid_weights, accum_type ** grid_accums,
+        image_dtype input_fill, grid_dtype output_fill, size_t rows_per_scan,
+        unsigned int weight_count, weight_type weight_min, weight_type weight_distance_max, weight_type weight_delta_max,
+        weight_type weight_sum_min, bint maximum_weight_mode, ewa_parameters * precomputed_ewap) nogil except -1:
+    """Get the weights and sums arrays of multiple channels from the fornav algorithm.
+
+    Same as :func:`fornav_weights_and_sums`, but the EWA parameters and
+    weights of every swath pixel are computed once and applied to all
+    channels.
+
+    """
+    cdef unsigned int row_idx
+    cdef unsigned int idx
+    cdef bint got_point = 0
+    cdef bint tmp_got_point
+    cdef int func_result
+    cdef cr_dtype * tmp_cols_pointer
+    cdef cr_dtype * tmp_rows_pointer
+    cdef image_dtype ** input_images
+    cdef ewa_weight ewaw
+    cdef ewa_parameters * ewap
+    cdef ewa_parameters * scan_ewap
+
+    # other defaults
+    if weight_sum_min == -1.0:
+        weight_sum_min = weight_min
+
+    func_result = initialize_weight(chan_count, weight_count, weight_min, weight_distance_max, weight_delta_max,
+                                    weight_sum_min, & ewaw)
+    if func_result < 0:
+        raise RuntimeError("Could not initialize weight structure for EWA resampling")
+
+    # Allocate memory for the parameters specific to each column
+    ewap = <ewa_parameters * >malloc(swath_cols * sizeof(ewa_parameters))
+    if ewap is NULL:
+        raise MemoryError()
+    # Allocate pointers to the correct portion of the data arrays that we will use
+    input_images = <image_dtype ** >malloc(chan_count * sizeof(image_dtype *))
+    if input_images is NULL:
+        free(ewap)
+        raise MemoryError()
+
+    # NOTE: Have to use old school pyrex for loop because cython only supports compile-time known steps
+    for row_idx from 0 <= row_idx < swath_rows by rows_per_scan:
+        tmp_cols_pointer = &cols_pointer[row_idx * swath_cols]
+        tmp_rows_pointer = &rows_pointer[row_idx * swath_cols]
+        for idx in range(chan_count):
+            input_images[idx] = &input_arrays[idx][row_idx * swath_cols]
+
+        if precomputed_ewap is not NULL:
+            scan_ewap = &precomputed_ewap[(row_idx // rows_per_scan) * swath_cols]
+        else:
+            # Calculate EWA parameters for each column index
+            scan_ewap = ewap
+            func_result = compute_ewa_parameters(swath_cols, rows_per_scan, tmp_cols_pointer, tmp_rows_pointer, & ewaw, ewap)
+            if func_result < 0:
+                got_point = got_point or 0
+                continue
+
+        tmp_got_point = compute_ewa(chan_count, maximum_weight_mode,
+                                    swath_cols, rows_per_scan, grid_cols, grid_rows,
+                                    tmp_cols_pointer, tmp_rows_pointer,
+                                    input_images, input_fill, grid_accums, grid_weights, & ewaw, scan_ewap)
+
+        got_point = got_point or tmp_got_point
+
+    free(input_images)
+    free(ewap)
+    deinitialize_weight(& ewaw)
+    if not got_point:
+        raise RuntimeError("EWA Resampling: No swath pixels found inside grid to be resampled")
+    # -1 is raised on exception, 0 otherwise
+    return 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fornav_weights_and_sums_multi_wrapper(numpy.ndarray[cr_dtype, ndim=2, mode='c'] cols_array,
+                                          numpy.ndarray[cr_dtype, ndim=2, mode='c'] rows_array,
+                                          numpy.ndarray[image_dtype, ndim=3, mode='c'] input_array,
+                                          numpy.ndarray[weight_type, ndim=3, mode='c'] grid_weights,
+                                          numpy.ndarray[accum_type, ndim=3, mode='c'] grid_accums,
+                                          image_dtype input_fill, grid_dtype output_fill,
+                                          size_t rows_per_scan,
+                                          unsigned int weight_count=10000, weight_type weight_min=0.01, weight_type weight_distance_max=1.0, weight_type weight_delta_max=10.0, weight_type weight_sum_min=-1.0,
+                                          cpython.bool maximum_weight_mode=False,
+                                          numpy.ndarray[numpy.float32_t, ndim=3, mode='c'] ewa_params=None):
+    """Python wrapper around the C interface to fornav weights and sums steps for multiple channels.
+
+    Same as :func:`fornav_weights_and_sums_wrapper`, but ``input_array``,
+    ``grid_weights`` and ``grid_accums`` are 3D arrays with the channels as
+    first dimension. All channels share the same geolocation so the EWA
+    parameters and weights are only computed once for every swath pixel.
+
+    :return: boolean if any input data was used on a any output grid cell
+    """
+    cdef size_t chan_count = input_array.shape[0]
+    cdef size_t swath_cols = cols_array.shape[1]
+    cdef size_t swath_rows = cols_array.shape[0]
+    cdef size_t grid_cols = grid_weights.shape[2]
+    cdef size_t grid_rows = grid_weights.shape[1]
+    cdef unsigned int i
+    if rows_per_scan < 2 or swath_rows % rows_per_scan != 0:
+        raise ValueError("EWA requires 2 or more rows_per_scan and must be a factor of the total number of input rows")
+    if chan_count == 0:
+        raise ValueError("No input channels given")
+    if grid_weights.shape[0] != chan_count or grid_accums.shape[0] != chan_count:
+        raise ValueError("Must have same number of input channels and output grids")
+    cdef ewa_parameters * ewap_pointer = _ewa_params_pointer(ewa_params, swath_cols, swath_rows, rows_per_scan)
+
+    cdef image_dtype ** input_pointers = <image_dtype ** >malloc(chan_count * sizeof(image_dtype *))
+    cdef weight_type ** weights_pointers = <weight_type ** >malloc(chan_count * sizeof(weight_type *))
+    cdef accum_type ** accums_pointers = <accum_type ** >malloc(chan_count * sizeof(accum_type *))
+    if input_pointers is NULL or weights_pointers is NULL or accums_pointers is NULL:
+        free(input_pointers)
+        free(weights_pointers)
+        free(accums_pointers)
+        raise MemoryError()
+    for i in range(chan_count):
+        input_pointers[i] = &input_array[i, 0, 0]
+        weights_pointers[i] = &grid_weights[i, 0, 0]
+        accums_pointers[i] = &grid_accums[i, 0, 0]
+    cdef cr_dtype * cols_pointer = &cols_array[0, 0]
+    cdef cr_dtype * rows_pointer = &rows_array[0, 0]
+    cdef bint mwm = maximum_weight_mode
+    cdef int ret_val = -1
+
+    try:
+        with nogil:
+            ret_val = fornav_weights_and_sums_multi(chan_count, swath_cols, swath_rows, grid_cols, grid_rows,
+                                                    cols_pointer, rows_pointer,
+                                                    input_pointers, weights_pointers, accums_pointers,
+                                                    input_fill, output_fill, rows_per_scan,
+                                                    weight_count, weight_min, weight_distance_max, weight_delta_max,
+                                                    weight_sum_min, mwm, ewap_pointer)
+    finally:
+        free(input_pointers)
+        free(weights_pointers)
+        free(accums_pointers)
 
     succeeded = ret_val == 0
     return succeeded
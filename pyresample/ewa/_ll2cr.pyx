@@ -36,6 +36,14 @@ ctypedef fused cr_dtype:
     # numpy.float32_t
     numpy.float64_t
 
+# 32-bit navigation arrays are projected in 64-bit row blocks of this many
+# pixels at most (see ll2cr_static)
+SCRATCH_SIZE = 1048576
+
+ctypedef fused nav_dtype:
+    numpy.float32_t
+    numpy.float64_t
+
 cdef extern from "numpy/npy_math.h":
     bint npy_isnan(double x)
 
@@ -202,8 +210,44 @@ def ll2cr_dynamic(numpy.ndarray[cr_dtype, ndim=2] lon_arr, numpy.ndarray[cr_dtyp
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def ll2cr_static(numpy.ndarray[cr_dtype, ndim=2] lon_arr, numpy.ndarray[cr_dtype, ndim=2] lat_arr,
-                 cr_dtype fill_in, str proj4_definition,
+cdef unsigned int _projected_to_grid(numpy.float64_t[:, ::1] x_arr, numpy.float64_t[:, ::1] y_arr,
+                                     nav_dtype[:, ::1] cols_out, nav_dtype[:, ::1] rows_out,
+                                     unsigned int row_offset, nav_dtype fill_in,
+                                     double cell_width, double cell_height,
+                                     unsigned int width, unsigned int height,
+                                     double origin_x, double origin_y) noexcept nogil:
+    """Convert projected (X, Y) points to (column, row) points written starting at ``row_offset``."""
+    cdef unsigned int row
+    cdef unsigned int col
+    cdef unsigned int num_rows = x_arr.shape[0]
+    cdef unsigned int num_cols = x_arr.shape[1]
+    cdef double x_tmp
+    cdef double y_tmp
+    cdef unsigned int points_in_grid = 0
+
+    for row in range(num_rows):
+        for col in range(num_cols):
+            x_tmp = x_arr[row, col]
+            y_tmp = y_arr[row, col]
+            if x_tmp >= 1e30:
+                cols_out[row_offset + row, col] = fill_in
+                rows_out[row_offset + row, col] = fill_in
+                continue
+
+            x_tmp = (x_tmp - origin_x) / cell_width
+            y_tmp = (y_tmp - origin_y) / cell_height
+            if x_tmp >= -1 and x_tmp <= width + 1 and y_tmp >= -1 and y_tmp <= height + 1:
+                points_in_grid += 1
+            cols_out[row_offset + row, col] = <nav_dtype>x_tmp
+            rows_out[row_offset + row, col] = <nav_dtype>y_tmp
+    return points_in_grid
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def ll2cr_static(numpy.ndarray[nav_dtype, ndim=2] lon_arr, numpy.ndarray[nav_dtype, ndim=2] lat_arr,
+                 nav_dtype fill_in, str proj4_definition,
                  double cell_width, double cell_height,
                  unsigned int width, unsigned int height,
                  double origin_x, double origin_y):
@@ -225,45 +269,44 @@ def ll2cr_static(numpy.ndarray[cr_dtype, ndim=2] lon_arr, numpy.ndarray[cr_dtype
         1. Convert (lon, lat) points to (X, Y) points in the projection space
         2. Convert (X, Y) points to (column, row) points in the grid space
 
-    Note longitude and latitude arrays are limited to 64-bit floats because
-    of limitations in pyproj.
+    Note pyproj is limited to 64-bit floats. 64-bit longitude and latitude
+    arrays are projected all at once. 32-bit arrays are projected in blocks
+    of rows copied to 64-bit scratch arrays of bounded size so the
+    navigation never has to be converted to 64-bit floats as a whole.
     """
     # TODO: Rewrite so it is no GIL
     # pure python stuff for now
     p = Proj(proj4_definition)
 
-    # Pyproj currently makes a copy so we don't have to do anything special here
-    cdef tuple projected_tuple = p(lon_arr, lat_arr)
-    cdef cr_dtype[:, ::1] rows_out = projected_tuple[1]
-    cdef cr_dtype[:, ::1] cols_out = projected_tuple[0]
-    cdef cr_dtype[:, ::1] lons_view = lon_arr
-    cdef cr_dtype[:, ::1] lats_view = lat_arr
-
-    # indexes
-    cdef unsigned int row
-    cdef unsigned int col
-    # index bounds
+    cdef nav_dtype[:, ::1] lons_view = lon_arr
+    cdef nav_dtype[:, ::1] lats_view = lat_arr
+    cdef numpy.float64_t[:, ::1] x_view
+    cdef numpy.float64_t[:, ::1] y_view
     cdef unsigned int num_rows = lons_view.shape[0]
     cdef unsigned int num_cols = lons_view.shape[1]
-    cdef cr_dtype x_tmp
-    cdef cr_dtype y_tmp
+    cdef unsigned int block_rows
+    cdef unsigned int row_start
     cdef unsigned int points_in_grid = 0
-
-    with nogil:
-        for row in range(num_rows):
-            for col in range(num_cols):
-                x_tmp = cols_out[row, col]
-                y_tmp = rows_out[row, col]
-                if x_tmp >= 1e30:
-                    lons_view[row, col] = fill_in
-                    lats_view[row, col] = fill_in
-                    continue
-
-                x_tmp = (x_tmp - origin_x) / cell_width
-                y_tmp = (y_tmp - origin_y) / cell_height
-                if x_tmp >= -1 and x_tmp <= width + 1 and y_tmp >= -1 and y_tmp <= height + 1:
-                    points_in_grid += 1
-                lons_view[row, col] = x_tmp
-                lats_view[row, col] = y_tmp
-
+    cdef tuple projected_tuple
+
+    if nav_dtype is numpy.float64_t:
+        # Pyproj currently makes a copy so we don't have to do anything special here
+        projected_tuple = p(lon_arr, lat_arr)
+        x_view = projected_tuple[0]
+        y_view = projected_tuple[1]
+        with nogil:
+            points_in_grid = _projected_to_grid(x_view, y_view, lons_view, lats_view, 0, fill_in,
+                                                cell_width, cell_height, width, height,
+                                                origin_x, origin_y)
+    else:
+        block_rows = max(SCRATCH_SIZE // max(num_cols, 1), 1)
+        for row_start in range(0, num_rows, block_rows):
+            projected_tuple = p(lon_arr[row_start:row_start + block_rows].astype(numpy.float64),
+                                lat_arr[row_start:row_start + block_rows].astype(numpy.float64))
+            x_view = projected_tuple[0]
+            y_view = projected_tuple[1]
+            with nogil:
+                points_in_grid += _projected_to_grid(x_view, y_view, lons_view, lats_view, row_start, fill_in,
+                                                     cell_width, cell_height, width, height,
+                                                     origin_x, origin_y)
     return points_in_grid
@@ -28,18 +28,29 @@ them, this implementation should avoid unnecessary array creation and memory
 usage until necessary.
 
 """
+import hashlib
 import logging
 import math
+import os
+import shutil
+import tempfile
 from functools import partial
+from pathlib import Path
 
 import dask
 import dask.array as da
 import numpy as np
 from dask.array.core import normalize_chunks
+from dask.base import tokenize
 from dask.highlevelgraph import HighLevelGraph
 
 from pyresample.ewa import ll2cr
-from pyresample.ewa._fornav import fornav_weights_and_sums_wrapper, write_grid_image_single
+from pyresample.ewa._fornav import (
+    compute_ewa_parameters_wrapper,
+    fornav_weights_and_sums_multi_wrapper,
+    fornav_weights_and_sums_wrapper,
+    write_grid_image_single,
+)
 from pyresample.geometry import SwathDefinition
 from pyresample.resampler import BaseResampler
 
@@ -53,31 +64,148 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# fornav keyword arguments the EWA parameters of the swath pixels depend on
+_EWA_PARAMETERS_KWARGS = ('rows_per_scan', 'weight_count', 'weight_min', 'weight_distance_max', 'weight_delta_max')
 
-def _call_ll2cr(lons, lats, target_geo_def):
+
+def _call_ll2cr(lons, lats, target_geo_def, cr_dtype=np.float64):
     """Wrap ll2cr() for handling dask delayed calls better."""
     new_src = SwathDefinition(lons, lats)
-    swath_points_in_grid, cols, rows = ll2cr(new_src, target_geo_def)
+    swath_points_in_grid, cols, rows = ll2cr(new_src, target_geo_def, dtype=cr_dtype)
     if swath_points_in_grid == 0:
         return (lons.shape, np.nan, lons.dtype), (lats.shape, np.nan, lats.dtype)
     return np.stack([cols, rows], axis=0)
 
 
-def _call_mapped_ll2cr(lons, lats, target_geo_def):
+def _call_mapped_ll2cr(lons, lats, target_geo_def, cr_dtype=np.float64):
     res = da.map_blocks(_call_ll2cr, lons, lats,
-                        target_geo_def,
-                        meta=np.array((), dtype=lons.dtype),
-                        dtype=lons.dtype)
+                        target_geo_def, cr_dtype=cr_dtype,
+                        meta=np.array((), dtype=cr_dtype),
+                        dtype=cr_dtype)
     return res
 
 
-def _delayed_fornav(ll2cr_result, target_geo_def, y_slice, x_slice, data, fill_value, kwargs):
+def _load_ll2cr_block(block_path):
+    """Load the cols/rows of one ll2cr block stored by :func:`_store_ll2cr_blocks`."""
+    return np.load(block_path)
+
+
+def _ll2cr_cache_key(source_geo_def, target_geo_def, chunks, cr_dtype=np.float64):
+    """Get a key identifying the ll2cr results of one swath/area/chunking/column-row type combination."""
+    key_hash = hashlib.sha1()  # nosec: B324
+    key_hash.update(str(hash(source_geo_def)).encode("utf-8"))
+    key_hash.update(str(hash(target_geo_def)).encode("utf-8"))
+    key_hash.update(str(chunks).encode("utf-8"))
+    if np.dtype(cr_dtype) != np.float64:
+        # keep the keys of existing 64-bit entries
+        key_hash.update(np.dtype(cr_dtype).str.encode("utf-8"))
+    return key_hash.hexdigest()
+
+
+def _ll2cr_block_bounds(ll2cr_block):
+    """Get the ``(col_min, col_max, row_min, row_max)`` of an ll2cr block.
+
+    Returns ``None`` for "empty" blocks that don't overlap the target area.
+
+    """
+    if isinstance(ll2cr_block[0], tuple):
+        return None
+    cols, rows = ll2cr_block
+    return (float(np.nanmin(cols)), float(np.nanmax(cols)),
+            float(np.nanmin(rows)), float(np.nanmax(rows)))
+
+
+def _store_ll2cr_blocks(entry_path, ll2cr_result):
+    """Compute every ll2cr block and store the overlapping ones in ``entry_path``.
+
+    Every block overlapping the target area is stored as a ``.npy`` file. The
+    ``bounds.npy`` file holds the column/row bounding box of every block
+    (see :func:`_ll2cr_block_bounds`) with NaNs for the blocks not
+    overlapping the target area so that those don't have to be recomputed
+    either. The entry is
+    written to a temporary directory first and then renamed in to place so
+    concurrent processes never see partially written entries.
+
+    """
+    ll2cr_delayeds = ll2cr_result.to_delayed()
+    blocks = dask.compute(*ll2cr_delayeds.tolist())
+    tmp_path = Path(tempfile.mkdtemp(prefix=f".{entry_path.name}-", dir=entry_path.parent))
+    try:
+        all_bounds = np.full(ll2cr_delayeds.shape + (4,), np.nan)
+        for in_row_idx, row_blocks in enumerate(blocks):
+            for in_col_idx, block in enumerate(row_blocks):
+                bounds = _ll2cr_block_bounds(block)
+                if bounds is None:
+                    continue
+                all_bounds[in_row_idx, in_col_idx] = bounds
+                np.save(tmp_path / f"block_{in_row_idx}_{in_col_idx}.npy", block)
+        np.save(tmp_path / "bounds.npy", all_bounds)
+        try:
+            os.rename(tmp_path, entry_path)
+        except OSError:
+            # another process stored the same entry in the meantime
+            shutil.rmtree(tmp_path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+
+def _load_ll2cr_blocks(entry_path, lons, cr_dtype=np.float64):
+    """Create the ll2cr result, block cache and block bounds from the blocks stored in ``entry_path``."""
+    all_bounds = np.load(entry_path / "bounds.npy")
+    name = f"ll2cr-cached-{entry_path.name}"
+    dsk = {}
+    block_cache = {}
+    block_bounds = {}
+    for in_row_idx, in_col_idx in zip(*np.nonzero(~np.isnan(all_bounds[..., 0]))):
+        key = (name, int(in_row_idx), int(in_col_idx))
+        dsk[key] = (_load_ll2cr_block, str(entry_path / f"block_{in_row_idx}_{in_col_idx}.npy"))
+        block_cache[key] = key
+        block_bounds[key] = tuple(all_bounds[in_row_idx, in_col_idx].tolist())
+    graph = HighLevelGraph.from_collections(name, dsk, dependencies=[])
+    ll2cr_result = da.Array(graph, name, lons.chunks, dtype=cr_dtype,
+                            meta=np.array((), dtype=cr_dtype))
+    return ll2cr_result, block_cache, block_bounds
+
+
+def _fornav_margin(fornav_kwargs):
+    """Get the maximum distance in grid cells a swath pixel can contribute to.
+
+    The extent of a pixel's ellipse is limited to ``weight_delta_max`` or set
+    to ``weight_distance_max`` for invalid geolocation. One extra cell
+    accounts for rounding of the ellipse bounds to grid cells.
+
+    """
+    return max(fornav_kwargs.get('weight_delta_max', 10.0),
+               fornav_kwargs.get('weight_distance_max', 1.0)) + 1
+
+
+def _block_overlaps_chunk(bounds, y_slice, x_slice, margin):
+    """Check if an ll2cr block with ``bounds`` can contribute to the output chunk."""
+    col_min, col_max, row_min, row_max = bounds
+    return (col_min - margin < x_slice.stop and col_max + margin >= x_slice.start and
+            row_min - margin < y_slice.stop and row_max + margin >= y_slice.start)
+
+
+def _delayed_ewa_params(ll2cr_result, kwargs):
+    # Empty ll2cr results: ((shape, fill, dtype), (shape, fill, dtype))
+    if isinstance(ll2cr_result[0], tuple):
+        return None
+    # the ellipse parameters don't depend on the grid offset of the output chunk
+    return compute_ewa_parameters_wrapper(ll2cr_result[0], ll2cr_result[1], **kwargs)
+
+
+def _delayed_fornav(ll2cr_result, target_geo_def, y_slice, x_slice, data, fill_value, kwargs,
+                    ewa_params=None):
     # Adjust cols and rows for this sub-area
     subdef = target_geo_def[y_slice, x_slice]
+    # N-D data holds multiple bands (or other non-spatial dimensions) that
+    # are processed in one pass
+    grid_shape = data.shape[:-2] + subdef.shape
     weights_dtype = np.float32
     accums_dtype = np.float32
-    empty_weights = (subdef.shape, 0, weights_dtype)
-    empty_accums = (subdef.shape, 0, accums_dtype)
+    empty_weights = (grid_shape, 0, weights_dtype)
+    empty_accums = (grid_shape, 0, accums_dtype)
 
     # Empty ll2cr results: ((shape, fill, dtype), (shape, fill, dtype))
     if isinstance(ll2cr_result[0], tuple):
@@ -89,12 +217,22 @@ def _delayed_fornav(ll2cr_result, target_geo_def, y_slice, x_slice, data, fill_v
         cols = cols - x_slice.start
     if y_slice.start != 0:
         rows = rows - y_slice.start
-    weights = np.zeros(subdef.shape, dtype=weights_dtype)
-    accums = np.zeros(subdef.shape, dtype=accums_dtype)
+    weights = np.zeros(grid_shape, dtype=weights_dtype)
+    accums = np.zeros(grid_shape, dtype=accums_dtype)
+    if data.ndim >= 3:
+        fornav_func = fornav_weights_and_sums_multi_wrapper
+        # stack all non-spatial dimensions, reshaping the outputs gives views
+        data = np.ascontiguousarray(data).reshape((-1,) + data.shape[-2:])
+        fornav_weights = weights.reshape((-1,) + subdef.shape)
+        fornav_accums = accums.reshape((-1,) + subdef.shape)
+    else:
+        fornav_func = fornav_weights_and_sums_wrapper
+        fornav_weights = weights
+        fornav_accums = accums
     try:
-        got_points = fornav_weights_and_sums_wrapper(
-            cols, rows, data, weights, accums, fill_value, fill_value,
-            **kwargs)
+        got_points = fornav_func(
+            cols, rows, data, fornav_weights, fornav_accums, fill_value, fill_value,
+            ewa_params=ewa_params, **kwargs)
     except RuntimeError:
         return empty_weights, empty_accums
     if not got_points:
@@ -102,11 +240,6 @@ def _delayed_fornav(ll2cr_result, target_geo_def, y_slice, x_slice, data, fill_v
     return weights, accums
 
 
-def _chunk_callable(x_chunk, axis, keepdims, **kwargs):
-    """No-op for reduction call."""
-    return x_chunk
-
-
 def _combine_fornav(x_chunk, axis, keepdims, computing_meta=False,
                     maximum_weight_mode=False):
     if computing_meta or _is_empty_chunk(x_chunk):
@@ -161,17 +294,26 @@ def _average_fornav(x_chunk, axis, keepdims, computing_meta=False, dtype=None,
         return np.full(res[0][0], fill_value, dtype)
     weights, accums = res
     out = np.full(weights.shape, fill_value, dtype=dtype)
-    write_grid_image_single(out, weights, accums, fill_value,
-                            weight_sum_min=weight_sum_min,
-                            maximum_weight_mode=maximum_weight_mode)
+    # write every band of multi-band (N-D) results
+    for band_out, band_weights, band_accums in zip(out.reshape((-1,) + out.shape[-2:]),
+                                                   weights.reshape((-1,) + weights.shape[-2:]),
+                                                   accums.reshape((-1,) + accums.shape[-2:])):
+        write_grid_image_single(band_out, band_weights, band_accums, fill_value,
+                                weight_sum_min=weight_sum_min,
+                                maximum_weight_mode=maximum_weight_mode)
     return out
 
 
 class DaskEWAResampler(BaseResampler):
     """Resample using an elliptical weighted averaging algorithm.
 
-    This algorithm does **not** use caching or any externally provided data
-    mask (unlike the 'nearest' resampler).
+    This algorithm does not use any externally provided data mask (unlike the
+    'nearest' resampler). If a ``cache_dir`` is passed to
+    :meth:`precompute` (or :meth:`resample`) then the column and row arrays
+    computed by ``ll2cr`` are stored in that directory and reused by any
+    later resampling of the same swath to the same area, even from other
+    processes. Input chunks that don't overlap the target area are recorded
+    as well and skipped entirely when loading from the cache.
 
     This algorithm works under the assumption that the data is observed
     one scan line at a time. However, good results can still be achieved
@@ -233,6 +375,7 @@ class DaskEWAResampler(BaseResampler):
             ll2cr_delayeds = dask.persist(*ll2cr_delayeds.tolist())
 
         block_cache = {}
+        block_bounds = {}
         for in_row_idx in range(num_row_blocks):
             for in_col_idx in range(num_col_blocks):
                 key = (ll2cr_result.name, in_row_idx, in_col_idx)
@@ -241,15 +384,24 @@ class DaskEWAResampler(BaseResampler):
                     result = dask.compute(this_delayed)[0]
                     # XXX: Is this optimization lost because the persisted keys
                     #  in `ll2cr_delayeds` are used in future computations?
-                    if not isinstance(result[0], tuple):
+                    bounds = _ll2cr_block_bounds(result)
+                    if bounds is not None:
                         block_cache[key] = this_delayed.key
+                        block_bounds[key] = bounds
                 else:
                     block_cache[key] = key
-        return block_cache
+        return block_cache, block_bounds
 
     def precompute(self, cache_dir=None, rows_per_scan=None, persist=False,
-                   **kwargs):
-        """Generate row and column arrays and store it for later use."""
+                   ll2cr_dtype=np.float64, **kwargs):
+        """Generate row and column arrays and store it for later use.
+
+        If ``cache_dir`` is provided the arrays are loaded from (or stored
+        to) a sub-directory of ``cache_dir`` named after the hashes of the
+        source swath, the target area, the chunking of the swath and
+        ``ll2cr_dtype``.
+
+        """
         if self.cache:
             # this resampler should be used for one SwathDefinition
             # no need to recompute ll2cr output again
@@ -261,45 +413,56 @@ class DaskEWAResampler(BaseResampler):
 
         source_geo_def = self.source_geo_def
         target_geo_def = self.target_geo_def
-        if cache_dir:
-            logger.warning("'cache_dir' is not used by EWA resampling")
 
         rows_per_scan = self._get_rows_per_scan(rows_per_scan)
         new_chunks = self._new_chunks(source_geo_def.lons, rows_per_scan)
         lons, lats = source_geo_def.get_lonlats(chunks=new_chunks)
-        # run ll2cr to get column/row indexes
-        # if chunk does not overlap target area then None is returned
-        # otherwise a 3D array (2, y, x) of cols, rows are returned
-        ll2cr_result = _call_mapped_ll2cr(lons, lats, target_geo_def)
-        block_cache = self._fill_block_cache_with_ll2cr_results(
-            ll2cr_result, lons.numblocks[0], lons.numblocks[1], persist)
+        if cache_dir:
+            ll2cr_result, block_cache, block_bounds = self._get_cached_ll2cr_results(
+                cache_dir, lons, lats, ll2cr_dtype)
+        else:
+            # run ll2cr to get column/row indexes
+            # if chunk does not overlap target area then None is returned
+            # otherwise a 3D array (2, y, x) of cols, rows are returned
+            ll2cr_result = _call_mapped_ll2cr(lons, lats, target_geo_def, ll2cr_dtype)
+            block_cache, block_bounds = self._fill_block_cache_with_ll2cr_results(
+                ll2cr_result, lons.numblocks[0], lons.numblocks[1], persist)
 
         # save the dask arrays in the class instance cache
         self.cache = {
             'll2cr_result': ll2cr_result,
             'll2cr_blocks': block_cache,
+            'll2cr_bounds': block_bounds,
         }
         return None
 
-    def _get_input_tuples(self, data):
+    def _get_cached_ll2cr_results(self, cache_dir, lons, lats, ll2cr_dtype=np.float64):
+        cache_key = _ll2cr_cache_key(self.source_geo_def, self.target_geo_def, lons.chunks, ll2cr_dtype)
+        entry_path = Path(cache_dir) / f"ewa_ll2cr_{cache_key}"
+        if not entry_path.is_dir():
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            ll2cr_result = _call_mapped_ll2cr(lons, lats, self.target_geo_def, ll2cr_dtype)
+            _store_ll2cr_blocks(entry_path, ll2cr_result)
+        # for consistency, always load the cached result
+        return _load_ll2cr_blocks(entry_path, lons, ll2cr_dtype)
+
+    def _get_input_array(self, data):
+        """Get the 2D (y, x) or N-D (..., y, x) array to resample.
+
+        All non-spatial dimensions (bands, time, levels, channels, etc) of
+        N-D arrays are resampled in one pass sharing the EWA parameters and
+        weights of every swath pixel.
+
+        """
         if xr is not None and isinstance(data, xr.DataArray):
             xr_obj = data
-            if data.ndim == 3 and 'bands' in data.dims:
-                data_in = tuple(data.sel(bands=band).data
-                                for band in data['bands'])
-            elif data.ndim == 2:
-                data_in = (data.data,)
+            if data.ndim == 2:
+                data_in = data.data
             elif data.ndim >= 3:
-                # TODO: Create tuple of 2D arrays to operate on. For example:
-                #       non_xy = [x for x in a.dims if x not in ['y', 'x']]
-                #       b = a.stack({'z': non_xy})
-                #       iter_list = [b[..., idx] for idx in range(b.sizes['z'])]
-                #       new_arr = xr.DataArray(iter_list, dims=('z', 'y', 'x'),
-                #           coords={'z': b.coords['z']}, indexes={'z': b.indexes['z']})
-                #       new_arr.unstack('z')
-                raise NotImplementedError("EWA support for dimensions other "
-                                          "than y, x, and bands is not "
-                                          "implemented.")
+                if 'y' not in data.dims or 'x' not in data.dims:
+                    raise ValueError("EWA requires 'y' and 'x' dimensions "
+                                     "for arrays with more than 2 dimensions.")
+                data_in = data.transpose(..., 'y', 'x').data
             else:
                 raise ValueError("EWA cannot handle 1D arrays.")
         else:
@@ -307,22 +470,68 @@ class DaskEWAResampler(BaseResampler):
             if data.ndim != 2:
                 raise ValueError("Can only support 2D arrays unless "
                                  "provided as an xarray DataArray object.")
-            data_in = (data,)
+            data_in = data
         return data_in, xr_obj
 
-    def _convert_to_dask(self, data_in, rows_per_scan):
-        new_chunks = self._new_chunks(self.source_geo_def.lons, rows_per_scan)
-        for data in data_in:
-            if not isinstance(data, da.Array):
-                yield da.from_array(data, chunks=new_chunks)
-            else:
-                yield data.rechunk(new_chunks)
+    def _convert_to_dask(self, data, rows_per_scan):
+        geo_chunks = self._new_chunks(self.source_geo_def.lons, rows_per_scan)
+        # all bands of N-D arrays go in to the same chunk
+        num_band_dims = data.ndim - 2
+        new_chunks = {dim_idx: -1 for dim_idx in range(num_band_dims)}
+        new_chunks.update({num_band_dims + dim_idx: dim_chunks for dim_idx, dim_chunks in geo_chunks.items()})
+        if not isinstance(data, da.Array):
+            return da.from_array(data, chunks=new_chunks)
+        return data.rechunk(new_chunks)
+
+    def _get_ewa_params_tasks(self, kwargs):
+        """Get the tasks computing the EWA parameters of every ll2cr block.
+
+        The ellipse parameters only depend on the column/row arrays and the
+        weight parameters. The tasks are created once per set of parameters
+        and stored in the cache next to the ll2cr results so that every
+        data array and output chunk resampled with this resampler share them.
+
+        Returns:
+            Dictionary of tasks and dictionary mapping every ll2cr block key
+            to the key of the task computing its EWA parameters.
+
+        """
+        params_kwargs = {name: kwargs[name] for name in _EWA_PARAMETERS_KWARGS if name in kwargs}
+        ewa_params_cache = self.cache.setdefault('ewa_params', {})
+        cache_key = tuple(sorted(params_kwargs.items()))
+        if cache_key not in ewa_params_cache:
+            ll2cr_result = self.cache['ll2cr_result']
+            task_name = f"ewa-params-{tokenize(ll2cr_result.name, params_kwargs)}"
+            params_stack = {}
+            params_keys = {}
+            for ll2cr_key, ll2cr_block in self.cache['ll2cr_blocks'].items():
+                (_, in_row_idx, in_col_idx) = ll2cr_key
+                params_key = (task_name, in_row_idx, in_col_idx)
+                params_stack[params_key] = (_delayed_ewa_params, ll2cr_block, params_kwargs)
+                params_keys[ll2cr_key] = params_key
+            ewa_params_cache[cache_key] = (params_stack, params_keys)
+        return ewa_params_cache[cache_key]
 
     @staticmethod
-    def _generate_fornav_dask_tasks(out_chunks, ll2cr_blocks, task_name,
-                                    input_name, target_geo_def, fill_value, kwargs):
+    def _generate_fornav_dask_tasks(out_chunks, ll2cr_blocks, ll2cr_bounds, ewa_params_keys, task_name,
+                                    input_key_prefix, target_geo_def, fill_value, kwargs):
+        """Create the fornav tasks of every input block and output chunk pair that can overlap.
+
+        Pairs are skipped when the column/row bounding box of the input block
+        (if known from ``precompute``) is too far away from the output chunk
+        for any pixel to contribute to it. Every fornav task uses the
+        precomputed EWA parameters of its input block.
+
+        Returns:
+            Dictionary of fornav tasks and dictionary mapping every output
+            chunk index to the list of keys of the fornav tasks contributing
+            to it.
+
+        """
+        margin = _fornav_margin(kwargs)
         y_start = 0
         output_stack = {}
+        chunk_keys = {}
         for out_row_idx in range(len(out_chunks[0])):
             y_end = y_start + out_chunks[0][out_row_idx]
             x_start = 0
@@ -330,47 +539,96 @@ class DaskEWAResampler(BaseResampler):
                 x_end = x_start + out_chunks[1][out_col_idx]
                 y_slice = slice(y_start, y_end)
                 x_slice = slice(x_start, x_end)
-                for z_idx, ((_, in_row_idx, in_col_idx), ll2cr_block) in enumerate(ll2cr_blocks):
+                keys = []
+                for z_idx, (ll2cr_key, ll2cr_block) in enumerate(ll2cr_blocks):
+                    bounds = ll2cr_bounds.get(ll2cr_key)
+                    if bounds is not None and not _block_overlaps_chunk(bounds, y_slice, x_slice, margin):
+                        continue
+                    (_, in_row_idx, in_col_idx) = ll2cr_key
                     key = (task_name, z_idx, out_row_idx, out_col_idx)
                     output_stack[key] = (_delayed_fornav,
                                          ll2cr_block,
                                          target_geo_def, y_slice, x_slice,
-                                         (input_name, in_row_idx, in_col_idx), fill_value, kwargs)
+                                         input_key_prefix + (in_row_idx, in_col_idx), fill_value, kwargs,
+                                         ewa_params_keys[ll2cr_key])
+                    keys.append(key)
+                chunk_keys[(out_row_idx, out_col_idx)] = keys
                 x_start = x_end
             y_start = y_end
+        return output_stack, chunk_keys
+
+    @staticmethod
+    def _generate_average_dask_tasks(out_chunks, band_shape, chunk_keys, combine_name, output_name,
+                                     combine_func, average_func, fill_value, dtype):
+        """Create the tasks combining the fornav results of every output chunk.
+
+        Fornav results are combined in a tree with at most ``split_every``
+        (dask configuration, 4 by default) inputs per task like
+        :func:`dask.array.reduction` does. Output chunks without any
+        contributing input block are filled with ``fill_value``.
+
+        """
+        split_every = dask.config.get('split_every', 4)
+        output_stack = {}
+        for (out_row_idx, out_col_idx), keys in chunk_keys.items():
+            out_key = (output_name,) + (0,) * len(band_shape) + (out_row_idx, out_col_idx)
+            if not keys:
+                chunk_shape = band_shape + (out_chunks[0][out_row_idx], out_chunks[1][out_col_idx])
+                output_stack[out_key] = (np.full, chunk_shape, fill_value, dtype)
+                continue
+            depth = 0
+            while len(keys) > split_every:
+                combined_keys = []
+                for start_idx in range(0, len(keys), split_every):
+                    combine_key = (combine_name, depth, start_idx // split_every,
+                                   out_row_idx, out_col_idx)
+                    output_stack[combine_key] = (combine_func, keys[start_idx:start_idx + split_every],
+                                                 (0,), True)
+                    combined_keys.append(combine_key)
+                keys = combined_keys
+                depth += 1
+            output_stack[out_key] = (average_func, keys, (0,), False)
         return output_stack
 
-    def _run_fornav_single(self, data, out_chunks, target_geo_def, fill_value, **kwargs):
+    def _run_fornav(self, data, out_chunks, target_geo_def, fill_value, **kwargs):
         ll2cr_result = self.cache['ll2cr_result']
         ll2cr_blocks = self.cache['ll2cr_blocks'].items()
-        ll2cr_numblocks = ll2cr_result.shape if isinstance(ll2cr_result, np.ndarray) else ll2cr_result.numblocks
-        fornav_task_name = f"fornav-{data.name}-{ll2cr_result.name}"
+        ll2cr_bounds = self.cache['ll2cr_bounds']
         maximum_weight_mode = kwargs.setdefault('maximum_weight_mode', False)
         weight_sum_min = kwargs.setdefault('weight_sum_min', -1.0)
-        output_stack = self._generate_fornav_dask_tasks(out_chunks,
-                                                        ll2cr_blocks,
-                                                        fornav_task_name,
-                                                        data.name,
-                                                        target_geo_def,
-                                                        fill_value,
-                                                        kwargs)
-
-        dsk_graph = HighLevelGraph.from_collections(fornav_task_name,
-                                                    output_stack,
-                                                    dependencies=[data, ll2cr_result])
-        stack_chunks = ((1,) * (ll2cr_numblocks[0] * ll2cr_numblocks[1]),) + out_chunks
-        out_stack = da.Array(dsk_graph, fornav_task_name, stack_chunks, data.dtype)
+        token = tokenize(data.name, ll2cr_result.name, out_chunks, fill_value, kwargs)
+        fornav_task_name = f"fornav-{token}"
+        output_name = f"ewa-{token}"
+        band_shape = data.shape[:-2]
+        input_key_prefix = (data.name,) + (0,) * len(band_shape)
+        params_stack, params_keys = self._get_ewa_params_tasks(kwargs)
+        output_stack, chunk_keys = self._generate_fornav_dask_tasks(out_chunks,
+                                                                    ll2cr_blocks,
+                                                                    ll2cr_bounds,
+                                                                    params_keys,
+                                                                    fornav_task_name,
+                                                                    input_key_prefix,
+                                                                    target_geo_def,
+                                                                    fill_value,
+                                                                    kwargs)
         combine_fornav_with_kwargs = partial(
             _combine_fornav, maximum_weight_mode=maximum_weight_mode)
         average_fornav_with_kwargs = partial(
             _average_fornav, maximum_weight_mode=maximum_weight_mode,
             weight_sum_min=weight_sum_min, dtype=data.dtype,
             fill_value=fill_value)
-        out = da.reduction(out_stack, _chunk_callable,
-                           average_fornav_with_kwargs,
-                           combine=combine_fornav_with_kwargs, axis=(0,),
-                           dtype=data.dtype, concatenate=False)
-        return out
+        output_stack.update(self._generate_average_dask_tasks(
+            out_chunks, band_shape, chunk_keys, f"fornav-combine-{token}", output_name,
+            combine_fornav_with_kwargs, average_fornav_with_kwargs,
+            fill_value, data.dtype))
+        output_stack.update(params_stack)
+
+        dsk_graph = HighLevelGraph.from_collections(output_name,
+                                                    output_stack,
+                                                    dependencies=[data, ll2cr_result])
+        band_chunks = tuple((band_size,) for band_size in band_shape)
+        return da.Array(dsk_graph, output_name, band_chunks + out_chunks, dtype=data.dtype,
+                        meta=np.array((), dtype=data.dtype))
 
     def compute(self, data, cache_id=None, rows_per_scan=None, chunks=None, fill_value=None,
                 weight_count=10000, weight_min=0.01, weight_distance_max=1.0,
@@ -379,12 +637,11 @@ class DaskEWAResampler(BaseResampler):
         """Resample the data according to the precomputed X/Y coordinates."""
         # not used in this step
         kwargs.pop("persist", None)
-        data_in, xr_obj = self._get_input_tuples(data)
+        kwargs.pop("ll2cr_dtype", None)
+        data_in, xr_obj = self._get_input_array(data)
         rows_per_scan = self._get_rows_per_scan(rows_per_scan)
-        data_in = tuple(self._convert_to_dask(data_in, rows_per_scan))
-        out_chunks = normalize_chunks(chunks or 'auto',
-                                      shape=self.target_geo_def.shape,
-                                      dtype=data.dtype)
+        data_in = self._convert_to_dask(data_in, rows_per_scan)
+        out_chunks = self._get_out_chunks(chunks, data_in.shape[:-2], data.dtype)
         fornav_kwargs = kwargs.copy()
         maximum_weight_mode = self._handle_mwm(data, maximum_weight_mode)
         fornav_kwargs.update(dict(
@@ -400,19 +657,12 @@ class DaskEWAResampler(BaseResampler):
         # determine a fill value if they didn't tell us what they have as a
         # fill value in the numpy arrays
         if fill_value is None:
-            fill_value = self._get_default_fill(data_in[0])
-
-        data_out = []
-        for data_subarr in data_in:
-            res = self._run_fornav_single(data_subarr, out_chunks,
-                                          self.target_geo_def,
-                                          fill_value,
-                                          **fornav_kwargs)
-            data_out.append(res)
-        if data.ndim == 2:
-            out = data_out[0]
-        else:
-            out = da.concatenate([arr[None, ...] for arr in data_out], axis=0)
+            fill_value = self._get_default_fill(data_in)
+
+        out = self._run_fornav(data_in, out_chunks,
+                               self.target_geo_def,
+                               fill_value,
+                               **fornav_kwargs)
 
         if xr_obj is not None:
             dims = [d for d in xr_obj.dims if d not in ('y', 'x')] + ['y', 'x']
@@ -423,6 +673,16 @@ class DaskEWAResampler(BaseResampler):
             return out.compute()
         return out
 
+    def _get_out_chunks(self, chunks, band_shape, dtype):
+        """Get the chunks of the y and x dimensions of the output."""
+        if chunks is not None and chunks != 'auto':
+            return normalize_chunks(chunks, shape=self.target_geo_def.shape, dtype=dtype)
+        # every output chunk holds all bands, limit the total chunk size
+        auto_chunks = normalize_chunks((-1,) * len(band_shape) + ('auto', 'auto'),
+                                       shape=band_shape + self.target_geo_def.shape,
+                                       dtype=dtype)
+        return auto_chunks[-2:]
+
     @staticmethod
     def _handle_mwm(data, maximum_weight_mode):
         if np.issubdtype(data.dtype, np.integer):
@@ -449,11 +709,11 @@ class DaskEWAResampler(BaseResampler):
                  rows_per_scan=None, persist=False, chunks=None, fill_value=None,
                  weight_count=10000, weight_min=0.01, weight_distance_max=1.0,
                  weight_delta_max=10.0, weight_sum_min=-1.0,
-                 maximum_weight_mode=None):
+                 maximum_weight_mode=None, ll2cr_dtype=np.float64):
         """Resample using an elliptical weighted averaging algorithm.
 
-        This algorithm does **not** use caching or any externally provided data
-        mask (unlike the 'nearest' resampler).
+        This algorithm does not use any externally provided data mask
+        (unlike the 'nearest' resampler).
         See the :class:`~satpy.ewa.dask_ewa.DaskEWAResampler` class docstring
         for more information on how the algorithm works.
 
@@ -467,12 +727,20 @@ class DaskEWAResampler(BaseResampler):
                 Raster data to be resampled. Can be a numpy array, dask array,
                 or xarray DataArray backed by a numpy or dask array. If the
                 data is a numpy or dask array then only 2D (y, x) arrays are
-                permitted. DataArray objects may be 2D or 3D where the third
-                dimension is named "bands". Note that regardless of the input
+                permitted. DataArray objects may be 2D or N-D with "y" and "x"
+                dimensions. Any other dimensions (bands, time, levels, etc)
+                are resampled in a single pass sharing the column/row arrays
+                and the EWA weights. Note that regardless of the input
                 type, data is converted to a dask array for internal
                 processing and converted back to the original data type on
                 return.
-            cache_dir (str, None): Not used by this resampler.
+            cache_dir (str, None): Directory to store the column and row
+                arrays computed by ``ll2cr`` in. If the arrays for the same
+                swath, target area and chunking were stored previously (by
+                this or any other process) they are loaded instead of being
+                recomputed. Input chunks not overlapping the target area are
+                skipped when loading from the cache. ``None`` (default) means
+                no on-disk caching.
             mask_area (bool, None): Not used by this resampler.
             rows_per_scan (int, None): Number of array rows that represent a
                 single scan of the instrument. If ``None`` (default), then
@@ -485,13 +753,17 @@ class DaskEWAResampler(BaseResampler):
             persist (bool): Whether to persist (as in dask) the computations
                 during precompute or compute them on the fly during compute.
                 Persisting allows the resampler to determine which input
-                chunks will overlap with the target area. This can greatly
+                chunks will overlap with the target area and which output
+                chunks each of them can contribute to. This can greatly
                 reduce the number of tasks and checks that will need to be
                 computed in cases where it is known that only a small amount
-                of input data will fall into the output area.
-            chunks (tuple, int, dict, string): Chunk size of resulting dask
-                array. See :func:`~dask.array.core.normalize_chunks` for more
-                information.
+                of input data will fall into the output area. Results loaded
+                from ``cache_dir`` provide the same information.
+            chunks (tuple, int, dict, string): Chunk size of the y and x
+                dimensions of the resulting dask array. See
+                :func:`~dask.array.core.normalize_chunks` for more
+                information. By default ("auto") the chunk size accounts for
+                all non-spatial dimensions being in the same chunk.
             fill_value (int, float): Output value when no data is present.
                 Defaults to ``numpy.nan`` for float types or the maximum
                 value for any integer types.
@@ -521,6 +793,13 @@ class DaskEWAResampler(BaseResampler):
                 If True, the swath cell having the maximum weight of all
                 swath cells that map to a particular grid cell is used. This
                 option should be used for coded/category data, i.e. snow cover.
+            ll2cr_dtype (numpy.dtype):
+                Data type of the column and row arrays computed by ``ll2cr``,
+                ``numpy.float64`` (default) or ``numpy.float32``. With
+                ``numpy.float32`` the column/row arrays (and any 32-bit
+                navigation) use half the memory, but the pixel positions are
+                only accurate to about 1e-3 grid cells for large target
+                grids which can slightly change the resampled values.
 
         """
         mask_area = False if mask_area is None else mask_area
@@ -535,5 +814,6 @@ class DaskEWAResampler(BaseResampler):
                                 weight_distance_max=weight_distance_max,
                                 weight_delta_max=weight_delta_max,
                                 weight_sum_min=weight_sum_min,
-                                maximum_weight_mode=maximum_weight_mode
+                                maximum_weight_mode=maximum_weight_mode,
+                                ll2cr_dtype=ll2cr_dtype,
                                 )
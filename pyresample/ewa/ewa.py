@@ -19,6 +19,8 @@
 from __future__ import annotations
 
 import logging
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -29,7 +31,7 @@ from pyresample.ewa import _fornav, _ll2cr  # type: ignore
 LOG = logging.getLogger(__name__)
 
 
-def ll2cr(swath_def, area_def, fill=np.nan, copy=True):
+def ll2cr(swath_def, area_def, fill=np.nan, copy=True, dtype=np.float64):
     """Map input swath pixels to output grid column and rows.
 
     Parameters
@@ -42,6 +44,12 @@ def ll2cr(swath_def, area_def, fill=np.nan, copy=True):
         Fill value used in longitude and latitude arrays
     copy : bool, optional
         Create a copy of the longitude and latitude arrays (default: True)
+    dtype : numpy.dtype, optional
+        Data type of the returned column and row arrays, either
+        ``numpy.float64`` (default) or ``numpy.float32``. With
+        ``numpy.float32`` the longitude and latitude arrays are only
+        converted to 64-bit floats for the projection in blocks of rows of
+        bounded size which halves the memory needed for the navigation.
 
     Returns
     -------
@@ -56,15 +64,17 @@ def ll2cr(swath_def, area_def, fill=np.nan, copy=True):
         of data types.
 
     """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Unsupported column/row data type for ll2cr: {dtype}")
     lons, lats = swath_def.get_lonlats()
-    # ll2cr requires 64-bit floats due to pyproj limitations
-    # also need a copy of lons, lats since they are written to in-place
+    # need a copy of lons, lats since they are written to in-place
     try:
-        lons = lons.astype(np.float64, copy=copy)
-        lats = lats.astype(np.float64, copy=copy)
+        lons = lons.astype(dtype, copy=copy)
+        lats = lats.astype(dtype, copy=copy)
     except TypeError:
-        lons = lons.astype(np.float64)
-        lats = lats.astype(np.float64)
+        lons = lons.astype(dtype)
+        lats = lats.astype(dtype)
 
     # Break the input area up in to the expected parameters for ll2cr
     p = area_def.crs_wkt if hasattr(area_def, 'crs_wkt') else area_def.proj_str
@@ -80,11 +90,46 @@ def ll2cr(swath_def, area_def, fill=np.nan, copy=True):
     return swath_points_in_grid, lons, lats
 
 
+def ewa_parameters(cols, rows, rows_per_scan=None,
+                   weight_count=10000, weight_min=0.01, weight_distance_max=1.0,
+                   weight_delta_max=10.0):
+    """Compute the EWA ellipse parameters of every swath pixel.
+
+    The ellipse parameters only depend on the column and row arrays from
+    `ll2cr` and on the weight parameters, not on the data being resampled.
+    They can be computed once and passed as ``ewa_params`` to every
+    :func:`fornav` call using the same `cols` and `rows`.
+
+    Parameters
+    ----------
+    cols : numpy array
+        Column location for each input swath pixel (from `ll2cr`)
+    rows : numpy array
+        Row location for each input swath pixel (from `ll2cr`)
+    rows_per_scan : int or None, optional
+        Number of data rows for every observed scanline. If None then the
+        entire swath is treated as one large scanline.
+    weight_count, weight_min, weight_distance_max, weight_delta_max : optional
+        Weight parameters as passed to :func:`fornav`.
+
+    Returns
+    -------
+    numpy array
+        float32 array of shape ``(num_scans, swath_cols, 6)``.
+    """
+    rows_per_scan = rows_per_scan or cols.shape[0]
+    return _fornav.compute_ewa_parameters_wrapper(cols, rows, rows_per_scan,
+                                                  weight_count=weight_count,
+                                                  weight_min=weight_min,
+                                                  weight_distance_max=weight_distance_max,
+                                                  weight_delta_max=weight_delta_max)
+
+
 def fornav(cols, rows, area_def, data_in,
            rows_per_scan=None, fill=None, out=None,
            weight_count=10000, weight_min=0.01, weight_distance_max=1.0,
            weight_delta_max=10.0, weight_sum_min=-1.0,
-           maximum_weight_mode=False):
+           maximum_weight_mode=False, num_threads=1, ewa_params=None):
     """Remap data in to output grid using elliptical weighted averaging.
 
     This algorithm works under the assumption that the data is observed
@@ -140,6 +185,19 @@ def fornav(cols, rows, area_def, data_in,
         If True, the swath cell having the maximum weight of all
         swath cells that map to a particular grid cell is used. This
         option should be used for coded/category data, i.e. snow cover.
+    num_threads : int, optional
+        Number of threads to use. If larger than 1 (default: 1) the output
+        grid is split in to tiles of full rows which are processed in
+        parallel. Every tile is only given the scan lines that can
+        contribute to it and is written by a single thread so the results
+        are the same as with a single thread. Tiles are made of whole scans
+        so `rows_per_scan` must be provided for this to have any effect, a
+        swath treated as one large scanline is always resampled in a single
+        thread.
+    ewa_params : numpy array or None, optional
+        EWA ellipse parameters from :func:`ewa_parameters` computed with the
+        same `cols`, `rows`, `rows_per_scan` and weight parameters. If None
+        (default) they are computed on the fly.
 
     Returns
     -------
@@ -167,14 +225,20 @@ def fornav(cols, rows, area_def, data_in,
     # otherwise, use the entire swath as one "scanline"
     rows_per_scan = rows_per_scan or data_in[0].shape[0]
 
-    results = _fornav.fornav_wrapper(cols, rows, data_in, out,
-                                     np.nan, np.nan, rows_per_scan,
-                                     weight_count=weight_count,
-                                     weight_min=weight_min,
-                                     weight_distance_max=weight_distance_max,
-                                     weight_delta_max=weight_delta_max,
-                                     weight_sum_min=weight_sum_min,
-                                     maximum_weight_mode=maximum_weight_mode)
+    fornav_kwargs = dict(weight_count=weight_count,
+                         weight_min=weight_min,
+                         weight_distance_max=weight_distance_max,
+                         weight_delta_max=weight_delta_max,
+                         weight_sum_min=weight_sum_min,
+                         maximum_weight_mode=maximum_weight_mode,
+                         ewa_params=ewa_params)
+    if num_threads > 1 and rows_per_scan < data_in[0].shape[0]:
+        results = _fornav_tiles(cols, rows, data_in, out, rows_per_scan, fill,
+                                num_threads, fornav_kwargs)
+    else:
+        results = _fornav.fornav_wrapper(cols, rows, data_in, out,
+                                         np.nan, np.nan, rows_per_scan,
+                                         **fornav_kwargs)
 
     if convert_to_masked:
         # they gave us masked arrays so give them masked arrays back
@@ -188,6 +252,69 @@ def fornav(cols, rows, area_def, data_in,
     return results, out
 
 
+def _fornav_tiles(cols, rows, data_in, out, rows_per_scan, fill, num_threads, fornav_kwargs):
+    """Run fornav on tiles of full output rows in parallel threads.
+
+    The fornav kernel releases the GIL so threads run in parallel. Every
+    thread owns the tile it writes to.
+
+    """
+    if rows_per_scan < 2 or rows.shape[0] % rows_per_scan != 0:
+        raise ValueError("EWA requires 2 or more rows_per_scan and must be a factor of the total number of input rows")
+    grid_rows = out[0].shape[0]
+    num_tiles = min(num_threads * 4, grid_rows)
+    tile_edges = np.linspace(0, grid_rows, num_tiles + 1).astype(np.int64).tolist()
+    # a swath pixel can only contribute to grid cells this close to it
+    margin = max(fornav_kwargs["weight_delta_max"], fornav_kwargs["weight_distance_max"]) + 1
+    scan_rows = rows.reshape(-1, rows_per_scan * rows.shape[1])
+    ewa_params = fornav_kwargs.pop("ewa_params", None)
+    with warnings.catch_warnings():
+        # scans without valid geolocation
+        warnings.simplefilter("ignore", RuntimeWarning)
+        scan_min = np.nanmin(scan_rows, axis=1)
+        scan_max = np.nanmax(scan_rows, axis=1)
+
+    def _run_tile(y_start, y_end):
+        tile_out = tuple(out_arr[y_start:y_end] for out_arr in out)
+        scan_mask = (scan_min - margin < y_end) & (scan_max + margin >= y_start)
+        if scan_mask.any():
+            scan_index, row_index = _scan_selection(scan_mask, rows_per_scan)
+            tile_data = tuple(np.ascontiguousarray(in_arr[row_index]) for in_arr in data_in)
+            tile_params = None if ewa_params is None else np.ascontiguousarray(ewa_params[scan_index])
+            try:
+                return _fornav.fornav_wrapper(np.ascontiguousarray(cols[row_index]),
+                                              rows[row_index] - y_start,
+                                              tile_data, tile_out, np.nan, np.nan, rows_per_scan,
+                                              ewa_params=tile_params, **fornav_kwargs)
+            except RuntimeError:
+                # no swath pixels in this tile
+                pass
+        for tile_arr in tile_out:
+            tile_arr[:] = np.nan if np.issubdtype(tile_arr.dtype, np.floating) else fill
+        return None
+
+    with ThreadPoolExecutor(num_threads) as executor:
+        tile_results = [res for res in executor.map(_run_tile, tile_edges[:-1], tile_edges[1:])
+                        if res is not None]
+    if not tile_results:
+        raise RuntimeError("EWA Resampling: No swath pixels found inside grid to be resampled")
+    return [sum(tile_valid) for tile_valid in zip(*tile_results)]
+
+
+def _scan_selection(scan_mask, rows_per_scan):
+    """Get indexes of the selected scans and of their swath rows.
+
+    Consecutive scans are selected with slices so the swath arrays don't have
+    to be copied.
+
+    """
+    scan_indexes = np.flatnonzero(scan_mask)
+    first_scan, last_scan = scan_indexes[0], scan_indexes[-1] + 1
+    if last_scan - first_scan == scan_indexes.size:
+        return slice(first_scan, last_scan), slice(first_scan * rows_per_scan, last_scan * rows_per_scan)
+    return scan_mask, np.repeat(scan_mask, rows_per_scan)
+
+
 def _data_in_as_masked_arrays(
         data_in: Any,
         fill: float | int | None
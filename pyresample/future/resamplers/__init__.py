@@ -19,6 +19,8 @@
 
 from __future__ import annotations
 
+from .cache import ResampleCache, ZarrResampleCache  # noqa
 from .nearest import KDTreeNearestXarrayResampler  # noqa
 from .registry import create_resampler, list_resamplers, register_resampler, unregister_resampler  # noqa
 from .resampler import Resampler  # noqa
+from .sparse import SparseMatrixResampler  # noqa
@@ -0,0 +1,160 @@
+# Copyright (c) 2024 Pyresample developers
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Cache objects used by resamplers to store precomputed information.
+
+A cache maps the hash of a resampler configuration (see
+:meth:`Resampler._get_hash <pyresample.future.resamplers.resampler.Resampler._get_hash>`)
+to a dictionary of named arrays. Resamplers decide what they store, caches
+decide where and how it is stored.
+
+"""
+from __future__ import annotations
+
+import abc
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+try:
+    import dask.array as da
+except ImportError:
+    da = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResampleCache(abc.ABC):
+    """Base class for caches of precomputed resampling information."""
+
+    @abc.abstractmethod
+    def __contains__(self, key: str) -> bool:
+        """Check if an entry for ``key`` exists in the cache."""
+
+    @abc.abstractmethod
+    def load(self, key: str) -> dict:
+        """Load the arrays stored for ``key``.
+
+        Raises:
+            KeyError: If there is no entry for ``key``.
+
+        """
+
+    @abc.abstractmethod
+    def store(self, key: str, arrays: dict) -> None:
+        """Store a dictionary of named arrays under ``key``."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+
+
+class ZarrResampleCache(ResampleCache):
+    """Directory-backed cache storing every array as a chunked zarr array.
+
+    Each entry is a sub-directory of ``cache_dir`` named after the key with
+    one zarr array per stored item. Loading an entry returns lazy dask arrays
+    reading from these zarr arrays so nothing is read from disk until the
+    arrays are computed. Entries are written to a temporary directory first
+    and then renamed into place so concurrent processes never see partially
+    written entries.
+
+    If ``max_size`` is provided then the least recently used entries are
+    removed after storing a new entry until the total size of the cache is
+    below ``max_size`` bytes. The entry that was just stored is never removed.
+
+    Args:
+        cache_dir: Directory to store entries in. It is created if it does
+            not exist.
+        max_size: Maximum size of all entries in bytes. ``None`` (default)
+            means the size of the cache is not limited.
+
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike, max_size: int | None = None):
+        if da is None:
+            raise ImportError("Missing 'dask' and 'zarr' dependencies")
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def __contains__(self, key: str) -> bool:
+        """Check if an entry for ``key`` exists in the cache."""
+        return self._entry_path(key).is_dir()
+
+    def load(self, key: str) -> dict:
+        """Load the arrays stored for ``key`` as dask arrays."""
+        entry_path = self._entry_path(key)
+        if not entry_path.is_dir():
+            raise KeyError(key)
+        # mark as recently used for eviction
+        os.utime(entry_path)
+        return {arr_path.stem: da.from_zarr(str(arr_path))
+                for arr_path in sorted(entry_path.glob("*.zarr"))}
+
+    def store(self, key: str, arrays: dict) -> None:
+        """Compute and store a dictionary of named arrays under ``key``."""
+        entry_path = self._entry_path(key)
+        tmp_path = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=self.cache_dir))
+        try:
+            stores = []
+            for name, arr in arrays.items():
+                arr = da.asarray(arr)
+                # zarr requires regular chunks
+                arr = arr.rechunk(arr.chunksize)
+                stores.append(da.to_zarr(arr, str(tmp_path / f"{name}.zarr"), compute=False))
+            da.compute(*stores)
+            try:
+                os.rename(tmp_path, entry_path)
+            except OSError:
+                # another process stored the same entry first
+                logger.debug("Cache entry %s already exists", key)
+                shutil.rmtree(tmp_path, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+        self._evict(keep=key)
+
+    def _entries(self) -> list[Path]:
+        return [path for path in self.cache_dir.iterdir()
+                if path.is_dir() and not path.name.startswith(".")]
+
+    def _evict(self, keep: str) -> None:
+        if self.max_size is None:
+            return
+        entries = sorted(self._entries(), key=lambda path: path.stat().st_mtime)
+        sizes = {path: _dir_size(path) for path in entries}
+        total_size = sum(sizes.values())
+        for entry_path in entries:
+            if total_size <= self.max_size:
+                break
+            if entry_path.name == keep:
+                continue
+            logger.debug("Evicting resample cache entry %s", entry_path.name)
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= sizes[entry_path]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache directory."""
+        for entry_path in self._entries():
+            shutil.rmtree(entry_path, ignore_errors=True)
+
+
+def _dir_size(path: Path) -> int:
+    return sum(file_path.stat().st_size for file_path in path.rglob("*") if file_path.is_file())
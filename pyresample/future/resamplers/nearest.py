@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import warnings
 from copy import deepcopy
+from functools import partial
 from logging import getLogger
 
 import numpy as np
@@ -41,15 +42,10 @@ except ImportError:
     dask = None
 
 
-def query_no_distance(target_lons, target_lats, valid_output_index,
-                      mask=None, valid_input_index=None,
-                      neighbours=None, epsilon=None, radius=None,
-                      kdtree=None):
-    """Query the kdtree. No distances are returned.
-
-    NOTE: Dask array arguments must always come before other keyword arguments
-          for `da.blockwise` arguments to work.
-    """
+def _query_kdtree(target_lons, target_lats, valid_output_index,
+                  mask=None, valid_input_index=None,
+                  neighbours=None, epsilon=None, radius=None,
+                  kdtree=None):
     voi = valid_output_index
     shape = voi.shape + (neighbours,)
     voir = voi.ravel()
@@ -68,6 +64,7 @@ def query_no_distance(target_lons, target_lats, valid_output_index,
 
     if index_array.ndim == 1:
         index_array = index_array[:, None]
+        distance_array = distance_array[:, None]
 
     # KDTree query returns out-of-bounds neighbors as `len(arr)`
     # which is an invalid index, we mask those out so -1 represents
@@ -81,9 +78,276 @@ def query_no_distance(target_lons, target_lats, valid_output_index,
     mask[voi, :] = good_pixels
     res_ia[mask] = index_array[good_pixels]
     res_ia[~mask] = -1
+    res_dist = np.full(shape, np.inf, dtype=np.float64)
+    res_dist[mask] = distance_array[good_pixels]
+    return res_ia, res_dist
+
+
+def query_no_distance(target_lons, target_lats, valid_output_index,
+                      mask=None, valid_input_index=None,
+                      neighbours=None, epsilon=None, radius=None,
+                      kdtree=None):
+    """Query the kdtree. No distances are returned.
+
+    NOTE: Dask array arguments must always come before other keyword arguments
+          for `da.blockwise` arguments to work.
+    """
+    res_ia, _ = _query_kdtree(
+        target_lons, target_lats, valid_output_index,
+        mask=mask, valid_input_index=valid_input_index,
+        neighbours=neighbours, epsilon=epsilon, radius=radius,
+        kdtree=kdtree)
     return res_ia
 
 
+def query_with_distance(target_lons, target_lats, valid_output_index,
+                        mask=None, valid_input_index=None,
+                        neighbours=None, epsilon=None, radius=None,
+                        kdtree=None):
+    """Query the kdtree and return indexes and distances in one array.
+
+    The result has the shape ``(rows, cols, neighbours, 2)`` where the last
+    dimension holds the index of the neighbor (as a float) and the distance
+    to it. Invalid neighbors have an index of -1 and an infinite distance.
+    Combining the two allows a single dask task to provide both results.
+
+    NOTE: Dask array arguments must always come before other keyword arguments
+          for `da.blockwise` arguments to work.
+    """
+    res_ia, res_dist = _query_kdtree(
+        target_lons, target_lats, valid_output_index,
+        mask=mask, valid_input_index=valid_input_index,
+        neighbours=neighbours, epsilon=epsilon, radius=radius,
+        kdtree=kdtree)
+    return np.stack([res_ia.astype(np.float64), res_dist], axis=-1)
+
+
+def _bounding_sphere(coords):
+    """Get the center and radius of a sphere enclosing all cartesian ``coords``."""
+    center = coords.mean(axis=0)
+    return center, np.sqrt(((coords - center) ** 2).sum(axis=1).max())
+
+
+def _lonlat_bounding_sphere(lons, lats):
+    """Get the number of valid lon/lats and the bounding sphere of their cartesian coordinates."""
+    valid_idx = ((lons >= -180) & (lons <= 180) & (lats <= 90) & (lats >= -90))
+    coords = lonlat2xyz(lons[valid_idx], lats[valid_idx]).astype(np.float64)
+    if coords.shape[0] == 0:
+        return 0, None, None
+    return (coords.shape[0],) + _bounding_sphere(coords)
+
+
+class _KDTreePartition:
+    """KD-tree and bounding sphere of one contiguous partition of the source coordinates."""
+
+    def __init__(self, lons, lats):
+        valid_input_idx = ((lons >= -180) & (lons <= 180) & (lats <= 90) & (lats >= -90))
+        coords = lonlat2xyz(lons[valid_input_idx], lats[valid_input_idx]).astype(np.float64)
+        self.n = coords.shape[0]
+        if self.n == 0:
+            self.kdtree = None
+            return
+        self.kdtree = KDTree(coords)
+        self.center, self.radius = _bounding_sphere(coords)
+
+    def overlaps(self, center, radius):
+        """Check if this partition's bounding sphere is within ``radius`` of the sphere center ``center``."""
+        if self.kdtree is None:
+            return False
+        return np.sqrt(((center - self.center) ** 2).sum()) <= radius + self.radius
+
+
+class PartitionedKDTree:
+    """Query multiple KD-trees built on contiguous partitions of the source coordinates.
+
+    Each partition holds its own KD-tree and a bounding sphere of its
+    coordinates. Only partitions whose bounding sphere is within the query
+    distance of the bounding sphere of the query points are searched. The
+    results are merged so this object can be queried in the same way as a
+    single :class:`pykdtree.kdtree.KDTree` built on all valid coordinates in
+    partition order.
+
+    The partitions can be a subset of all partitions of the source. In this
+    case ``offsets`` holds the index of the first valid source coordinate of
+    each partition and ``n`` the number of valid coordinates in the whole
+    source.
+
+    """
+
+    def __init__(self, partitions, offsets=None, n=None):
+        self.partitions = partitions
+        sizes = [partition.n for partition in partitions]
+        if offsets is None:
+            offsets = np.cumsum([0] + sizes)[:-1]
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.n = int(sum(sizes) if n is None else n)
+
+    def query(self, query_pts, k=1, eps=0, distance_upper_bound=None, mask=None):
+        """Query all overlapping partitions and merge the ``k`` closest neighbors of each point."""
+        num_pts = query_pts.shape[0]
+        all_dists = [np.full((num_pts, k), np.inf)]
+        all_idxs = [np.full((num_pts, k), self.n, dtype=np.int64)]
+        if num_pts:
+            center, radius = _bounding_sphere(query_pts)
+            if distance_upper_bound is not None:
+                radius += distance_upper_bound
+            else:
+                radius = np.inf
+            for offset, partition in zip(self.offsets, self.partitions):
+                if not partition.overlaps(center, radius):
+                    continue
+                part_mask = None if mask is None else mask[offset:offset + partition.n]
+                dists, idxs = partition.kdtree.query(
+                    query_pts, k=k, eps=eps, distance_upper_bound=distance_upper_bound, mask=part_mask)
+                dists = dists.reshape((num_pts, k))
+                idxs = idxs.reshape((num_pts, k)).astype(np.int64)
+                invalid = idxs >= partition.n
+                idxs += offset
+                idxs[invalid] = self.n
+                dists[invalid] = np.inf
+                all_dists.append(dists)
+                all_idxs.append(idxs)
+        dists = np.concatenate(all_dists, axis=1)
+        idxs = np.concatenate(all_idxs, axis=1)
+        closest = np.argsort(dists, axis=1, kind="stable")[:, :k]
+        dists = np.take_along_axis(dists, closest, axis=1)
+        idxs = np.take_along_axis(idxs, closest, axis=1)
+        if k == 1:
+            return dists[:, 0], idxs[:, 0]
+        return dists, idxs
+
+
+class DelayedPartitionedKDTree:
+    """Delayed KD-tree partitions, one per chunk of the source coordinates.
+
+    Nothing is computed when this object is created. The source coordinates
+    are computed once while building the query graph (see
+    :func:`query_partitioned_kdtree`). Both the bounding spheres of the
+    partitions and their KD-trees are made from these computed coordinates
+    so that the query of every target chunk only depends on the partitions
+    it can overlap.
+
+    """
+
+    def __init__(self, source_lons, source_lats):
+        self.chunks = list(zip(source_lons.to_delayed().ravel(), source_lats.to_delayed().ravel()))
+
+
+def create_partitioned_kdtree(source_lons, source_lats):
+    """Create a :class:`DelayedPartitionedKDTree` with one KD-tree per chunk of the source coordinates.
+
+    The chunks of the provided arrays must be contiguous in flattened order
+    (ex. chunked by rows only) so that the partitions follow the order of the
+    flattened valid source pixels.
+
+    """
+    return DelayedPartitionedKDTree(source_lons, source_lats)
+
+
+def query_partitioned_kdtree(query_func, partitioned_kdtree, target_lons, target_lats, valid_output_index,
+                             mask=None, valid_input_index=None, neighbours=None, epsilon=None, radius=None,
+                             dtype=np.int64, extra_shape=()):
+    """Query a :class:`DelayedPartitionedKDTree` for every chunk of the target coordinates.
+
+    The source coordinates and the bounding spheres of the source partitions
+    and of the target chunks are computed first, in a single compute. This
+    means building the graph computes the source and target
+    longitudes/latitudes and holds the source coordinates in memory until
+    the returned array is computed. The target coordinates are computed
+    again by the queries. Each target chunk is then queried with
+    ``query_func`` (ex. :func:`query_no_distance`) on a
+    :class:`PartitionedKDTree` made only of the partitions within ``radius``
+    of the chunk, so distant KD-trees are never sent to its task. The
+    KD-trees are built from the already computed source coordinates.
+
+    Returns:
+        Dask array with the chunks of the target coordinates followed by
+        ``extra_shape``.
+
+    """
+    lons_blocks = target_lons.to_delayed()
+    lats_blocks = target_lats.to_delayed()
+    voi_blocks = valid_output_index.to_delayed()
+    target_bounds = {idx: dask.delayed(_lonlat_bounding_sphere, pure=True)(lons_blocks[idx], lats_blocks[idx])
+                     for idx in np.ndindex(target_lons.numblocks)}
+    source_bounds = [dask.delayed(_lonlat_bounding_sphere, pure=True)(lons, lats)
+                     for lons, lats in partitioned_kdtree.chunks]
+    source_chunks, source_bounds, target_bounds = dask.compute(
+        partitioned_kdtree.chunks, source_bounds, target_bounds)
+    partitions = [dask.delayed(_KDTreePartition, pure=True)(lons, lats) for lons, lats in source_chunks]
+    offsets = np.cumsum([0] + [num_coords for num_coords, _, _ in source_bounds])
+    max_distance = np.inf if radius is None else radius
+
+    blocks = np.empty(target_lons.numblocks, dtype=object)
+    for idx, (target_num, target_center, target_radius) in target_bounds.items():
+        selected = [part_idx for part_idx, (num_coords, center, part_radius) in enumerate(source_bounds)
+                    if num_coords and target_num and
+                    np.sqrt(((center - target_center) ** 2).sum()) <= target_radius + max_distance + part_radius]
+        kdtree = dask.delayed(PartitionedKDTree, pure=True)(
+            [partitions[part_idx] for part_idx in selected], offsets[selected], offsets[-1])
+        res = dask.delayed(query_func, pure=True)(
+            lons_blocks[idx], lats_blocks[idx], voi_blocks[idx], mask=mask, valid_input_index=valid_input_index,
+            neighbours=neighbours, epsilon=epsilon, radius=radius, kdtree=kdtree)
+        shape = tuple(dim_chunks[block_idx] for dim_chunks, block_idx in zip(target_lons.chunks, idx))
+        blocks[idx] = da.from_delayed(res, shape + extra_shape, dtype=dtype)
+    return da.block(blocks.tolist())
+
+
+def _rechunk_rows(source_lons, source_lats):
+    """Rechunk source coordinates so every chunk is contiguous in flattened order."""
+    row_chunks = {dim: -1 for dim in range(1, source_lons.ndim)}
+    return source_lons.rechunk(row_chunks), source_lats.rechunk(row_chunks)
+
+
+def get_grid_index_vectors(source_area, target_area):
+    """Get the source row and column of every target row and column for aligned grids.
+
+    When both areas are :class:`~pyresample.geometry.AreaDefinition` objects
+    using the same CRS, the nearest source pixel of a target pixel only
+    depends on the target pixel's X coordinate (for the column) and Y
+    coordinate (for the row). The 2D nearest neighbor search can then be
+    replaced by a lookup of the two 1D projection coordinate vectors. For
+    geographic CRSs the longitudes are wrapped to the source grid.
+
+    Args:
+        source_area: Area to take pixels from.
+        target_area: Area to resample to.
+
+    Returns:
+        ``(rows, cols)`` 1D int64 numpy arrays with the size of the target
+        area's height and width respectively. Target rows and columns outside
+        of the source area are -1. ``None`` if the areas are not on aligned
+        grids.
+
+    """
+    if not _is_aligned_grid(source_area, target_area):
+        return None
+    target_x, target_y = target_area.get_proj_vectors(dtype=np.float64)
+    if source_area.crs.is_geographic:
+        west_edge = source_area.area_extent[0]
+        target_x = (target_x - west_edge) % 360 + west_edge
+    cols, rows = source_area.get_array_coordinates_from_projection_coordinates(target_x, target_y)
+    cols = np.round(cols).astype(np.int64)
+    rows = np.round(rows).astype(np.int64)
+    cols[(cols < 0) | (cols >= source_area.width)] = -1
+    rows[(rows < 0) | (rows >= source_area.height)] = -1
+    return rows, cols
+
+
+def _is_aligned_grid(source_area, target_area):
+    if not isinstance(source_area, geometry.AreaDefinition) or \
+            not isinstance(target_area, geometry.AreaDefinition):
+        return False
+    return source_area.crs.equals(target_area.crs, ignore_axis_order=True)
+
+
+def _grid_index_array(rows, cols, source_width=None):
+    """Combine source row and column vectors in to flattened source indexes (rows, cols, 1)."""
+    index_arr = rows[:, np.newaxis] * source_width + cols[np.newaxis, :]
+    index_arr[(rows[:, np.newaxis] == -1) | (cols[np.newaxis, :] == -1)] = -1
+    return index_arr[:, :, np.newaxis]
+
+
 def _my_index(index_arr, vii, data_arr, vii_slices=None, ia_slices=None,
               fill_value=np.nan):
     """Wrap index logic for 'get_sample_from_neighbour_info' to be used inside dask map_blocks."""
@@ -98,6 +362,59 @@ def _my_index(index_arr, vii, data_arr, vii_slices=None, ia_slices=None,
     return res
 
 
+def _my_weighted_index(index_arr, distance_arr, vii, data_arr, vii_slices=None, ia_slices=None,
+                       fill_value=np.nan, weight_func=None):
+    """Wrap weighted neighbor logic for 'get_sample_from_neighbor_info' to be used inside dask blockwise."""
+    geo_axis = ia_slices.index(None)
+    neighbor_axis = geo_axis + 2
+    vii_slices = tuple(
+        x if x is not None else vii.ravel() for x in vii_slices)
+    invalid_neighbors = index_arr == -1
+    ia_slices = tuple(
+        x if x is not None else np.where(invalid_neighbors, 0, index_arr) for x in ia_slices)
+    values = data_arr[vii_slices][ia_slices].astype(np.float64)
+
+    weights = weight_func(distance_arr)
+    weights[invalid_neighbors] = 0
+    # broadcast (rows, cols, neighbors) weights to the dimensions of the data
+    weights = weights.reshape(
+        (1,) * geo_axis + weights.shape + (1,) * (values.ndim - neighbor_axis - 1))
+    invalid_values = np.isnan(values)
+    weights = np.where(invalid_values, 0, weights)
+    values[invalid_values] = 0
+
+    norm = weights.sum(axis=neighbor_axis)
+    res = (weights * values).sum(axis=neighbor_axis)
+    valid_res = norm > 0
+    res[valid_res] /= norm[valid_res]
+    res[~valid_res] = fill_value
+    return res.astype(data_arr.dtype)
+
+
+def _gauss_weights(distance, sigma):
+    """Gaussian weighting, ``w = exp(-d^2 / sigma^2)``."""
+    return np.exp(-distance ** 2 / sigma ** 2)
+
+
+def _inverse_distance_weights(distance, power):
+    """Inverse distance weighting, ``w = 1 / d^power``."""
+    # avoid division by zero for neighbors at the exact target location
+    return 1.0 / np.maximum(distance, 1e-6) ** power
+
+
+def _get_weight_func(weight_type, sigma, power):
+    if weight_type == "nearest":
+        return None
+    if weight_type == "gauss":
+        if sigma is None:
+            raise ValueError("'sigma' must be provided for 'gauss' weighting.")
+        return partial(_gauss_weights, sigma=float(sigma))
+    if weight_type == "idw":
+        return partial(_inverse_distance_weights, power=float(power))
+    raise ValueError(f"Unknown weight type '{weight_type}'. "
+                     "Must be one of 'nearest', 'idw', or 'gauss'.")
+
+
 # TODO: Add decorator for geom<->geom support
 # TODO: Add decorator for object type support
 # Must be decorators so that we can both add class attributes with this information
@@ -108,7 +425,9 @@ class KDTreeNearestXarrayResampler(Resampler):
     def __init__(self,
                  source_geo_def: StaticGeometry,
                  target_geo_def: StaticGeometry,
-                 cache=None):
+                 cache=None,
+                 partition_kdtree: bool = False,
+                 grid_lookup: bool = False):
         """Resampler for xarray DataArrays using a nearest neighbor algorithm.
 
         Parameters
@@ -117,11 +436,37 @@ class KDTreeNearestXarrayResampler(Resampler):
             Geometry definition of source
         target_geo_def : object
             Geometry definition of target
+        cache : ResampleCache or str, optional
+            Cache for precomputed neighbor information. See
+            :class:`~pyresample.future.resamplers.resampler.Resampler`.
+        partition_kdtree : bool, optional
+            Build one KD-tree per row-chunk of the source geolocation instead
+            of one KD-tree for the entire source. The trees are built in
+            parallel and each target chunk only searches the trees whose
+            bounding sphere is within the radius of influence of the target
+            chunk. Finding these trees computes the source and target
+            longitudes/latitudes while the neighbor query graph is built and
+            keeps the source coordinates in memory until the query is
+            computed. See :class:`PartitionedKDTree`.
+        grid_lookup : bool, optional
+            If the source and target are area definitions with the same CRS
+            (see :func:`get_grid_index_vectors`), compute the nearest source
+            pixel directly from the projection coordinates instead of
+            building and querying a KD-tree. This is only used for a single
+            neighbor without a ``mask``. The ``radius_of_influence`` and
+            ``epsilon`` are not used in this case, every target pixel inside
+            the source area gets the source pixel containing it unless the
+            longitude/latitude of that source pixel is invalid. Unlike with
+            the KD-tree, target pixels outside of the source area are not
+            filled from source pixels within the radius of influence.
+            Defaults to False.
 
         """
         if DataArray is None:
             raise ImportError("Missing 'xarray' and 'dask' dependencies")
         super().__init__(source_geo_def, target_geo_def, cache=cache)
+        self.partition_kdtree = partition_kdtree
+        self.grid_lookup = grid_lookup
         self._internal_cache: dict[tuple, dict] = {}
         if self.target_geo_def.ndim != 2:
             raise ValueError("Target area definition must be 2 dimensions")
@@ -156,7 +501,11 @@ class KDTreeNearestXarrayResampler(Resampler):
         """Set up kd tree on input."""
         source_lons, source_lats = self.source_geo_def.get_lonlats(
             chunks=chunks)
+        if self.partition_kdtree:
+            source_lons, source_lats = _rechunk_rows(source_lons, source_lats)
         valid_input_idx = ((source_lons >= -180) & (source_lons <= 180) & (source_lats <= 90) & (source_lats >= -90))
+        if self.partition_kdtree:
+            return valid_input_idx, create_partitioned_kdtree(source_lons, source_lats)
         input_coords = lonlat2xyz(source_lons, source_lats)
         input_coords = input_coords[valid_input_idx.ravel(), :]
 
@@ -182,30 +531,66 @@ class KDTreeNearestXarrayResampler(Resampler):
             ndims = self.source_geo_def.ndim
             dims = 'mn'[:ndims]
             args = (mask, dims, valid_input_index, dims)
+        if isinstance(resample_kdtree, DelayedPartitionedKDTree):
+            return self._query_partitioned_kdtree(
+                resample_kdtree, tlons, tlats, valid_input_index, valid_output_index, mask,
+                neighbors, radius_of_influence, epsilon)
         # res.shape = rows, cols, neighbors
         # j=rows, i=cols, k=neighbors, m=source rows, n=source cols
+        if neighbors == 1:
+            res = da.blockwise(
+                query_no_distance, 'jik', tlons, 'ji', tlats, 'ji',
+                valid_output_index, 'ji', *args, kdtree=resample_kdtree,
+                neighbours=neighbors, epsilon=epsilon,
+                radius=radius_of_influence, dtype=np.int64,
+                meta=np.array((), dtype=np.int64),
+                new_axes={'k': neighbors}, concatenate=True)
+            return res, None
+        # res.shape = rows, cols, neighbors, (index, distance)
         res = da.blockwise(
-            query_no_distance, 'jik', tlons, 'ji', tlats, 'ji',
+            query_with_distance, 'jikd', tlons, 'ji', tlats, 'ji',
             valid_output_index, 'ji', *args, kdtree=resample_kdtree,
             neighbours=neighbors, epsilon=epsilon,
-            radius=radius_of_influence, dtype=np.int64,
-            meta=np.array((), dtype=np.int64),
-            new_axes={'k': neighbors}, concatenate=True)
-        return res
+            radius=radius_of_influence, dtype=np.float64,
+            meta=np.array((), dtype=np.float64),
+            new_axes={'k': neighbors, 'd': 2}, concatenate=True)
+        return res[..., 0].astype(np.int64), res[..., 1]
+
+    @staticmethod
+    def _query_partitioned_kdtree(partitioned_kdtree, tlons, tlats, valid_input_index, valid_output_index, mask,
+                                  neighbors, radius_of_influence, epsilon):
+        """Query the partitions of the source KD-tree overlapping each chunk of target coordinates."""
+        kwargs = dict(neighbours=neighbors, epsilon=epsilon, radius=radius_of_influence)
+        if mask is not None:
+            kwargs.update(mask=mask, valid_input_index=valid_input_index)
+        if neighbors == 1:
+            res = query_partitioned_kdtree(query_no_distance, partitioned_kdtree, tlons, tlats,
+                                           valid_output_index, extra_shape=(1,), **kwargs)
+            return res, None
+        res = query_partitioned_kdtree(query_with_distance, partitioned_kdtree, tlons, tlats,
+                                       valid_output_index, dtype=np.float64, extra_shape=(neighbors, 2), **kwargs)
+        return res[..., 0].astype(np.int64), res[..., 1]
 
     def _get_neighbor_info(self, mask, neighbors, radius_of_influence, epsilon):
         """Return neighbour info.
 
-        Returns
-        -------
-        (valid_input_index, valid_output_index,
-        index_array, distance_array) : tuple of numpy arrays
-            Neighbour resampling info
+        Returns:
+            dict: Neighbour resampling info as dask arrays. The
+            ``"valid_input_index"`` and ``"index_array"`` items are always
+            present. When more than one neighbor is requested a
+            ``"distance_array"`` item with the same shape as the index array
+            is included.
+
         """
         if self.source_geo_def.size < neighbors:
             warnings.warn('Searching for %s neighbors in %s data points' %
                           (neighbors, self.source_geo_def.size), stacklevel=3)
 
+        if self.grid_lookup and mask is None and neighbors == 1:
+            grid_index_vectors = get_grid_index_vectors(self.source_geo_def, self.target_geo_def)
+            if grid_index_vectors is not None:
+                return self._get_grid_neighbor_info(*grid_index_vectors)
+
         # Create kd-tree
         chunks = mask.chunks if mask is not None else CHUNK_SIZE
         valid_input_idx, resample_kdtree = self._create_resample_kdtree(chunks=chunks)
@@ -218,12 +603,55 @@ class KDTreeNearestXarrayResampler(Resampler):
             if mask.shape != self.source_geo_def.shape:
                 raise ValueError("'mask' must be the same shape as the source geo definition")
             mask = mask.data
-        index_arr = self._query_resample_kdtree(
+        index_arr, distance_arr = self._query_resample_kdtree(
             resample_kdtree, target_lons, target_lats, valid_input_idx,
             valid_output_idx, mask,
             neighbors, radius_of_influence, epsilon)
 
-        return valid_input_idx, index_arr
+        neighbor_info = {
+            "valid_input_index": valid_input_idx,
+            "index_array": index_arr,
+        }
+        if distance_arr is not None:
+            neighbor_info["distance_array"] = distance_arr
+        return neighbor_info
+
+    def _get_grid_neighbor_info(self, rows, cols):
+        """Create neighbour info from the source rows and columns of aligned grids."""
+        y_chunks, x_chunks = da.core.normalize_chunks(CHUNK_SIZE, self.target_geo_def.shape, dtype=np.int64)
+        index_arr = da.blockwise(
+            _grid_index_array, 'jik',
+            da.from_array(rows, chunks=(y_chunks,)), 'j',
+            da.from_array(cols, chunks=(x_chunks,)), 'i',
+            source_width=self.source_geo_def.width,
+            new_axes={'k': 1}, dtype=np.int64,
+            meta=np.array((), dtype=np.int64))
+        # exclude source pixels with invalid lon/lats from the looked up indexes
+        source_lons, source_lats = self.source_geo_def.get_lonlats(chunks=CHUNK_SIZE)
+        source_valid = ((source_lons >= -180) & (source_lons <= 180) & (source_lats <= 90) & (source_lats >= -90))
+        source_valid = source_valid[np.maximum(rows, 0)][:, np.maximum(cols, 0)].rechunk((y_chunks, x_chunks))
+        index_arr = da.where(source_valid[:, :, np.newaxis], index_arr, -1)
+        # the looked up indexes are indexes of the full flattened source
+        valid_input_idx = da.ones(self.source_geo_def.shape, dtype=bool, chunks=CHUNK_SIZE)
+        return {
+            "valid_input_index": valid_input_idx,
+            "index_array": index_arr,
+        }
+
+    def _get_cached_neighbor_info(self, mask, neighbors, radius_of_influence, epsilon):
+        """Get neighbor info from the resampler's cache, computing and storing it if needed."""
+        if self.cache is None or mask is not None:
+            return self._get_neighbor_info(mask, neighbors, radius_of_influence, epsilon)
+
+        cache_key = self._get_hash(neighbors=neighbors,
+                                   radius_of_influence=float(radius_of_influence),
+                                   epsilon=float(epsilon),
+                                   grid_lookup=self.grid_lookup)
+        if cache_key not in self.cache:
+            neighbor_info = self._get_neighbor_info(
+                mask, neighbors, radius_of_influence, epsilon)
+            self.cache.store(cache_key, neighbor_info)
+        return self.cache.load(cache_key)
 
     def get_sample_from_neighbor_info(
             self,
@@ -231,7 +659,11 @@ class KDTreeNearestXarrayResampler(Resampler):
             valid_input_index,
             index_array,
             neighbors=1,
-            fill_value=np.nan):
+            fill_value=np.nan,
+            distance_array=None,
+            weight_type="nearest",
+            sigma=None,
+            power=1.0):
         """Get the pixels matching the target area.
 
         This method should work for any dimensionality of the provided data
@@ -252,13 +684,25 @@ class KDTreeNearestXarrayResampler(Resampler):
             valid_input_index (ArrayLike): Index array of valid pixels in
                 the input geolocation data.
             index_array (ArrayLike): Index array of nearest neighbors.
-            neighbors (int): Number of neighbors to return for each
-                data pixel. Currently only 1 (the default) is supported.
+            neighbors (int): Number of neighbors in ``index_array`` for each
+                target pixel.
             fill_value (float): Output fill value when no source data is
                 near the target pixel. When omitted, if the input data is an
                 integer array then the maximum value for that integer type is
                 used, but otherwise, NaN is used and can be detected in the
                 result with ``res.isnull()``.
+            distance_array (ArrayLike): Distance to each neighbor in
+                ``index_array``. Required when ``weight_type`` is not
+                ``"nearest"`` and more than one neighbor is used.
+            weight_type (str): How to combine multiple neighbors. One of
+                ``"nearest"`` (default, only the closest neighbor is used),
+                ``"idw"`` (inverse distance weighting, ``w = 1 / d^power``) or
+                ``"gauss"`` (gaussian weighting,
+                ``w = exp(-d^2 / sigma^2)``). Invalid (NaN) source values are
+                not included in the weighted result.
+            sigma (float): Gaussian weighting parameter in meters. Required
+                for ``"gauss"`` weighting.
+            power (float): Inverse distance weighting power. Defaults to 1.
 
         Returns:
             dask.array.Array: The resampled array. The dtype of the array will
@@ -272,12 +716,11 @@ class KDTreeNearestXarrayResampler(Resampler):
             logger.warning("Fill value incompatible with integer data "
                            "using {:d} instead.".format(fill_value))
 
-        # Convert back to 1 neighbor
-        if neighbors > 1:
-            raise NotImplementedError("Nearest neighbor resampling can not "
-                                      "handle more than 1 neighbor yet.")
-        # Convert from multiple neighbor shape to 1 neighbor
-        ia = index_array[:, :, 0]
+        # validate the weighting even if a single neighbor makes it unused
+        weight_func = _get_weight_func(weight_type, sigma, power)
+        use_weights = weight_func is not None and neighbors > 1
+        if use_weights and distance_array is None:
+            raise ValueError("'distance_array' is required for weighted resampling.")
         vii = valid_input_index
 
         src_geo_dims = self._get_src_geo_dims()
@@ -318,30 +761,39 @@ class KDTreeNearestXarrayResampler(Resampler):
         dst_dim_to_ind = src_dim_to_ind.copy()
         dst_dim_to_ind['y'] = i + 1
         dst_dim_to_ind['x'] = i + 2
-        # FUTURE: when we allow more than one neighbor
-        # neighbors_dim = i + 3
+        # the neighbors dimension is reduced by the weighting
+        neighbors_dim = i + 3
 
         new_data = data.data.reshape(flat_src_shape)
         vii = vii.ravel()
         dst_adims = [dst_dim_to_ind[dim] for dim in dst_dims]
         ia_adims = [dst_dim_to_ind[dim] for dim in dst_geo_dims]
-        # FUTURE: when we allow more than one neighbor add neighbors dimension
-        # dst_adims.append(neighbors_dim)
-        # ia_adims.append(neighbors_dim)
-        # FUTURE: when we allow more than one neighbor we need to add
-        #         the new axis to blockwise:
-        #         `new_axes={neighbor_dim: neighbors}`
         # FUTURE: if/when dask can handle index arrays that are dask arrays
         #         then we can avoid all of this complicated blockwise stuff
-        res = da.blockwise(
-            _my_index, dst_adims,
-            ia, ia_adims,
-            vii, flat_adim,
-            new_data, src_adims,
-            vii_slices=vii_slices, ia_slices=ia_slices,
-            fill_value=fill_value,
-            meta=np.array((), dtype=new_data.dtype),
-            dtype=new_data.dtype, concatenate=True)
+        if use_weights:
+            neighbor_adims = ia_adims + [neighbors_dim]
+            res = da.blockwise(
+                _my_weighted_index, dst_adims,
+                index_array, neighbor_adims,
+                distance_array, neighbor_adims,
+                vii, flat_adim,
+                new_data, src_adims,
+                vii_slices=vii_slices, ia_slices=ia_slices,
+                fill_value=fill_value, weight_func=weight_func,
+                meta=np.array((), dtype=new_data.dtype),
+                dtype=new_data.dtype, concatenate=True)
+        else:
+            # Convert from multiple neighbor shape to 1 neighbor
+            ia = index_array[:, :, 0]
+            res = da.blockwise(
+                _my_index, dst_adims,
+                ia, ia_adims,
+                vii, flat_adim,
+                new_data, src_adims,
+                vii_slices=vii_slices, ia_slices=ia_slices,
+                fill_value=fill_value,
+                meta=np.array((), dtype=new_data.dtype),
+                dtype=new_data.dtype, concatenate=True)
         res = DataArray(res, dims=dst_dims,
                         attrs=deepcopy(data.attrs))
         res = update_resampled_coords(data, res, self.target_geo_def)
@@ -377,9 +829,14 @@ class KDTreeNearestXarrayResampler(Resampler):
             src_geo_dims = ('y', 'x')
         return src_geo_dims
 
-    def precompute(self, mask=None, radius_of_influence=None, epsilon=0):
+    def precompute(self, mask=None, radius_of_influence=None, epsilon=0, neighbors=1):
         """Generate neighbor indexes using geolocation information and optional data mask.
 
+        If the resampler was created with a ``cache`` and no ``mask`` is
+        provided, the neighbor indexes are loaded from the cache when
+        available. Otherwise they are computed and stored in the cache which
+        requires computing them immediately.
+
         Args:
             mask (ArrayLike, optional):
                 Boolean array where True represents invalid pixels in the data
@@ -387,8 +844,8 @@ class KDTreeNearestXarrayResampler(Resampler):
                 computed by this method and used during resampling to filter
                 out invalid values and produce a result with more overall valid
                 pixels. If provided then pre-computed results will not be
-                cached as it is assumed that the mask will likely change for
-                every input array.
+                cached to the resampler's ``cache`` as it is assumed that the
+                mask will likely change for every input array.
             radius_of_influence (float, optional):
                 Cut off distance in geocentric meters.
                 If not provided this will be estimated based on the source
@@ -396,9 +853,12 @@ class KDTreeNearestXarrayResampler(Resampler):
             epsilon (float, optional):
                 Allowed uncertainty in meters. Increasing uncertainty
                 reduces execution time
+            neighbors (int, optional):
+                Number of neighbors to find for each target pixel. When more
+                than 1, the distances to the neighbors are also computed so
+                they can be used for weighting in :meth:`resample`.
 
         """
-        neighbors = 1
         if mask is not None and mask.shape != self.source_geo_def.shape:
             raise ValueError("'mask' provided to 'precompute' is not the same "
                              "shape as the source geometry.")
@@ -410,16 +870,13 @@ class KDTreeNearestXarrayResampler(Resampler):
         internal_cache_key = (mask_hash, neighbors, radius_of_influence, epsilon)
         in_int_cache = internal_cache_key in self._internal_cache
         if not in_int_cache:
-            valid_input_index, index_arr = self._get_neighbor_info(
+            item_to_cache = self._get_cached_neighbor_info(
                 mask, neighbors, radius_of_influence, epsilon)
-            item_to_cache = {
-                "valid_input_index": valid_input_index,
-                "index_array": index_arr,
-            }
             self._internal_cache[internal_cache_key] = item_to_cache
 
     def resample(self, data, mask_area=None, fill_value=np.nan,
-                 radius_of_influence=None, epsilon=0):
+                 radius_of_influence=None, epsilon=0, neighbors=1,
+                 weight_type="nearest", sigma=None, power=1.0):
         """Resample input ``data`` from the source geometry to the target geometry.
 
         Args:
@@ -444,6 +901,15 @@ class KDTreeNearestXarrayResampler(Resampler):
                 Passed directly to :meth:`precompute`.
             epsilon (float, optional):
                 Passed directly to :meth:`precompute`.
+            neighbors (int, optional):
+                Passed directly to :meth:`precompute`.
+            weight_type (str, optional):
+                How multiple neighbors are combined. See
+                :meth:`get_sample_from_neighbor_info` for possible values.
+            sigma (float, optional):
+                Passed directly to :meth:`get_sample_from_neighbor_info`.
+            power (float, optional):
+                Passed directly to :meth:`get_sample_from_neighbor_info`.
 
         Returns:
             Array-like object of the same type as ``data``, resampled to the
@@ -457,17 +923,23 @@ class KDTreeNearestXarrayResampler(Resampler):
         mask = self._get_area_mask(mask_area, new_data)
         if radius_of_influence is None:
             radius_of_influence = self._compute_radius_of_influence()
-        self.precompute(mask=mask, radius_of_influence=radius_of_influence, epsilon=epsilon)
+        self.precompute(mask=mask, radius_of_influence=radius_of_influence, epsilon=epsilon,
+                        neighbors=neighbors)
 
         # Get precomputed arrays - use dask array task name
         mask_hash = None if mask is None else mask.data.name
-        cache_key = (mask_hash, 1, radius_of_influence, epsilon)
+        cache_key = (mask_hash, neighbors, radius_of_influence, epsilon)
         precompute_dict = self._internal_cache[cache_key]
         result = self.get_sample_from_neighbor_info(
             new_data,
             precompute_dict["valid_input_index"],
             precompute_dict["index_array"],
-            fill_value=fill_value)
+            neighbors=neighbors,
+            fill_value=fill_value,
+            distance_array=precompute_dict.get("distance_array"),
+            weight_type=weight_type,
+            sigma=sigma,
+            power=power)
         return self._verify_result_object_type(result, data)
 
     def _verify_input_object_type(self, data):
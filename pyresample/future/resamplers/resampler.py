@@ -22,6 +22,7 @@ import abc
 import hashlib
 import json
 import logging
+import os
 from typing import TYPE_CHECKING, Optional, Union
 
 try:
@@ -221,15 +222,18 @@ class Resampler:
             target_geo_def:
                 Geolocation definition for the area to resample data to.
             cache:
-                :class:`~pyresample.cache.ResampleCache` instance used by
-                the resampler to cache.
+                :class:`~pyresample.future.resamplers.cache.ResampleCache`
+                instance used by the resampler to cache. If a string or path
+                is provided then a
+                :class:`~pyresample.future.resamplers.cache.ZarrResampleCache`
+                is created using it as the cache directory.
 
         """
         self.source_geo_def = source_geo_def
         self.target_geo_def = target_geo_def
-        if isinstance(cache, str):
-            # TODO: convenience for file based caching
-            raise NotImplementedError()
+        if isinstance(cache, (str, os.PathLike)):
+            from .cache import ZarrResampleCache
+            cache = ZarrResampleCache(cache)
         self.cache = cache
 
     @property
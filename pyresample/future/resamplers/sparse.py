@@ -0,0 +1,585 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Pyresample developers
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Resampling with a precomputed sparse matrix of weights.
+
+The "geometry to weights" step of the nearest neighbor, weighted neighbor,
+bilinear and EWA algorithms results in a linear operator mapping the source
+pixels to the target pixels. The :class:`SparseMatrixResampler` stores this
+operator as a :class:`scipy.sparse.csr_matrix` with one row for every target
+pixel and one column for every source pixel and applies it as a sparse
+matrix product. The weights only have to be computed once for a pair of
+geometries and can be saved to and loaded from disk.
+
+The ``weights_from_*`` functions convert the precomputed information of the
+other resamplers to such a matrix.
+
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+from functools import partial, reduce
+
+import numpy as np
+
+from pyresample import CHUNK_SIZE
+
+from .resampler import Resampler, update_resampled_coords
+
+try:
+    import scipy.sparse as sp
+except ImportError:
+    sp = None
+
+try:
+    import dask
+    import dask.array as da
+    from dask.base import tokenize
+    from dask.highlevelgraph import HighLevelGraph
+except ImportError:
+    da = None
+
+try:
+    from xarray import DataArray
+except ImportError:
+    DataArray = None
+
+logger = logging.getLogger(__name__)
+
+
+def weights_from_neighbor_info(valid_input_index, valid_output_index, index_array,
+                               distance_array=None, weight_func=None):
+    """Create the weight matrix from neighbor information.
+
+    The arguments match the results of
+    :func:`pyresample.kd_tree.get_neighbour_info`.
+
+    Args:
+        valid_input_index: Boolean array of the source pixels that were
+            searched for neighbors.
+        valid_output_index: Boolean array of the target pixels that were
+            searched for neighbors. ``None`` if all target pixels were
+            searched.
+        index_array: Neighbor indexes in the valid source pixels of every
+            searched target pixel with shape ``(num_searched,)`` or
+            ``(num_searched, neighbors)``. Negative indexes or indexes not
+            smaller than the number of valid source pixels mark missing
+            neighbors.
+        distance_array: Distances to the neighbors with the same shape as
+            ``index_array``. Only needed with ``weight_func``.
+        weight_func: Function computing the weights from the distances. If
+            not provided the (only) neighbor has a weight of 1.
+
+    Returns:
+        CSR matrix of shape ``(target_size, source_size)``.
+
+    """
+    valid_input_index = np.ravel(np.asarray(valid_input_index))
+    source_indexes = np.flatnonzero(valid_input_index)
+    index_array = np.asarray(index_array)
+    neighbors = 1 if index_array.ndim == 1 else index_array.shape[-1]
+    index_array = index_array.reshape(-1, neighbors)
+    if valid_output_index is None:
+        target_size = index_array.shape[0]
+        target_indexes = np.arange(target_size)
+    else:
+        valid_output_index = np.ravel(np.asarray(valid_output_index))
+        target_size = valid_output_index.size
+        target_indexes = np.flatnonzero(valid_output_index)
+
+    if weight_func is None:
+        if neighbors > 1:
+            raise ValueError("'weight_func' must be provided for more than one neighbor.")
+        weights = np.ones(index_array.shape)
+    else:
+        distance_array = np.asarray(distance_array, dtype=np.float64).reshape(index_array.shape)
+        weights = np.broadcast_to(weight_func(distance_array), index_array.shape)
+    valid = (index_array >= 0) & (index_array < source_indexes.size)
+    rows = np.broadcast_to(target_indexes[:, np.newaxis], index_array.shape)[valid]
+    cols = source_indexes[index_array[valid]]
+    return sp.csr_matrix((weights[valid].astype(np.float64), (rows, cols)),
+                         shape=(target_size, valid_input_index.size))
+
+
+def weights_from_bilinear_info(bilinear_s, bilinear_t, slices_y, slices_x, mask_slices,
+                               source_shape, target_size, valid_output_index=None):
+    """Create the weight matrix from the bilinear resampling look-up tables.
+
+    The arguments match the attributes of the bilinear resamplers in
+    :mod:`pyresample.bilinear` after calling their ``get_bil_info`` method.
+
+    Args:
+        bilinear_s: Horizontal fractional distances of every target pixel.
+        bilinear_t: Vertical fractional distances of every target pixel.
+        slices_y: Source rows of the four corners of every target pixel.
+        slices_x: Source columns of the four corners of every target pixel.
+        mask_slices: Boolean array marking invalid corners.
+        source_shape: Shape of the source geometry.
+        target_size: Number of pixels of the target geometry.
+        valid_output_index: Boolean array of the target pixels the look-up
+            tables were computed for. ``None`` if they cover all target pixels.
+
+    Returns:
+        CSR matrix of shape ``(target_size, source_size)``.
+
+    """
+    s__ = np.ravel(np.asarray(bilinear_s, dtype=np.float64))
+    t__ = np.ravel(np.asarray(bilinear_t, dtype=np.float64))
+    weights = np.stack(((1 - s__) * (1 - t__), s__ * (1 - t__), (1 - s__) * t__, s__ * t__), axis=1)
+    source_indexes = (np.asarray(slices_y, dtype=np.int64).reshape(-1, 4) * source_shape[-1] +
+                      np.asarray(slices_x, dtype=np.int64).reshape(-1, 4))
+    if valid_output_index is None:
+        target_indexes = np.arange(s__.size)
+    else:
+        target_indexes = np.flatnonzero(np.ravel(np.asarray(valid_output_index)))
+    valid = ~np.asarray(mask_slices).reshape(-1, 4) & np.isfinite(weights) & (weights != 0)
+    rows = np.broadcast_to(target_indexes[:, np.newaxis], weights.shape)[valid]
+    return sp.csr_matrix((weights[valid], (rows, source_indexes[valid])),
+                         shape=(target_size, int(np.prod(source_shape))))
+
+
+def weights_from_ewa(cols, rows, target_shape, rows_per_scan=None,
+                     weight_count=10000, weight_min=0.01, weight_distance_max=1.0,
+                     weight_delta_max=10.0, ewa_params=None):
+    """Create the weight matrix of the EWA algorithm.
+
+    Args:
+        cols: Column location of every source swath pixel (from
+            :func:`pyresample.ewa.ll2cr`).
+        rows: Row location of every source swath pixel (from
+            :func:`pyresample.ewa.ll2cr`).
+        target_shape: Shape of the target grid.
+        rows_per_scan: Number of swath rows of every scan. If not provided
+            the entire swath is treated as one scan.
+        weight_count: See :func:`pyresample.ewa.fornav`.
+        weight_min: See :func:`pyresample.ewa.fornav`.
+        weight_distance_max: See :func:`pyresample.ewa.fornav`.
+        weight_delta_max: See :func:`pyresample.ewa.fornav`.
+        ewa_params: Precomputed EWA parameters from
+            :func:`pyresample.ewa.ewa_parameters`.
+
+    Returns:
+        CSR matrix of shape ``(target_size, source_size)``.
+
+    """
+    from pyresample.ewa import _fornav
+
+    cols = np.ascontiguousarray(cols)
+    rows = np.ascontiguousarray(rows)
+    rows_per_scan = rows_per_scan or cols.shape[0]
+    grid_indexes, swath_indexes, weights = _fornav.ewa_weights_wrapper(
+        cols, rows, target_shape[0], target_shape[1], rows_per_scan,
+        weight_count=weight_count, weight_min=weight_min,
+        weight_distance_max=weight_distance_max, weight_delta_max=weight_delta_max,
+        ewa_params=ewa_params)
+    return sp.csr_matrix((weights, (grid_indexes, swath_indexes)),
+                         shape=(target_shape[0] * target_shape[1], cols.size))
+
+
+def _kdtree_weights(source_geo_def, target_geo_def, radius_of_influence, neighbours=1,
+                    epsilon=0, reduce_data=True, weight_func=None):
+    from pyresample.kd_tree import get_neighbour_info
+
+    neighbor_info = get_neighbour_info(source_geo_def, target_geo_def, radius_of_influence,
+                                       neighbours=neighbours, epsilon=epsilon,
+                                       reduce_data=reduce_data)
+    return weights_from_neighbor_info(*neighbor_info, weight_func=weight_func), 0.0
+
+
+def _nearest_weights(source_geo_def, target_geo_def, radius_of_influence, epsilon=0, reduce_data=True):
+    return _kdtree_weights(source_geo_def, target_geo_def, radius_of_influence,
+                           epsilon=epsilon, reduce_data=reduce_data)
+
+
+def _gauss_weights(source_geo_def, target_geo_def, radius_of_influence, sigma, neighbours=8,
+                   epsilon=0, reduce_data=True):
+    from .nearest import _gauss_weights as gauss_weight_func
+
+    return _kdtree_weights(source_geo_def, target_geo_def, radius_of_influence,
+                           neighbours=neighbours, epsilon=epsilon, reduce_data=reduce_data,
+                           weight_func=partial(gauss_weight_func, sigma=float(sigma)))
+
+
+def _custom_weights(source_geo_def, target_geo_def, radius_of_influence, weight_func, neighbours=8,
+                    epsilon=0, reduce_data=True):
+    return _kdtree_weights(source_geo_def, target_geo_def, radius_of_influence,
+                           neighbours=neighbours, epsilon=epsilon, reduce_data=reduce_data,
+                           weight_func=weight_func)
+
+
+def _bilinear_weights(source_geo_def, target_geo_def, radius_of_influence, neighbours=32,
+                      epsilon=0, reduce_data=True):
+    from pyresample.bilinear import NumpyBilinearResampler
+
+    resampler = NumpyBilinearResampler(source_geo_def, target_geo_def, radius_of_influence,
+                                       neighbours=neighbours, epsilon=epsilon,
+                                       reduce_data=reduce_data)
+    resampler.get_bil_info()
+    valid_output_index = getattr(resampler, "_valid_output_indices", None)
+    weights = weights_from_bilinear_info(
+        resampler.bilinear_s, resampler.bilinear_t, resampler.slices_y, resampler.slices_x,
+        resampler.mask_slices, source_geo_def.shape, target_geo_def.size,
+        valid_output_index=valid_output_index)
+    return weights, 0.0
+
+
+def _ewa_weights(source_geo_def, target_geo_def, rows_per_scan=None, weight_count=10000,
+                 weight_min=0.01, weight_distance_max=1.0, weight_delta_max=10.0, weight_sum_min=-1.0):
+    from pyresample.ewa import ll2cr
+
+    _, cols, rows = ll2cr(source_geo_def, target_geo_def)
+    weights = weights_from_ewa(cols, rows, target_geo_def.shape, rows_per_scan=rows_per_scan,
+                               weight_count=weight_count, weight_min=weight_min,
+                               weight_distance_max=weight_distance_max,
+                               weight_delta_max=weight_delta_max)
+    # same default as 'fornav'
+    if weight_sum_min == -1.0:
+        weight_sum_min = weight_min
+    return weights, weight_sum_min
+
+
+_WEIGHT_BUILDERS = {
+    "nearest": _nearest_weights,
+    "gauss": _gauss_weights,
+    "custom": _custom_weights,
+    "bilinear": _bilinear_weights,
+    "ewa": _ewa_weights,
+}
+
+
+def _source_block_lookup(chunks):
+    """Get the flat index of the block and the flat index inside the block of every source pixel."""
+    block_ids = np.zeros((), dtype=np.int64)
+    local_indexes = np.zeros((), dtype=np.int64)
+    for dim_chunks in chunks:
+        dim_chunks = np.asarray(dim_chunks, dtype=np.int64)
+        dim_blocks = np.repeat(np.arange(dim_chunks.size), dim_chunks)
+        dim_offsets = np.arange(dim_chunks.sum()) - np.repeat(np.cumsum(dim_chunks) - dim_chunks, dim_chunks)
+        block_ids = block_ids[..., np.newaxis] * dim_chunks.size + dim_blocks
+        local_indexes = local_indexes[..., np.newaxis] * dim_chunks[dim_blocks] + dim_offsets
+    return block_ids.ravel(), local_indexes.ravel()
+
+
+def _weight_sums(weights, data):
+    """Get the weighted sum of the valid values and the sum of their weights for every target pixel."""
+    values = data.reshape(-1, weights.shape[1]).T.astype(np.float64)
+    invalid = np.isnan(values)
+    if invalid.any():
+        values[invalid] = 0
+        weight_sum = weights @ (~invalid).astype(np.float64)
+    else:
+        weight_sum = (weights @ np.ones(weights.shape[1]))[:, np.newaxis]
+    return weights @ values, weight_sum
+
+
+def _sum_weight_sums(weight_sums):
+    value_sum = sum(value_sum for value_sum, _ in weight_sums)
+    weight_sum = sum(weight_sum for _, weight_sum in weight_sums)
+    return value_sum, weight_sum
+
+
+def _weighted_average(weight_sums, weight_sum_min, fill_value, dtype, shape):
+    value_sum, weight_sum = _sum_weight_sums(weight_sums)
+    weight_sum = np.broadcast_to(weight_sum, value_sum.shape)
+    valid = (weight_sum > 0) & (weight_sum >= weight_sum_min)
+    res = np.full(value_sum.shape, fill_value, dtype=np.float64)
+    np.divide(value_sum, weight_sum, out=res, where=valid)
+    return res.T.reshape(shape).astype(dtype)
+
+
+class SparseMatrixResampler(Resampler):
+    """Resampler applying a precomputed sparse matrix of weights.
+
+    Every target pixel is the weighted average of the valid (not NaN) source
+    pixels in its row of the weight matrix. Target pixels where the sum of
+    the weights of the valid source pixels is not larger than 0 or smaller
+    than ``weight_sum_min`` are set to the fill value. Contrary to the
+    bilinear resamplers, a target pixel with an invalid corner is the
+    weighted average of its valid corners. The maximum weight mode of the
+    EWA algorithm can't be represented by a weight matrix.
+
+    The weights are computed with :meth:`precompute`, provided on creation
+    or loaded with :meth:`load_resampling_info`.
+
+    """
+
+    def __init__(self, source_geo_def, target_geo_def, cache=None,
+                 weights=None, weight_sum_min=0.0):
+        """Initialize resampler with geolocation information and optionally the weights.
+
+        Args:
+            source_geo_def: Geolocation definition of the data to be
+                resampled.
+            target_geo_def: Geolocation definition of the area to resample
+                data to.
+            cache: Cache for the weight matrix computed by
+                :meth:`precompute`. See
+                :class:`~pyresample.future.resamplers.resampler.Resampler`.
+            weights: Sparse matrix of shape ``(target_size, source_size)``.
+            weight_sum_min: Minimum sum of the weights of the valid source
+                pixels of a target pixel.
+
+        """
+        if sp is None:
+            raise ImportError("Missing 'scipy' dependency")
+        super().__init__(source_geo_def, target_geo_def, cache=cache)
+        if self.target_geo_def.ndim != 2:
+            raise ValueError("Target area definition must be 2 dimensions")
+        self.weights = None
+        self.weight_sum_min = weight_sum_min
+        self._block_weights: dict[tuple, dict] = {}
+        if weights is not None:
+            self.set_weights(weights, weight_sum_min=weight_sum_min)
+
+    @property
+    def version(self) -> str:
+        """Get the current version of this class used for hashing and caching."""
+        return "0.1"
+
+    def set_weights(self, weights, weight_sum_min=0.0):
+        """Set the weight matrix of shape ``(target_size, source_size)``."""
+        weights = sp.csr_matrix(weights)
+        expected_shape = (self.target_geo_def.size, self.source_geo_def.size)
+        if weights.shape != expected_shape:
+            raise ValueError(f"Weight matrix shape {weights.shape} does not match "
+                             f"the geometries {expected_shape}")
+        weights.sum_duplicates()
+        self.weights = weights
+        self.weight_sum_min = weight_sum_min
+        self._block_weights = {}
+
+    def precompute(self, method="nearest", **kwargs):
+        """Compute the weight matrix with one of the supported algorithms.
+
+        If the resampler was created with a ``cache`` the weights are loaded
+        from the cache when available and stored in it otherwise.
+
+        Args:
+            method: The algorithm to compute the weights with:
+
+                * ``"nearest"``: nearest neighbor with :mod:`pyresample.kd_tree`.
+                  Requires ``radius_of_influence``, accepts ``epsilon`` and
+                  ``reduce_data``.
+                * ``"gauss"``: Gaussian weighting of the neighbors like
+                  :func:`pyresample.kd_tree.resample_gauss`. Requires
+                  ``radius_of_influence`` and ``sigma``, accepts
+                  ``neighbours`` (default 8), ``epsilon`` and ``reduce_data``.
+                * ``"custom"``: weighting of the neighbors with the
+                  ``weight_func`` function like
+                  :func:`pyresample.kd_tree.resample_custom`. Takes the same
+                  arguments as ``"gauss"`` with ``weight_func`` instead of
+                  ``sigma``. These weights are never cached.
+                * ``"bilinear"``: bilinear interpolation with
+                  :class:`pyresample.bilinear.NumpyBilinearResampler`.
+                  Requires ``radius_of_influence``, accepts ``neighbours``
+                  (default 32), ``epsilon`` and ``reduce_data``.
+                * ``"ewa"``: elliptical weighted averaging of a swath with
+                  :mod:`pyresample.ewa`. Accepts ``rows_per_scan`` and the
+                  weight arguments of :func:`pyresample.ewa.fornav`.
+
+            kwargs: Arguments of the algorithm.
+
+        """
+        try:
+            builder = _WEIGHT_BUILDERS[method]
+        except KeyError:
+            raise ValueError(f"Unknown method '{method}'. Must be one of "
+                             f"{', '.join(repr(name) for name in _WEIGHT_BUILDERS)}.") from None
+        cache_key = self._get_cache_key(method, kwargs)
+        if cache_key is not None and cache_key in self.cache:
+            self._set_weights_from_arrays(self.cache.load(cache_key))
+            return
+        self.set_weights(*builder(self.source_geo_def, self.target_geo_def, **kwargs))
+        if cache_key is not None:
+            self.cache.store(cache_key, self._weights_as_arrays())
+
+    def _get_cache_key(self, method, kwargs):
+        if self.cache is None:
+            return None
+        try:
+            return self._get_hash(method=method, **kwargs)
+        except TypeError:
+            logger.debug("Weights of the '%s' method can't be cached", method)
+            return None
+
+    def _weights_as_arrays(self):
+        return {
+            "data": self.weights.data,
+            "indices": self.weights.indices,
+            "indptr": self.weights.indptr,
+            "weight_sum_min": np.array([self.weight_sum_min], dtype=np.float64),
+        }
+
+    def _set_weights_from_arrays(self, arrays):
+        arrays = {name: np.asarray(arr) for name, arr in arrays.items()}
+        shape = (self.target_geo_def.size, self.source_geo_def.size)
+        weights = sp.csr_matrix((arrays["data"], arrays["indices"], arrays["indptr"]), shape=shape)
+        self.set_weights(weights, weight_sum_min=float(arrays["weight_sum_min"][0]))
+
+    def save_resampling_info(self, filename):
+        """Save the weight matrix to a numpy ``.npz`` file."""
+        if self.weights is None:
+            raise ValueError("No weights to save. Call 'precompute' first.")
+        np.savez(filename, **self._weights_as_arrays())
+
+    def load_resampling_info(self, filename):
+        """Load the weight matrix from a numpy ``.npz`` file written by :meth:`save_resampling_info`."""
+        with np.load(filename) as arrays:
+            self._set_weights_from_arrays(arrays)
+
+    def resample(self, data, fill_value=np.nan, chunks=None, **kwargs):
+        """Resample input ``data`` from the source geometry to the target geometry.
+
+        Args:
+            data (ArrayLike): Data to be resampled. The last dimensions must
+                be the dimensions of the source geometry (``y`` and ``x`` for
+                DataArrays of 2D geometries). All other dimensions (bands,
+                time, levels, etc) are resampled in the same sparse matrix
+                product.
+            fill_value (int or float): Output value of target pixels without
+                valid source data.
+            chunks: Chunk size of the ``y`` and ``x`` dimensions of the
+                result for dask array input. Defaults to
+                ``pyresample.CHUNK_SIZE``.
+            kwargs: Passed to :meth:`precompute` if no weights were computed
+                or loaded yet.
+
+        Returns:
+            Array-like object of the same type as ``data``, resampled to the
+            target geometry. Integer data is resampled to floating point.
+
+        """
+        if self.weights is None:
+            self.precompute(**kwargs)
+        xr_obj = None
+        if DataArray is not None and isinstance(data, DataArray):
+            xr_obj = self._get_geo_dims_last(data)
+            data = xr_obj.data
+        geo_shape = self.source_geo_def.shape
+        num_leading = data.ndim - len(geo_shape)
+        if num_leading < 0 or data.shape[num_leading:] != geo_shape:
+            raise ValueError("The last dimensions of the data must match the source geometry.")
+        if da is not None and isinstance(data, da.Array):
+            res = self._resample_dask(data, fill_value, chunks)
+        else:
+            data = np.asarray(data)
+            shape = data.shape[:num_leading] + self.target_geo_def.shape
+            res = _weighted_average([_weight_sums(self.weights, data)], self.weight_sum_min,
+                                    fill_value, _result_dtype(data.dtype), shape)
+        if xr_obj is None:
+            return res
+        dims = tuple(xr_obj.dims[:num_leading]) + ('y', 'x')
+        res = DataArray(res, dims=dims, attrs=xr_obj.attrs.copy())
+        return update_resampled_coords(xr_obj, res, self.target_geo_def)
+
+    def _get_geo_dims_last(self, data):
+        if self.source_geo_def.ndim == 1:
+            return data
+        if 'y' not in data.dims or 'x' not in data.dims:
+            raise ValueError("Data must have 'y' and 'x' dimensions.")
+        return data.transpose(..., 'y', 'x')
+
+    def _resample_dask(self, data, fill_value, chunks):
+        num_leading = data.ndim - self.source_geo_def.ndim
+        leading_shape = data.shape[:num_leading]
+        # all non-spatial dimensions go in to the same matrix product
+        data = data.rechunk({dim_idx: -1 for dim_idx in range(num_leading)})
+        dtype = _result_dtype(data.dtype)
+        out_chunks = da.core.normalize_chunks(CHUNK_SIZE if chunks is None else chunks,
+                                              shape=self.target_geo_def.shape, dtype=dtype)
+        block_weights = self._get_block_weights(data.chunks[num_leading:], out_chunks)
+
+        token = tokenize(data.name, self._weights_token, out_chunks, fill_value)
+        sums_name = f"sparse-sums-{token}"
+        combine_name = f"sparse-combine-{token}"
+        output_name = f"sparse-resample-{token}"
+        split_every = dask.config.get('split_every', 4)
+        leading_idx = (0,) * num_leading
+        dsk = {}
+        for out_idx, blocks in block_weights.items():
+            out_key = (output_name,) + leading_idx + out_idx
+            shape = leading_shape + tuple(dim_chunks[idx] for dim_chunks, idx in zip(out_chunks, out_idx))
+            if not blocks:
+                dsk[out_key] = (np.full, shape, fill_value, dtype)
+                continue
+            keys = []
+            for in_idx, sub_weights in blocks:
+                key = (sums_name,) + out_idx + in_idx
+                dsk[key] = (_weight_sums, sub_weights, (data.name,) + leading_idx + in_idx)
+                keys.append(key)
+            depth = 0
+            while len(keys) > split_every:
+                combined_keys = []
+                for start_idx in range(0, len(keys), split_every):
+                    key = (combine_name, depth, start_idx // split_every) + out_idx
+                    dsk[key] = (_sum_weight_sums, keys[start_idx:start_idx + split_every])
+                    combined_keys.append(key)
+                keys = combined_keys
+                depth += 1
+            dsk[out_key] = (_weighted_average, keys, self.weight_sum_min, fill_value, dtype, shape)
+
+        graph = HighLevelGraph.from_collections(output_name, dsk, dependencies=[data])
+        leading_chunks = tuple((dim_size,) for dim_size in leading_shape)
+        return da.Array(graph, output_name, leading_chunks + out_chunks, dtype=dtype,
+                        meta=np.array((), dtype=dtype))
+
+    @property
+    def _weights_token(self):
+        return tokenize(self.weights.data, self.weights.indices, self.weights.indptr,
+                        self.weights.shape, self.weight_sum_min)
+
+    def _get_block_weights(self, source_chunks, out_chunks):
+        """Split the weights in to one matrix for every output chunk and source block pair with weights.
+
+        Returns:
+            Dictionary mapping every output chunk index to a list of the
+            source block indexes and their weights.
+
+        """
+        cache_key = (source_chunks, out_chunks)
+        if cache_key in self._block_weights:
+            return self._block_weights[cache_key]
+        block_ids, local_indexes = _source_block_lookup(source_chunks)
+        num_blocks = tuple(len(dim_chunks) for dim_chunks in source_chunks)
+        block_sizes = reduce(np.multiply.outer, [np.asarray(dim_chunks) for dim_chunks in source_chunks]).ravel()
+        out_starts = [np.cumsum((0,) + dim_chunks) for dim_chunks in out_chunks]
+
+        block_weights = {}
+        for out_idx in itertools.product(*(range(len(dim_chunks)) for dim_chunks in out_chunks)):
+            target_ranges = [np.arange(starts[idx], starts[idx + 1]) for starts, idx in zip(out_starts, out_idx)]
+            target_indexes = np.ravel_multi_index(np.ix_(*target_ranges), self.target_geo_def.shape).ravel()
+            chunk_weights = self.weights[target_indexes].tocoo()
+            weight_blocks = block_ids[chunk_weights.col]
+            order = np.argsort(weight_blocks, kind="stable")
+            block_starts = np.flatnonzero(np.diff(weight_blocks[order], prepend=-1))
+            blocks = []
+            for block_id, indexes in zip(weight_blocks[order[block_starts]],
+                                         np.split(order, block_starts[1:])):
+                sub_weights = sp.csr_matrix(
+                    (chunk_weights.data[indexes],
+                     (chunk_weights.row[indexes], local_indexes[chunk_weights.col[indexes]])),
+                    shape=(target_indexes.size, block_sizes[block_id]))
+                in_idx = tuple(int(idx) for idx in np.unravel_index(block_id, num_blocks))
+                blocks.append((in_idx, sub_weights))
+            block_weights[out_idx] = blocks
+        self._block_weights[cache_key] = block_weights
+        return block_weights
+
+
+def _result_dtype(dtype):
+    return np.result_type(dtype, np.float32)
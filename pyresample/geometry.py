@@ -34,7 +34,10 @@ import yaml
 from pyproj import Geod, Proj
 from pyproj.aoi import AreaOfUse
 
+import pyresample
 from pyresample import CHUNK_SIZE
+from pyresample._caching import lonlat_cache
+from pyresample._hashing import get_hash_method
 from pyresample._spatial_mp import Cartesian, Cartesian_MP, Proj_MP
 from pyresample.area_config import create_area_def
 from pyresample.boundary import SimpleBoundary
@@ -115,6 +118,7 @@ class BaseDefinition:
         self.ndim = None
         self.cartesian_coords = None
         self.hash = None
+        self._coord_digests = None
 
     def __getitem__(self, key):
         """Slice a 2D geographic definition."""
@@ -132,17 +136,39 @@ class BaseDefinition:
         return self.hash
 
     def update_hash(self, existing_hash: Optional[_Hash] = None) -> _Hash:
-        """Update the hash."""
+        """Update the hash.
+
+        How numpy coordinate arrays are hashed is controlled by the
+        ``geometry_hash_method`` configuration option. Except for the default
+        ``"sha1"`` method, the digests of the arrays are computed once and
+        stored on the definition, so the arrays should not be modified in
+        place afterwards.
+        """
         if existing_hash is None:
             existing_hash = hashlib.sha1()  # nosec: B324
-        existing_hash.update(get_array_hashable(self.lons))
-        existing_hash.update(get_array_hashable(self.lats))
+        for coord_hashable in self._get_coord_hashables():
+            existing_hash.update(coord_hashable)
+        return existing_hash
+
+    def _get_coord_arrays(self):
+        coord_arrays = [self.lons, self.lats]
         try:
             if self.lons.mask is not False:
-                existing_hash.update(get_array_hashable(self.lons.mask))
+                coord_arrays.append(self.lons.mask)
         except AttributeError:
             pass
-        return existing_hash
+        return coord_arrays
+
+    def _get_coord_hashables(self):
+        method = pyresample.config.get("geometry_hash_method", "sha1")
+        hash_func = get_hash_method(method)
+        if hash_func is None:
+            return [get_array_hashable(arr) for arr in self._get_coord_arrays()]
+        if self._coord_digests is None or self._coord_digests[0] != method:
+            digests = [hash_func(arr_hashable, self.nprocs) if isinstance(arr_hashable, np.ndarray) else arr_hashable
+                       for arr_hashable in map(_get_lazy_array_hashable, self._get_coord_arrays())]
+            self._coord_digests = (method, digests)
+        return self._coord_digests[1]
 
     def __eq__(self, other):
         """Test for approximate equality."""
@@ -793,6 +819,17 @@ class GridDefinition(CoordinateDefinition):
             raise ValueError('2 dimensional lon lat grid expected')
 
 
+def _get_lazy_array_hashable(arr):
+    """Get the hashable of a dask based array or the numpy array itself."""
+    if isinstance(arr, DataArray) and np.ndarray is not DataArray:
+        if 'hash' in arr.attrs:
+            return arr.attrs['hash']
+        arr = arr.data
+    if hasattr(arr, 'name') and isinstance(arr.name, str):
+        return arr.name.encode('utf-8')
+    return np.asanyarray(arr)
+
+
 def get_array_hashable(arr):
     """Compute a hashable form of the array `arr`.
 
@@ -1350,6 +1387,52 @@ def _invproj(data_x, data_y, proj_wkt):
     return np.stack([lon.astype(data_x.dtype), lat.astype(data_y.dtype)])
 
 
+def _has_separable_lonlats(crs):
+    """Check if longitudes only depend on X and latitudes only on Y for a CRS.
+
+    This is the case for (non-rotated) geographic CRSs and for the
+    equidistant cylindrical (plate carrée) projection.
+
+    """
+    if crs.is_geographic:
+        return not crs.is_derived
+    coord_op = crs.coordinate_operation
+    if coord_op is None:
+        return False
+    return coord_op.method_name in ("Equidistant Cylindrical", "Equidistant Cylindrical (Spherical)")
+
+
+def _invproj_separable_vectors(x, y, crs):
+    """Inverse project 1D X and Y vectors of a separable CRS to lon and lat vectors."""
+    gcrs = get_geodetic_crs_with_no_datum_shift(crs)
+    transformer = pyproj.Transformer.from_crs(gcrs, crs, always_xy=True)
+    lon_vec, _ = transformer.transform(x, np.full_like(y, y[y.size // 2], shape=x.shape),
+                                       direction=TransformDirection.INVERSE)
+    _, lat_vec = transformer.transform(np.full_like(x, x[x.size // 2], shape=y.shape), y,
+                                       direction=TransformDirection.INVERSE)
+    return np.asarray(lon_vec), np.asarray(lat_vec)
+
+
+def _broadcast_lonlats(lon_vec, lat_vec):
+    """Broadcast lon and lat vectors to writable 2D arrays.
+
+    Broadcasting alone would only use the memory of the vectors, but the
+    views are read-only and every element of a row (or column) shares the
+    same memory. ``get_lonlats`` has always returned independent writable
+    arrays that users modify in place (ex. masking invalid pixels), so the
+    views are copied.
+
+    """
+    shape = (lat_vec.size, lon_vec.size)
+    lons = np.broadcast_to(lon_vec[np.newaxis, :], shape).copy()
+    lats = np.broadcast_to(lat_vec[:, np.newaxis], shape).copy()
+    return lons, lats
+
+
+def _stack_broadcast_lonlats(lon_vec, lat_vec):
+    return np.stack(_broadcast_lonlats(lon_vec, lat_vec))
+
+
 def _generate_2d_coords(pixel_size_x, pixel_size_y, pixel_upper_left_x, pixel_upper_left_y,
                         chunks, dtype, block_info=None):
     start_y_idx = block_info[None]["array-location"][1][0]
@@ -2576,6 +2659,13 @@ class AreaDefinition(_ProjectionDefinition):
         -------
         (lons, lats) : tuple of numpy arrays
             Grids of area lons and and lats
+
+        If the ``cache_lonlats`` configuration option is enabled, results for
+        the whole area are stored in a process-wide cache keyed by the hash of
+        the area, ``chunks``, and ``dtype``. Later calls with the same
+        arguments, including calls on other instances of an equal area, return
+        the same (read-only for numpy) arrays without projecting the
+        coordinates again.
         """
         if cache:
             warnings.warn("'cache' keyword argument will be removed in the "
@@ -2592,6 +2682,70 @@ class AreaDefinition(_ProjectionDefinition):
                 lats = lats[data_slice]
             return lons, lats
 
+        if data_slice is not None or not pyresample.config.get("cache_lonlats", False):
+            return self._get_lonlats(nprocs, data_slice, cache, dtype, chunks)
+
+        cache_key = (hash(self), str(chunks), np.dtype(dtype).str)
+        cached_lonlats = lonlat_cache.get(cache_key)
+        if cached_lonlats is not None:
+            return cached_lonlats
+        lons, lats = self._get_lonlats(nprocs, data_slice, cache, dtype, chunks)
+        return lonlat_cache.put(cache_key, lons, lats)
+
+    def _get_lonlats(self, nprocs, data_slice, cache, dtype, chunks):
+        if _has_separable_lonlats(self.crs):
+            lons, lats = self._get_separable_lonlats(nprocs, data_slice, dtype, chunks)
+        else:
+            lons, lats = self._get_projected_lonlats(nprocs, data_slice, dtype, chunks)
+
+        if cache and data_slice is None and not hasattr(lons, 'chunks'):
+            # Cache the result if requested
+            self.lons = lons
+            self.lats = lats
+
+        return lons, lats
+
+    def _get_separable_lonlats(self, nprocs, data_slice, dtype, chunks):
+        """Get lons/lats for CRSs where lons only depend on X and lats only on Y.
+
+        Only the 1D projection vectors are transformed and then broadcast to
+        2D instead of transforming every pixel of the area. The transformation
+        of ``height + width`` values is cheap so ``nprocs`` isn't used. The
+        returned numpy arrays are writable copies of the broadcast vectors
+        and use as much memory as the per-pixel transformation, only the
+        dask task graph is limited to the two vectors.
+
+        """
+        if nprocs is not None and chunks is not None:
+            raise ValueError("Can't specify 'nprocs' and 'chunks' at the same time")
+        x, y = self._get_proj_vectors(dtype=dtype)
+        lon_vec, lat_vec = _invproj_separable_vectors(x, y, self.crs)
+        lon_vec = lon_vec.astype(dtype)
+        lat_vec = lat_vec.astype(dtype)
+        y_slice, x_slice = self._get_yx_data_slice(data_slice)
+        if chunks is None:
+            if y_slice is not None:
+                # same shapes as 'get_proj_coords' for integer slices
+                lon_vec = np.atleast_1d(lon_vec[x_slice])
+                lat_vec = np.atleast_1d(lat_vec[y_slice])
+            return _broadcast_lonlats(lon_vec, lat_vec)
+
+        y_chunks, x_chunks = _chunks_to_yx_chunks(chunks)
+        norm_y_chunks, norm_x_chunks = da.core.normalize_chunks((y_chunks, x_chunks), self.shape, dtype=dtype)
+        lon_vec = da.from_array(lon_vec, chunks=(norm_x_chunks,))
+        lat_vec = da.from_array(lat_vec, chunks=(norm_y_chunks,))
+        res = da.blockwise(_stack_broadcast_lonlats, 'cji',
+                           lon_vec, 'i', lat_vec, 'j',
+                           new_axes={'c': 2},
+                           meta=np.array((), dtype=dtype),
+                           dtype=dtype)
+        lons, lats = res[0], res[1]
+        if y_slice is not None:
+            lons = lons[y_slice, x_slice]
+            lats = lats[y_slice, x_slice]
+        return lons, lats
+
+    def _get_projected_lonlats(self, nprocs, data_slice, dtype, chunks):
         # Get X/Y coordinates for the whole area
         target_x, target_y = self.get_proj_coords(data_slice=data_slice, chunks=chunks, dtype=dtype)
         if nprocs is None and not hasattr(target_x, 'chunks'):
@@ -2627,12 +2781,6 @@ class AreaDefinition(_ProjectionDefinition):
         lons, lats = target_proj(target_x, target_y, **proj_kwargs)
         lons = np.asanyarray(lons, dtype=dtype)
         lats = np.asanyarray(lats, dtype=dtype)
-
-        if cache and data_slice is None:
-            # Cache the result if requested
-            self.lons = lons
-            self.lats = lats
-
         return lons, lats
 
     @property
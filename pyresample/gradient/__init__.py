@@ -34,14 +34,19 @@ import numpy as np
 import pyproj
 import xarray as xr
 from shapely.geometry import Polygon
+from shapely.strtree import STRtree
 
 from pyresample import CHUNK_SIZE
+from pyresample._caching import LRUCache
 from pyresample.geometry import AreaDefinition, SwathDefinition, get_geostationary_bounding_box_in_lonlats
 from pyresample.gradient._gradient_search import one_step_gradient_indices, one_step_gradient_search
 from pyresample.resampler import BaseResampler, resample_blocks
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_MAPPINGS_CACHE_SIZE = 16
+_chunk_mappings_cache = LRUCache(_CHUNK_MAPPINGS_CACHE_SIZE)
+
 
 def GradientSearchResampler(source_geo_def, target_geo_def):
     """Create a gradient search resampler."""
@@ -156,9 +161,30 @@ class StackingGradientSearchResampler(BaseResampler):
         return dst_poly
 
     def get_chunk_mappings(self):
-        """Map source and target chunks together if they overlap."""
+        """Map source and target chunks together if they overlap.
+
+        The mappings are cached for the pair of geometries and their
+        chunking, so creating another resampler for the same geometries does
+        not need to compute the chunk polygons again.
+        """
+        cache_key = (hash(self.source_geo_def), hash(self.target_geo_def),
+                     self.src_x.chunks, self.dst_x.chunks)
+        mappings = _chunk_mappings_cache.get(cache_key)
+        if mappings is None:
+            mappings = self._get_chunk_mappings()
+            _chunk_mappings_cache.put(cache_key, mappings)
+        (self.src_slices, self.dst_slices,
+         self.dst_mosaic_locations, self.coverage_status) = (list(mapping) for mapping in mappings)
+
+    def _get_chunk_mappings(self):
+        """Check which source and target chunks overlap.
+
+        The target chunk polygons are put in a spatial index once so every
+        source chunk is only compared to the target chunks near it.
+        """
         src_y_chunks, src_x_chunks = self.src_x.chunks
-        dst_y_chunks, dst_x_chunks = self.dst_x.chunks
+        dst_slices_per_chunk, dst_locations_per_chunk, dst_polys = self._get_dst_chunks()
+        dst_index = _PolygonIndex(dst_polys)
 
         coverage_status = []
         src_slices, dst_slices = [], []
@@ -174,35 +200,34 @@ class StackingGradientSearchResampler(BaseResampler):
                 src_poly = self._get_src_poly(src_y_start, src_y_end,
                                               src_x_start, src_x_end)
 
-                dst_x_start = 0
-                for x_step_number, dst_x_step in enumerate(dst_x_chunks):
-                    dst_x_end = dst_x_start + dst_x_step
-                    dst_y_start = 0
-                    for y_step_number, dst_y_step in enumerate(dst_y_chunks):
-                        dst_y_end = dst_y_start + dst_y_step
-                        # Get destination chunk polygon
-                        dst_poly = self._get_dst_poly((x_step_number, y_step_number),
-                                                      dst_x_start, dst_x_end,
-                                                      dst_y_start, dst_y_end)
-
-                        covers = check_overlap(src_poly, dst_poly)
-
-                        coverage_status.append(covers)
-                        src_slices.append((src_y_start, src_y_end,
-                                           src_x_start, src_x_end))
-                        dst_slices.append((dst_y_start, dst_y_end,
-                                           dst_x_start, dst_x_end))
-                        dst_mosaic_locations.append((x_step_number, y_step_number))
-
-                        dst_y_start = dst_y_end
-                    dst_x_start = dst_x_end
+                coverage_status.extend(dst_index.overlaps(src_poly))
+                src_slices.extend([(src_y_start, src_y_end, src_x_start, src_x_end)] * len(dst_polys))
+                dst_slices.extend(dst_slices_per_chunk)
+                dst_mosaic_locations.extend(dst_locations_per_chunk)
                 src_y_start = src_y_end
             src_x_start = src_x_end
+        return src_slices, dst_slices, dst_mosaic_locations, coverage_status
 
-        self.src_slices = src_slices
-        self.dst_slices = dst_slices
-        self.dst_mosaic_locations = dst_mosaic_locations
-        self.coverage_status = coverage_status
+    def _get_dst_chunks(self):
+        """Get the slices, mosaic locations and polygons of all target chunks."""
+        dst_y_chunks, dst_x_chunks = self.dst_x.chunks
+        dst_slices, dst_mosaic_locations, dst_polys = [], [], []
+        dst_x_start = 0
+        for x_step_number, dst_x_step in enumerate(dst_x_chunks):
+            dst_x_end = dst_x_start + dst_x_step
+            dst_y_start = 0
+            for y_step_number, dst_y_step in enumerate(dst_y_chunks):
+                dst_y_end = dst_y_start + dst_y_step
+                # Get destination chunk polygon
+                dst_polys.append(self._get_dst_poly((x_step_number, y_step_number),
+                                                    dst_x_start, dst_x_end,
+                                                    dst_y_start, dst_y_end))
+                dst_slices.append((dst_y_start, dst_y_end,
+                                   dst_x_start, dst_x_end))
+                dst_mosaic_locations.append((x_step_number, y_step_number))
+                dst_y_start = dst_y_end
+            dst_x_start = dst_x_end
+        return dst_slices, dst_mosaic_locations, dst_polys
 
     def _filter_data(self, data, is_src=True, add_dim=False):
         """Filter unused chunks from the given array."""
@@ -291,6 +316,28 @@ class StackingGradientSearchResampler(BaseResampler):
         return res
 
 
+class _PolygonIndex:
+    """Spatial index of target chunk polygons following the rules of :func:`check_overlap`."""
+
+    def __init__(self, polys):
+        self.polys = polys
+        # False means a SwathDefinition which always overlaps
+        self._always_overlaps = np.array([poly is False for poly in polys], dtype=bool)
+        self._tree_poly_indices = np.array([idx for idx, poly in enumerate(polys)
+                                            if poly is not None and poly is not False], dtype=np.int64)
+        self._tree = STRtree([polys[idx] for idx in self._tree_poly_indices])
+
+    def overlaps(self, src_poly):
+        """Check which of the indexed polygons overlap ``src_poly``."""
+        if src_poly is False:
+            return [True] * len(self.polys)
+        covers = self._always_overlaps.copy()
+        if src_poly is not None and self._tree_poly_indices.size:
+            tree_indices = self._tree.query(src_poly, predicate="intersects")
+            covers[self._tree_poly_indices[tree_indices]] = True
+        return covers.tolist()
+
+
 def check_overlap(src_poly, dst_poly):
     """Check if the two polygons overlap."""
     # swath definition case
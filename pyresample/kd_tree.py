@@ -24,6 +24,7 @@ from __future__ import annotations
 import sys
 import types
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from logging import getLogger
 from typing import Any
@@ -35,7 +36,14 @@ from pykdtree.kdtree import KDTree
 from pyresample import CHUNK_SIZE, _spatial_mp, data_reduce, geometry
 
 from .future.resamplers._transform_utils import lonlat2xyz
-from .future.resamplers.nearest import _my_index, query_no_distance
+from .future.resamplers.nearest import (
+    DelayedPartitionedKDTree,
+    _my_index,
+    _rechunk_rows,
+    create_partitioned_kdtree,
+    query_no_distance,
+    query_partitioned_kdtree,
+)
 from .utils.row_appendable_array import RowAppendableArray
 
 logger = getLogger(__name__)
@@ -56,6 +64,10 @@ except ImportError:
 if sys.version >= '3':
     long = int
 
+# Default number of (target pixel, neighbour) pairs weighted at once by each
+# thread in 'get_sample_from_neighbour_info'
+_NEIGHBOUR_BLOCK_ELEMENTS = 2 ** 22
+
 
 class EmptyResult(ValueError):
     """No valid data is produced."""
@@ -275,7 +287,8 @@ def _resample(source_geo_def, data, target_geo_def, resample_type,
                                           distance_array=distance_array,
                                           weight_funcs=weight_funcs,
                                           fill_value=fill_value,
-                                          with_uncert=with_uncert)
+                                          with_uncert=with_uncert,
+                                          nprocs=nprocs)
 
 
 def get_neighbour_info(source_geo_def, target_geo_def, radius_of_influence,
@@ -300,7 +313,9 @@ def get_neighbour_info(source_geo_def, target_geo_def, radius_of_influence,
         Perform initial coarse reduction of source dataset in order
         to reduce execution time
     nprocs : int, optional
-        Number of processor cores to be used
+        Number of processor cores to be used. When larger than 1 the
+        kd-tree is a single SciPy kd-tree queried from ``nprocs`` threads
+        (requires scipy).
     segments : int or None
         Number of segments to use when resampling.
         If set to None an estimate will be calculated
@@ -567,7 +582,8 @@ def get_sample_from_neighbour_info(resample_type, output_shape, data,
                                    valid_input_index, valid_output_index,
                                    index_array, distance_array=None,
                                    weight_funcs=None, fill_value=0,
-                                   with_uncert=False):
+                                   with_uncert=False, nprocs=1,
+                                   block_size=None):
     """Resamples swath based on neighbour info.
 
     Parameters
@@ -598,6 +614,15 @@ def get_sample_from_neighbour_info(resample_type, output_shape, data,
         Set undetermined pixels to this value.
         If fill_value is None a masked array is returned
         with undetermined pixels masked
+    with_uncert : bool, optional
+        Calculate uncertainty estimates
+    nprocs : int, optional
+        Number of threads used to apply the weights of the neighbours
+    block_size : int or None, optional
+        Number of target pixels (rows of index_array) weighted at once by
+        each thread. Temporary arrays are only allocated for one block per
+        thread. If None a block size of about 4 million target pixel and
+        neighbour pairs is used.
 
     Returns
     -------
@@ -648,7 +673,7 @@ def get_sample_from_neighbour_info(resample_type, output_shape, data,
         resample_type, neighbours, new_data, index_array, distance_array,
         valid_input_size, valid_output_index, weight_funcs, with_uncert,
         fill_value, output_shape, is_masked_data, is_multi_channel,
-        input_data_type
+        input_data_type, nprocs=nprocs, block_size=block_size
     )
 
 
@@ -692,7 +717,7 @@ def _validate_resampler_type(resample_type: str, weight_funcs: Any) -> None:
 
 def _extract_resample_result(resample_type, neighbours, new_data, index_array, distance_array, valid_input_size,
                              valid_output_index, weight_funcs, with_uncert, fill_value, output_shape,
-                             is_masked_data, is_multi_channel, input_data_type):
+                             is_masked_data, is_multi_channel, input_data_type, nprocs=1, block_size=None):
     # Prepare weight_funcs argument for handling mask data
     if weight_funcs is not None and is_masked_data:
         weight_funcs = weight_funcs * 2 if is_multi_channel else (weight_funcs,) * 2
@@ -712,7 +737,7 @@ def _extract_resample_result(resample_type, neighbours, new_data, index_array, d
     else:
         result, stddev, count = _resample_with_weights(
             new_data, index_array, distance_array, neighbours, valid_input_size,
-            valid_output_index, weight_funcs, with_uncert, fill_value,
+            weight_funcs, with_uncert, fill_value, nprocs=nprocs, block_size=block_size,
         )
 
     # Create full result
@@ -739,8 +764,40 @@ def _extract_resample_result(resample_type, neighbours, new_data, index_array, d
 
 
 def _resample_with_weights(new_data, index_array, distance_array, neighbours,
-                           input_size, valid_output_index, weight_funcs,
-                           with_uncert, fill_value):
+                           input_size, weight_funcs, with_uncert, fill_value,
+                           nprocs=1, block_size=None):
+    """Apply the weights of the neighbours block by block of target pixels."""
+    num_targets = index_array.shape[0]
+    if block_size is None:
+        block_size = max(1, _NEIGHBOUR_BLOCK_ELEMENTS // neighbours)
+    starts = range(0, num_targets, block_size)
+
+    def _resample_block(start):
+        block = slice(start, start + block_size)
+        return _resample_block_with_weights(
+            new_data, index_array[block], distance_array[block], neighbours,
+            input_size, weight_funcs, with_uncert, fill_value)
+
+    if nprocs > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(min(nprocs, len(starts))) as executor:
+            return _assemble_blocks(executor.map(_resample_block, starts), starts, num_targets)
+    return _assemble_blocks(map(_resample_block, starts), starts, num_targets)
+
+
+def _assemble_blocks(block_results, starts, num_targets):
+    full_results = None
+    for start, results in zip(starts, block_results):
+        if full_results is None:
+            full_results = [None if res is None else np.empty((num_targets,) + res.shape[1:], dtype=res.dtype)
+                            for res in results]
+        for full_res, res in zip(full_results, results):
+            if res is not None:
+                full_res[start:start + res.shape[0]] = res
+    return full_results
+
+
+def _resample_block_with_weights(new_data, index_array, distance_array, neighbours,
+                                 input_size, weight_funcs, with_uncert, fill_value):
     # Calculate result using weighting.
     # Note: the code below has low readability in order
     #       to avoid looping over numpy arrays
@@ -774,7 +831,7 @@ def _resample_with_weights(new_data, index_array, distance_array, neighbours,
 
         # Calculate weights for each channel
         weights = []
-        num_weights = valid_output_index.sum()
+        num_weights = distance.shape[0]
         num_channels = new_data.shape[1]
         for j in range(num_channels):
             calc_weight = weight_funcs[j](distance)
@@ -907,7 +964,8 @@ class XArrayResamplerNN(object):
                  target_geo_def,
                  radius_of_influence=None,
                  neighbours=1,
-                 epsilon=0):
+                 epsilon=0,
+                 partition_kdtree=False):
         """Resampler for xarray DataArrays using a nearest neighbor algorithm.
 
         Parameters
@@ -926,6 +984,12 @@ class XArrayResamplerNN(object):
         epsilon : float, optional
             Allowed uncertainty in meters. Increasing uncertainty
             reduces execution time
+        partition_kdtree : bool, optional
+            Build one KD-tree per row-chunk of the source geolocation instead
+            of one KD-tree for the entire source. The source and target
+            longitudes/latitudes are computed while the neighbor query graph
+            is built. See
+            :class:`pyresample.future.resamplers.nearest.PartitionedKDTree`.
 
         """
         if DataArray is None:
@@ -938,6 +1002,7 @@ class XArrayResamplerNN(object):
         self.delayed_kdtree = None
         self.neighbours = neighbours
         self.epsilon = epsilon
+        self.partition_kdtree = partition_kdtree
         self.source_geo_def = source_geo_def
         self.target_geo_def = target_geo_def
         if radius_of_influence is None:
@@ -971,7 +1036,11 @@ class XArrayResamplerNN(object):
         """Set up kd tree on input."""
         source_lons, source_lats = self.source_geo_def.get_lonlats(
             chunks=chunks)
+        if self.partition_kdtree:
+            source_lons, source_lats = _rechunk_rows(source_lons, source_lats)
         valid_input_idx = ((source_lons >= -180) & (source_lons <= 180) & (source_lats <= 90) & (source_lats >= -90))
+        if self.partition_kdtree:
+            return valid_input_idx, create_partitioned_kdtree(source_lons, source_lats)
         input_coords = lonlat2xyz(source_lons, source_lats)
         input_coords = input_coords[valid_input_idx.ravel(), :]
 
@@ -993,6 +1062,13 @@ class XArrayResamplerNN(object):
             ndims = self.source_geo_def.ndim
             dims = 'mn'[:ndims]
             args = (mask, dims, self.valid_input_index, dims)
+        if isinstance(resample_kdtree, DelayedPartitionedKDTree):
+            mask_kwargs = {} if mask is None else {"mask": mask, "valid_input_index": self.valid_input_index}
+            res = query_partitioned_kdtree(query_no_distance, resample_kdtree, tlons, tlats, valid_oi,
+                                           neighbours=self.neighbours, epsilon=self.epsilon,
+                                           radius=self.radius_of_influence, extra_shape=(self.neighbours,),
+                                           **mask_kwargs)
+            return res, None
         # res.shape = rows, cols, neighbors
         # j=rows, i=cols, k=neighbors, m=source rows, n=source cols
         res = blockwise(query_no_distance, 'jik', tlons, 'ji', tlats, 'ji',
@@ -40,7 +40,7 @@ try:
 except ImportError:
     xr = None
 
-from pyresample.geometry import AreaDefinition, CoordinateDefinition, IncompatibleAreas, SwathDefinition
+from pyresample.geometry import AreaDefinition, CoordinateDefinition, SwathDefinition
 
 from .future.resamplers.resampler import hash_dict
 
@@ -249,18 +249,19 @@ def resample_blocks(func, src_area, src_arrays, dst_area,
     fill_value = _make_fill_value(fill_value, dtype)
 
     dst_chunks, output_shape = _normalize_chunks_for_area(dst_area, chunk_size, dtype)
+    src_slices = create_slicer(src_area, dst_area).get_chunk_slices(dst_chunks[-2:])
 
-    for dst_block_info, dst_area_chunk in _enumerate_dst_area_chunks(dst_area, dst_chunks):
+    for dst_block_info, _dst_area_chunk in _enumerate_dst_area_chunks(dst_area, dst_chunks):
         position = dst_block_info["chunk-location"]
         dst_block_info["shape"] = output_shape
-        try:
-            cropped_src_arrays, cropped_src_area, src_block_info = crop_data_around_area(src_area, src_arrays,
-                                                                                         dst_area_chunk)
-            _check_resolution_mismatch(cropped_src_area, dtype)
-        except IncompatibleAreas:  # no relevant data matching
+        chunk_src_slices = src_slices[position[-2:]]
+        if chunk_src_slices is None:  # no relevant data matching
             task = (np.full, dst_block_info["chunk-shape"], fill_value)
             src_dependencies = []
         else:
+            cropped_src_arrays, cropped_src_area, src_block_info = _crop_data_with_slices(src_area, src_arrays,
+                                                                                          *chunk_src_slices)
+            _check_resolution_mismatch(cropped_src_area, dtype)
             task, src_dependencies = _create_task(func,
                                                   cropped_src_arrays, src_block_info,
                                                   dst_arrays, dst_block_info,
@@ -331,6 +332,13 @@ def _create_task(func, smaller_src_arrays, src_block_info, dst_arrays, dst_block
 def crop_data_around_area(source_geo_def, src_arrays, target_geo_def):
     """Crop the data around the provided area."""
     small_source_geo_def, x_slice, y_slice = crop_source_area(source_geo_def, target_geo_def)
+    return _crop_data_with_slices(source_geo_def, src_arrays, x_slice, y_slice, small_source_geo_def)
+
+
+def _crop_data_with_slices(source_geo_def, src_arrays, x_slice, y_slice, small_source_geo_def=None):
+    """Crop the data and the source area with the provided slices."""
+    if small_source_geo_def is None:
+        small_source_geo_def = _crop_source_area_with_slices(source_geo_def, x_slice, y_slice)
     smaller_src_arrays = []
     for data in src_arrays:
         smaller_src_arrays.append(data[..., y_slice, x_slice].rechunk([-1] * data.ndim))
@@ -346,11 +354,15 @@ def crop_source_area(source_geo_def, target_geo_def):
     """Crop a source area around the provided target area."""
     slicer = create_slicer(source_geo_def, target_geo_def)
     x_slice, y_slice = slicer.get_slices()
+    return _crop_source_area_with_slices(source_geo_def, x_slice, y_slice), x_slice, y_slice
+
+
+def _crop_source_area_with_slices(source_geo_def, x_slice, y_slice):
     small_source_geo_def = source_geo_def[y_slice, x_slice]
     if isinstance(small_source_geo_def, SwathDefinition):
         small_source_geo_def.lons.data = small_source_geo_def.lons.data.rechunk((-1, -1))
         small_source_geo_def.lats.data = small_source_geo_def.lats.data.rechunk((-1, -1))
-    return small_source_geo_def, x_slice, y_slice
+    return small_source_geo_def
 
 
 def _enumerate_dst_area_chunks(dst_area, dst_chunks):
@@ -27,6 +27,7 @@ from pyproj import Transformer
 from pyproj.enums import TransformDirection
 
 from pyresample import AreaDefinition, SwathDefinition
+from pyresample._caching import LRUCache, cache_to_json_if
 from pyresample.geometry import IncompatibleAreas, InvalidArea, get_geostationary_bounding_box_in_proj_coords
 
 try:
@@ -34,6 +35,22 @@ try:
 except ImportError:
     da = None
 
+try:
+    from shapely import polygons as shapely_polygons
+except ImportError:
+    # shapely < 2.0
+    shapely_polygons = None
+
+# Number of swaths for which the chunk polygons are kept in memory
+CHUNK_POLYGONS_CACHE_SIZE = 128
+# Number of points sampled on each side of the chunk polygons
+CHUNK_POLYGON_VERTICES_PER_SIDE = 10
+
+_chunk_polygons_cache = LRUCache(CHUNK_POLYGONS_CACHE_SIZE)
+
+# Marker for chunks that the vectorized slicing can't handle
+_SLICE_SINGLE_CHUNK = object()
+
 
 def create_slicer(area_to_crop, area_to_contain):
     """Create a slicer for cropping *area_to_crop* based on *area_to_contain*.
@@ -71,13 +88,77 @@ class Slicer(ABC):
         """Set up the Slicer."""
         self.area_to_crop = area_to_crop
         self.area_to_contain = area_to_contain
-        self._transformer = Transformer.from_crs(self.area_to_contain.crs, self.area_to_crop.crs, always_xy=True)
+        self._transformer = _get_transformer(self.area_to_contain.crs, self.area_to_crop.crs)
 
     def get_slices(self):
-        """Get the slices to crop *area_to_crop* enclosing *area_to_contain*."""
+        """Get the slices to crop *area_to_crop* enclosing *area_to_contain*.
+
+        The slices are cached to disk when both areas are
+        :class:`~pyresample.geometry.AreaDefinition` objects and the
+        ``cache_geometry_slices`` configuration option is enabled.
+        """
+        if self._slices_are_cacheable():
+            return tuple(_get_cached_slices(self.area_to_crop, self.area_to_contain))
+        return self._compute_slices()
+
+    def _compute_slices(self):
         poly = self.get_polygon_to_contain()
         return self.get_slices_from_polygon(poly)
 
+    def _slices_are_cacheable(self):
+        return isinstance(self.area_to_crop, AreaDefinition) and isinstance(self.area_to_contain, AreaDefinition)
+
+    def get_chunk_slices(self, chunks):
+        """Get the slices to crop *area_to_crop* enclosing each chunk of *area_to_contain*.
+
+        The boundaries of all chunks are transformed in one call and the
+        slices are computed with vectorized polygon and array operations.
+        This requires shapely 2.0 or later, otherwise every chunk is sliced
+        separately with :meth:`get_slices`.
+
+        Args:
+            chunks: Chunks of the (y, x) dimensions of *area_to_contain*, as
+                normalized by dask.
+
+        Returns:
+            Dictionary mapping the position of each chunk to the
+            ``(x_slice, y_slice)`` of *area_to_crop* for that chunk, or to
+            ``None`` when the chunk doesn't overlap *area_to_crop*. Like
+            :meth:`get_slices`, the slices of all chunks are cached to disk
+            for two areas when ``cache_geometry_slices`` is enabled.
+        """
+        chunks = tuple(tuple(int(size) for size in dim_chunks) for dim_chunks in chunks)
+        if self._slices_are_cacheable():
+            chunk_results = _get_cached_chunk_slices(self.area_to_crop, self.area_to_contain, chunks)
+        else:
+            chunk_results = self._compute_chunk_slices(chunks)
+        positions = [position for position, _ in _enumerate_chunk_slices(chunks)]
+        return {position: None if result is None else tuple(result)
+                for position, result in zip(positions, chunk_results)}
+
+    def _compute_chunk_slices(self, chunks):
+        chunk_slices = [slices for _, slices in _enumerate_chunk_slices(chunks)]
+        if shapely_polygons is None or not isinstance(self.area_to_contain, AreaDefinition):
+            chunk_results = [_SLICE_SINGLE_CHUNK] * len(chunk_slices)
+        else:
+            x, y, resolutions = _get_chunk_edges_in_projection_coordinates(self.area_to_contain, chunk_slices)
+            chunk_results = self._get_slices_from_chunk_edges(x, y, resolutions)
+        return [self._get_single_chunk_slices(slices) if result is _SLICE_SINGLE_CHUNK else result
+                for slices, result in zip(chunk_slices, chunk_results)]
+
+    def _get_single_chunk_slices(self, slices):
+        try:
+            return create_slicer(self.area_to_crop, self.area_to_contain[tuple(slices)])._compute_slices()
+        except IncompatibleAreas:
+            return None
+
+    def _get_slices_from_chunk_edges(self, x, y, resolutions):
+        """Get the slices for the chunks with edges *x*, *y* in projection coordinates of *area_to_contain*.
+
+        Chunks not handled here should be marked with ``_SLICE_SINGLE_CHUNK``.
+        """
+        return [_SLICE_SINGLE_CHUNK] * x.shape[0]
+
     @abstractmethod
     def get_polygon_to_contain(self):
         """Get the shapely Polygon corresponding to *area_to_contain*."""
@@ -109,6 +190,35 @@ class SwathSlicer(Slicer):
             raise IncompatibleAreas
         return self._assemble_slices(intersecting_chunk_slices)
 
+    def _get_slices_from_chunk_edges(self, x, y, resolutions):
+        """Get the slices of all chunks of *area_to_contain* by querying the swath chunk polygons at once."""
+        from shapely.strtree import STRtree
+        num_chunks = x.shape[0]
+        lons, lats = self._transformer.transform(x, y)
+        is_finite = np.isfinite(lons).all(axis=1) & np.isfinite(lats).all(axis=1)
+        polys = shapely_polygons(np.stack((lons, lats), axis=-1)[is_finite])
+        swath_chunk_polygons, swath_chunk_slices = zip(*_get_chunk_polygons_for_swath_to_crop(self.area_to_crop))
+        poly_idx, swath_chunk_idx = STRtree(swath_chunk_polygons).query(polys, predicate="intersects")
+
+        line_slices, col_slices = zip(*swath_chunk_slices)
+        bounds = np.array([(slc.start, slc.stop) for slc in line_slices + col_slices]).reshape(2, -1, 2)
+        chunk_idx = np.flatnonzero(is_finite)[poly_idx]
+        start_idx = np.iinfo(np.int64).max
+        line_start = _group_reduce(np.minimum, chunk_idx, bounds[0, swath_chunk_idx, 0], num_chunks, start_idx)
+        line_stop = _group_reduce(np.maximum, chunk_idx, bounds[0, swath_chunk_idx, 1], num_chunks, 0)
+        col_start = _group_reduce(np.minimum, chunk_idx, bounds[1, swath_chunk_idx, 0], num_chunks, start_idx)
+        col_stop = _group_reduce(np.maximum, chunk_idx, bounds[1, swath_chunk_idx, 1], num_chunks, 0)
+        has_intersections = np.bincount(chunk_idx, minlength=num_chunks) > 0
+
+        results = [_SLICE_SINGLE_CHUNK] * num_chunks
+        for idx in np.flatnonzero(is_finite):
+            if not has_intersections[idx]:
+                results[idx] = None
+                continue
+            results[idx] = (slice(int(col_start[idx]), int(col_stop[idx])),
+                            slice(int(line_start[idx]), int(line_stop[idx])))
+        return results
+
     @staticmethod
     def _assemble_slices(chunk_slices):
         """Assemble slices to one slice per dimension."""
@@ -119,24 +229,97 @@ class SwathSlicer(Slicer):
         return slices
 
 
-@lru_cache(maxsize=10)
 def _get_chunk_polygons_for_swath_to_crop(swath_to_crop):
-    """Get the polygons for each chunk of the area_to_crop."""
-    res = []
-    from shapely.geometry import Polygon
-    src_chunks = swath_to_crop.lons.chunks
-    for _position, (line_slice, col_slice) in _enumerate_chunk_slices(src_chunks):
-        line_slice = expand_slice(line_slice)
-        col_slice = expand_slice(col_slice)
-        smaller_swath = swath_to_crop[line_slice, col_slice]
-        lons, lats = smaller_swath.get_edge_lonlats(10)
-        lons = np.hstack(lons)
-        lats = np.hstack(lats)
-        smaller_poly = Polygon(zip(lons, lats))
-        res.append((smaller_poly, (line_slice, col_slice)))
+    """Get the polygons for each chunk of the area_to_crop.
+
+    Results are cached in memory based on the hash of the swath and its
+    chunks, so only the first call for a swath computes the coordinates.
+    """
+    lons, _ = swath_to_crop.get_lonlats()
+    src_chunks = getattr(lons, "chunks", None) or tuple((size,) for size in lons.shape)
+    key = (hash(swath_to_crop), src_chunks)
+    res = _chunk_polygons_cache.get(key)
+    if res is None:
+        res = _compute_chunk_polygons(swath_to_crop, src_chunks)
+        _chunk_polygons_cache.put(key, res)
     return res
 
 
+def _compute_chunk_polygons(swath_to_crop, src_chunks):
+    """Compute the edge polygons of all chunks of the swath at once.
+
+    The edge coordinates of every chunk (expanded by one pixel on each side)
+    are gathered with a single (vectorized) indexing of the longitude and
+    latitude arrays, so dask arrays are only computed once.
+    """
+    chunk_slices = [tuple(expand_slice(slc) for slc in slices)
+                    for _position, slices in _enumerate_chunk_slices(src_chunks)]
+    rows, cols = _get_chunk_edge_indices(chunk_slices, swath_to_crop.shape)
+    lons, lats = swath_to_crop.get_lonlats()
+    if da is not None and isinstance(lons, da.Array):
+        edge_lons, edge_lats = da.compute(lons.vindex[rows.ravel(), cols.ravel()],
+                                          lats.vindex[rows.ravel(), cols.ravel()])
+    else:
+        edge_lons, edge_lats = lons[rows.ravel(), cols.ravel()], lats[rows.ravel(), cols.ravel()]
+    edge_lons = np.asarray(edge_lons).reshape(rows.shape)
+    edge_lats = np.asarray(edge_lats).reshape(rows.shape)
+    polygons = _create_chunk_polygons(edge_lons, edge_lats)
+    return list(zip(polygons, chunk_slices))
+
+
+def _get_chunk_edge_indices(chunk_slices, shape):
+    """Get the row and column indices of the edges of every chunk.
+
+    The returned arrays have the shape ``(num_chunks, 4, vertices_per_side)``
+    with the sides ordered like in
+    :meth:`~pyresample.geometry.BaseDefinition.get_edge_lonlats`: first row,
+    last column, last row (reversed) and first column (reversed).
+    """
+    num = CHUNK_POLYGON_VERTICES_PER_SIDE
+    line_slices, col_slices = zip(*chunk_slices)
+    row_start = np.array([slc.start for slc in line_slices])
+    row_stop = np.minimum([slc.stop for slc in line_slices], shape[0])
+    col_start = np.array([slc.start for slc in col_slices])
+    col_stop = np.minimum([slc.stop for slc in col_slices], shape[1])
+    last_row = row_stop - row_start - 1
+    last_col = col_stop - col_start - 1
+    # same truncation of the sample positions as BaseDefinition._get_bbox_slices
+    forward_rows = np.linspace(0, last_row, num, axis=-1).astype(int)
+    forward_cols = np.linspace(0, last_col, num, axis=-1).astype(int)
+    backward_rows = np.linspace(last_row, 0, num, axis=-1).astype(int)
+    backward_cols = np.linspace(last_col, 0, num, axis=-1).astype(int)
+    first_rows = np.zeros_like(forward_cols)
+    last_rows = np.repeat(last_row[:, np.newaxis], num, axis=1)
+    first_cols = np.zeros_like(forward_rows)
+    last_cols = np.repeat(last_col[:, np.newaxis], num, axis=1)
+    rows = np.stack([first_rows, forward_rows, last_rows, backward_rows], axis=1)
+    cols = np.stack([forward_cols, last_cols, backward_cols, first_cols], axis=1)
+    return rows + row_start[:, np.newaxis, np.newaxis], cols + col_start[:, np.newaxis, np.newaxis]
+
+
+def _create_chunk_polygons(edge_lons, edge_lats):
+    """Create the polygons from the edge coordinates of the chunks.
+
+    Invalid (NaN) coordinates are removed from the polygons. Polygons without
+    invalid coordinates are created in bulk.
+    """
+    from shapely.geometry import Polygon
+    is_valid = ~(np.isnan(edge_lons) | np.isnan(edge_lats))
+    if not is_valid.any(axis=-1).all():
+        raise ValueError("Can't compute boundary coordinates. At least one side is completely invalid.")
+    num_chunks = edge_lons.shape[0]
+    coords = np.stack([edge_lons.reshape(num_chunks, -1), edge_lats.reshape(num_chunks, -1)], axis=-1)
+    is_valid = is_valid.reshape(num_chunks, -1)
+    in_bulk = is_valid.all(axis=-1) if shapely_polygons is not None else np.zeros(num_chunks, dtype=bool)
+    polygons = [None] * num_chunks
+    if in_bulk.any():
+        for idx, poly in zip(np.flatnonzero(in_bulk), shapely_polygons(coords[in_bulk])):
+            polygons[idx] = poly
+    for idx in np.flatnonzero(~in_bulk):
+        polygons[idx] = Polygon(coords[idx][is_valid[idx]])
+    return polygons
+
+
 def expand_slice(small_slice):
     """Expand slice by one."""
     return slice(max(small_slice.start - 1, 0), small_slice.stop + 1, small_slice.step)
@@ -161,17 +344,77 @@ class AreaSlicer(Slicer):
 
         return Polygon(zip(*self._transformer.transform(x, y)))
 
+    def _get_slices_from_chunk_edges(self, x, y, resolutions):
+        """Get the slices of all chunks of *area_to_contain* with vectorized polygon operations."""
+        import shapely
+        num_chunks = x.shape[0]
+        results = [_SLICE_SINGLE_CHUNK] * num_chunks
+        chunk_idx = np.arange(num_chunks)
+        coord_idx = np.repeat(chunk_idx, x.shape[1])
+        x = x.ravel()
+        y = y.ravel()
+        if self.area_to_crop.is_geostationary:
+            x_geos, y_geos = get_geostationary_bounding_box_in_proj_coords(self.area_to_crop, 360)
+            x_geos, y_geos = self._transformer.transform(x_geos, y_geos, direction=TransformDirection.INVERSE)
+            geos_poly = shapely_polygons(np.stack((x_geos, y_geos), axis=-1))
+            polys = shapely.intersection(_polygons_from_coords(x, y, coord_idx), geos_poly)
+            is_empty = shapely.is_empty(polys)
+            for idx in np.flatnonzero(is_empty):
+                results[idx] = None
+            # other geometry types (ex. multipolygons) are sliced chunk by chunk
+            chunk_idx = np.flatnonzero(~is_empty & (shapely.get_type_id(polys) == shapely.GeometryType.POLYGON))
+            coords, coord_idx = shapely.get_coordinates(shapely.get_exterior_ring(polys[chunk_idx]),
+                                                        return_index=True)
+            x, y = coords[:, 0], coords[:, 1]
+        polys = _polygons_from_coords(*self._transformer.transform(x, y), coord_idx)
+
+        is_valid = shapely.is_valid(polys)
+        for idx in chunk_idx[~is_valid]:
+            results[idx] = None
+        chunk_idx = chunk_idx[is_valid]
+        # same number of segments per quarter circle as the buffer method of the polygons
+        polys = shapely.buffer(polys[is_valid], self._get_buffer_size(resolutions[chunk_idx]), quad_segs=16)
+        bounds = shapely.bounds(polys)
+        poly_to_crop = shapely_polygons(np.stack(
+            self.area_to_crop.get_edge_bbox_in_projection_coordinates(frequency=10), axis=-1))
+        intersects = shapely.intersects(polys, poly_to_crop)
+        for idx in chunk_idx[~intersects]:
+            results[idx] = None
+        is_finite = intersects & np.isfinite(bounds).all(axis=1)
+        chunk_idx = chunk_idx[is_finite]
+        bounds = bounds[is_finite]
+
+        x_bounds, y_bounds = self.area_to_crop.get_array_coordinates_from_projection_coordinates(bounds[:, [0, 2]],
+                                                                                                 bounds[:, [1, 3]])
+        y_size, x_size = self.area_to_crop.shape
+        is_outside = ((x_bounds < 0).all(axis=1) | (y_bounds < 0).all(axis=1) |
+                      (x_bounds >= x_size).all(axis=1) | (y_bounds >= y_size).all(axis=1))
+        x_start = np.floor(np.maximum(x_bounds.min(axis=1), 0))
+        x_stop = np.ceil(x_bounds.max(axis=1))
+        y_start = np.floor(np.maximum(y_bounds.min(axis=1), 0))
+        y_stop = np.ceil(y_bounds.max(axis=1))
+        for idx, outside, slice_bounds in zip(chunk_idx, is_outside, zip(x_start, x_stop, y_start, y_stop)):
+            if outside:
+                results[idx] = None
+                continue
+            x_slice = slice(int(slice_bounds[0]), int(slice_bounds[1]))
+            y_slice = slice(int(slice_bounds[2]), int(slice_bounds[3]))
+            results[idx] = (expand_slice(x_slice), expand_slice(y_slice))
+        return results
+
+    def _get_buffer_size(self, resolution):
+        """Get the margin added around the polygon to contain."""
+        if self.area_to_crop.crs.axis_info[0].unit_name == self.area_to_contain.crs.axis_info[0].unit_name:
+            return np.max(resolution, axis=-1)
+        return 0
+
     def get_slices_from_polygon(self, poly_to_contain):
         """Get the slices based on the polygon."""
         if not poly_to_contain.is_valid:
             raise IncompatibleAreas("Area outside of domain.")
         try:
             # We take a little margin around the polygon to ensure all needed pixels will be included.
-            if self.area_to_crop.crs.axis_info[0].unit_name == self.area_to_contain.crs.axis_info[0].unit_name:
-                buffer_size = np.max(self.area_to_contain.resolution)
-            else:
-                buffer_size = 0
-            buffered_poly = poly_to_contain.buffer(buffer_size)
+            buffered_poly = poly_to_contain.buffer(self._get_buffer_size(self.area_to_contain.resolution))
             bounds = buffered_poly.bounds
         except ValueError as err:
             raise InvalidArea("Invalid area") from err
@@ -210,6 +453,72 @@ class AreaSlicer(Slicer):
         return expand_slice(slice_x), expand_slice(slice_y)
 
 
+@cache_to_json_if("cache_geometry_slices", cache_version=2)
+def _get_cached_slices(area_to_crop, area_to_contain):
+    """Get the slices of *area_to_crop* enclosing *area_to_contain*, cached to disk if configured."""
+    return create_slicer(area_to_crop, area_to_contain)._compute_slices()
+
+
+@cache_to_json_if("cache_geometry_slices", cache_version=2)
+def _get_cached_chunk_slices(area_to_crop, area_to_contain, chunks):
+    """Get the slices of *area_to_crop* for each of the *chunks* of *area_to_contain*, cached to disk if configured."""
+    return create_slicer(area_to_crop, area_to_contain)._compute_chunk_slices(chunks)
+
+
+@lru_cache(maxsize=32)
+def _get_transformer(crs_from, crs_to):
+    """Get a (shared) transformer from *crs_from* to *crs_to*."""
+    return Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
+def _get_chunk_edges_in_projection_coordinates(area, chunk_slices):
+    """Get the edge projection coordinates and the resolution of every chunk of the area.
+
+    The coordinates are computed with the same operations as
+    :meth:`~pyresample.geometry.AreaDefinition.get_edge_bbox_in_projection_coordinates`
+    with ``frequency=10`` on the area sliced to each chunk, so they are
+    identical to the coordinates of those sliced areas. They are returned as
+    arrays of shape ``(num_chunks, 4 * 10)``, the pixel sizes of the chunks as
+    an array of shape ``(num_chunks, 2)``.
+    """
+    rows, cols = _get_chunk_edge_indices([tuple(slices) for slices in chunk_slices], area.shape)
+    row_start = np.array([slices[0].start for slices in chunk_slices])
+    row_stop = np.array([slices[0].stop for slices in chunk_slices])
+    col_start = np.array([slices[1].start for slices in chunk_slices])
+    col_stop = np.array([slices[1].stop for slices in chunk_slices])
+    # see AreaDefinition.__getitem__ and AreaDefinition.__init__
+    upl_x, upl_y = area.pixel_upper_left
+    x_min = upl_x + (col_start - 0.5) * area.pixel_size_x
+    y_min = upl_y - (row_stop - 0.5) * area.pixel_size_y
+    x_max = upl_x + (col_stop - 0.5) * area.pixel_size_x
+    y_max = upl_y - (row_start - 0.5) * area.pixel_size_y
+    pixel_size_x = (x_max - x_min) / (col_stop - col_start)
+    pixel_size_y = (y_max - y_min) / (row_stop - row_start)
+    chunk_upl_x = x_min + pixel_size_x / 2
+    chunk_upl_y = y_max - pixel_size_y / 2
+    num_chunks = rows.shape[0]
+    local_cols = (cols - col_start[:, np.newaxis, np.newaxis]).reshape(num_chunks, -1).astype(np.float64)
+    local_rows = (rows - row_start[:, np.newaxis, np.newaxis]).reshape(num_chunks, -1).astype(np.float64)
+    x = local_cols * pixel_size_x[:, np.newaxis] + chunk_upl_x[:, np.newaxis]
+    y = local_rows * -pixel_size_y[:, np.newaxis] + chunk_upl_y[:, np.newaxis]
+    return x, y, np.stack((pixel_size_x, pixel_size_y), axis=-1)
+
+
+def _polygons_from_coords(x, y, coord_idx):
+    """Create one polygon per unique value of *coord_idx* (assumed to be sorted)."""
+    import shapely
+    if not len(coord_idx):
+        return np.empty(0, dtype=object)
+    return shapely.polygons(shapely.linearrings(np.stack((x, y), axis=-1), indices=coord_idx))
+
+
+def _group_reduce(ufunc, group_idx, values, num_groups, initial):
+    """Reduce the values of each group with *ufunc*, starting from *initial*."""
+    res = np.full(num_groups, initial, dtype=np.int64)
+    ufunc.at(res, group_idx, values)
+    return res
+
+
 def _enumerate_chunk_slices(chunks):
     """Enumerate chunks with slices."""
     for position in np.ndindex(tuple(map(len, (chunks)))):
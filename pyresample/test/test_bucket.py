@@ -269,6 +269,49 @@ def test_get_max(resampler):
     assert np.count_nonzero(~np.isnan(result)) == 2
 
 
+@pytest.mark.parametrize("statistic", ["min", "max"])
+def test_get_min_max_skipna_false(resampler, statistic):
+    """Test that min/max buckets containing NaN are NaN when skipna is False."""
+    data = da.from_array(np.array([[2, np.nan], [5, 3]]), chunks=CHUNKS)
+    with dask.config.set(scheduler=CustomScheduler(max_computes=0)):
+        result = getattr(resampler, f"get_{statistic}")(data, skipna=False)
+    result = result.compute()
+    # the bucket of 2 and NaN is NaN
+    assert np.count_nonzero(~np.isnan(result)) == 2
+    assert np.count_nonzero(result == 5) == 1
+    assert np.count_nonzero(result == 3) == 1
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int16])
+def test_bucket_statistics_kernel(dtype):
+    """Test the compiled bucket statistics kernel against numpy."""
+    from pyresample.bucket._bucket import COUNT, MAX, MIN, NAN_COUNT, SUM, bucket_statistics
+
+    rng = np.random.default_rng(42)
+    out_size = 50
+    idxs = rng.integers(-1, out_size + 5, 1000)
+    data = rng.uniform(-100, 100, 1000).astype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        data[::7] = np.nan
+    res = bucket._get_bucket_statistics(da.from_array(data, chunks=300), da.from_array(idxs, chunks=300),
+                                        out_size).compute()
+    np.testing.assert_allclose(res, bucket_statistics(data.astype(np.float64), idxs, out_size))
+
+    valid_idxs = (idxs >= 0) & (idxs < out_size)
+    for bucket_idx in range(out_size):
+        bucket_data = data[valid_idxs & (idxs == bucket_idx)].astype(np.float64)
+        valid_data = bucket_data[~np.isnan(bucket_data)]
+        np.testing.assert_allclose(res[SUM, bucket_idx], valid_data.sum())
+        assert res[COUNT, bucket_idx] == valid_data.size
+        assert res[NAN_COUNT, bucket_idx] == np.isnan(bucket_data).sum()
+        if valid_data.size:
+            assert res[MIN, bucket_idx] == valid_data.min()
+            assert res[MAX, bucket_idx] == valid_data.max()
+        else:
+            assert np.isnan(res[MIN, bucket_idx])
+            assert np.isnan(res[MAX, bucket_idx])
+
+
 def _get_abs_max_result(resampler, data, **kwargs):
     """Compute the bucket abs max with kwargs and check that no dask computation is performed."""
     with dask.config.set(scheduler=CustomScheduler(max_computes=0)):
@@ -353,6 +396,48 @@ def test_get_average_with_fill_value_in_input(resampler):
     assert np.count_nonzero(result != -1) == 1
 
 
+@pytest.mark.parametrize("skipna", [True, False])
+@pytest.mark.parametrize("fill_value", [np.nan, -1])
+def test_get_statistics(resampler, skipna, fill_value):
+    """Test that all statistics are the same as the ones from the individual methods."""
+    data = da.from_array(np.array([[2, 11], [5, np.nan]]), chunks=CHUNKS)
+    stats = ("sum", "count", "min", "max", "abs_max", "average", "fractions")
+    with dask.config.set(scheduler=CustomScheduler(max_computes=0)):
+        result = resampler.get_statistics(data, stats=stats, categories=[2, 5],
+                                          fill_value=fill_value, skipna=skipna)
+    assert isinstance(result, xr.Dataset)
+    assert set(result.data_vars) == set(stats)
+    with dask.config.set(scheduler=CustomScheduler(max_computes=1)):
+        result = result.compute()
+
+    np.testing.assert_array_equal(result["sum"], resampler.get_sum(data, skipna=skipna))
+    np.testing.assert_array_equal(result["count"], resampler.get_count())
+    for name in ("min", "max", "abs_max"):
+        np.testing.assert_array_equal(result[name], getattr(resampler, f"get_{name}")(data, skipna=skipna))
+    np.testing.assert_array_equal(result["average"],
+                                  resampler.get_average(data, fill_value=fill_value, skipna=skipna))
+    fractions = resampler.get_fractions(data, categories=[2, 5], fill_value=fill_value)
+    assert result["fractions"].dims == ("category", "y", "x")
+    np.testing.assert_array_equal(result["fractions"].sel(category=2), fractions[2])
+    np.testing.assert_array_equal(result["fractions"].sel(category=5), fractions[5])
+
+
+def test_get_statistics_reads_data_once(resampler):
+    """Test that the input data is only read once for all statistics."""
+    read_counter = MagicMock(side_effect=lambda arr: arr)
+    data = da.from_array(np.array([[2, 11], [5, np.nan]]), chunks=CHUNKS).map_blocks(read_counter, meta=np.array(()))
+    result = resampler.get_statistics(data, stats=("sum", "count", "min", "max", "average"))
+    result.compute()
+    assert read_counter.call_count == 1
+
+
+def test_get_statistics_unknown(resampler):
+    """Test that unknown statistics raise an error."""
+    data = da.from_array(np.array([[2, 11], [5, np.nan]]), chunks=CHUNKS)
+    with pytest.raises(ValueError, match="median"):
+        resampler.get_statistics(data, stats=("sum", "median"))
+
+
 def test_resample_bucket_fractions(resampler):
     """Test fraction calculations for categorical data."""
     data = da.from_array(np.array([[2, 4], [2, 2]]), chunks=CHUNKS)
@@ -391,3 +476,49 @@ def test_resample_bucket_fractions(resampler):
     # the categories
     with dask.config.set(scheduler=CustomScheduler(max_computes=1)):
         _ = resampler.get_fractions(data, categories=None)
+
+
+def test_accumulator_matches_resampler(adef):
+    """Test that accumulating granules gives the same result as resampling all data at once."""
+    rng = np.random.default_rng(42)
+    lons = rng.uniform(-10, 40, (2, 40, 30))
+    lats = rng.uniform(50, 70, (2, 40, 30))
+    data = rng.uniform(0, 5, (2, 40, 30)).round()
+    data[:, ::5, ::3] = np.nan
+    stats = ("sum", "count", "min", "max", "abs_max", "average", "fractions")
+
+    accumulator = bucket.BucketAccumulator(adef, categories=[1, 2])
+    for granule_idx in range(2):
+        accumulator.add(da.from_array(lons[granule_idx], chunks=20), lats[granule_idx],
+                        da.from_array(data[granule_idx], chunks=20))
+    assert accumulator.num_granules == 2
+    result = accumulator.get_statistics(stats=stats)
+
+    resampler = bucket.BucketResampler(adef, da.from_array(lons, chunks=20), da.from_array(lats, chunks=20))
+    expected = resampler.get_statistics(da.from_array(data, chunks=20), stats=stats, categories=[1, 2]).compute()
+    for name in stats:
+        assert isinstance(result[name].data, np.ndarray)
+        np.testing.assert_allclose(result[name], expected[name])
+
+
+def test_accumulator_save_load(adef, tmp_path):
+    """Test that the accumulator state can be checkpointed and restored."""
+    accumulator = bucket.BucketAccumulator(adef, fill_value=-1)
+    accumulator.add(np.array([[25., 25.]]), np.array([[60., 60.2]]), np.array([[2., -1.]]))
+    checkpoint = tmp_path / "checkpoint.npz"
+    accumulator.save(checkpoint)
+
+    restored = bucket.BucketAccumulator.load(checkpoint, adef)
+    assert restored.num_granules == 1
+    assert restored.fill_value == -1
+    assert restored.categories is None
+    restored.add(np.array([[25.]]), np.array([[60.]]), np.array([[4.]]))
+    result = restored.get_statistics(stats=("count", "average"))
+    assert np.count_nonzero(result["average"] == 3) == 1
+    assert int(result["count"].sum()) == 3
+
+    other_area = create_area_def("other", "EPSG:4326", shape=(10, 10), area_extent=(0, 0, 10, 10))
+    with pytest.raises(ValueError, match="different target area"):
+        bucket.BucketAccumulator.load(checkpoint, other_area)
+    with pytest.raises(ValueError, match="categories"):
+        restored.get_statistics(stats=("fractions",))
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Pyresample developers
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the on-disk caching of geometry slices."""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from unittest import mock
+
+import pytest
+
+import pyresample
+from pyresample._caching import _CACHE_STORES, SQLITE_FILENAME, CacheInfo, LRUCache, cache_to_json_if
+
+
+def _create_cached_func():
+    calls = []
+
+    @cache_to_json_if("cache_geometry_slices")
+    def _get_slices(start, stop):
+        calls.append((start, stop))
+        return slice(start, stop), slice(start * 2, stop * 2)
+
+    return _get_slices, calls
+
+
+def _num_files(cache_dir):
+    return len(glob(str(cache_dir / "geometry_slices_v1" / "*")))
+
+
+@pytest.mark.parametrize(("backend", "num_files"), [("json", 3), ("sqlite", 1)])
+def test_cache_backends(tmp_path, backend, num_files):
+    """Test that results are stored and loaded with both backends."""
+    get_slices, calls = _create_cached_func()
+    with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=True,
+                               cache_geometry_slices_backend=backend):
+        for _ in range(2):
+            for start in range(3):
+                assert get_slices(start, 10) == [slice(start, 10), slice(start * 2, 20)]
+        assert get_slices.cache_info() == CacheInfo(hits=3, misses=3)
+        assert len(calls) == 3
+        assert _num_files(tmp_path) == num_files
+
+        get_slices.cache_clear()
+        get_slices(0, 10)
+    assert len(calls) == 4
+    assert get_slices.cache_info() == CacheInfo(hits=3, misses=4)
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_cache_eviction(tmp_path, backend):
+    """Test that the least recently used entries are removed."""
+    get_slices, calls = _create_cached_func()
+    with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=True,
+                               cache_geometry_slices_backend=backend,
+                               cache_geometry_slices_max_entries=2):
+        get_slices(0, 10)
+        get_slices(1, 10)
+        # use the first entry again so that the second one is evicted
+        get_slices(0, 10)
+        get_slices(2, 10)
+        assert len(calls) == 3
+        get_slices(0, 10)
+        get_slices(2, 10)
+        assert len(calls) == 3
+        get_slices(1, 10)
+        assert len(calls) == 4
+    if backend == "json":
+        assert _num_files(tmp_path) == 2
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_cache_concurrent_access(tmp_path, backend):
+    """Test that concurrent calls never read partially written entries."""
+    get_slices, _ = _create_cached_func()
+    with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=True,
+                               cache_geometry_slices_backend=backend):
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda start: get_slices(start % 5, 10), range(100)))
+    assert results == [[slice(start % 5, 10), slice(start % 5 * 2, 20)] for start in range(100)]
+    assert sum(get_slices.cache_info()) == 100
+    assert not glob(str(tmp_path / "geometry_slices_v1" / ".*"))
+
+
+def test_sqlite_cache_clear_keeps_database(tmp_path):
+    """Test that clearing the SQLite cache removes the entries but not the database file."""
+    get_slices, calls = _create_cached_func()
+    with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=True,
+                               cache_geometry_slices_backend="sqlite"):
+        get_slices(0, 10)
+        get_slices.cache_clear()
+        assert (tmp_path / "geometry_slices_v1" / SQLITE_FILENAME).is_file()
+        get_slices(0, 10)
+    assert len(calls) == 2
+
+
+def test_unknown_cache_backend(tmp_path):
+    """Test that unknown backends raise an error."""
+    get_slices, _ = _create_cached_func()
+    with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=True,
+                               cache_geometry_slices_backend="zarr"), \
+            pytest.raises(ValueError, match="Unknown geometry slices cache backend"):
+        get_slices(0, 10)
+
+
+def test_sqlite_cache_hits_are_read_only(tmp_path):
+    """Test that cache hits don't wait for writers unless entries are evicted."""
+    get_slices, calls = _create_cached_func()
+    db_path = tmp_path / "geometry_slices_v1" / SQLITE_FILENAME
+    with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=True,
+                               cache_geometry_slices_backend="sqlite"), \
+            mock.patch("pyresample._caching.SQLITE_TIMEOUT", 0.1):
+        get_slices(0, 10)
+        last_used = sqlite3.connect(db_path).execute("SELECT last_used FROM entries").fetchall()
+        writer = sqlite3.connect(db_path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            assert get_slices(0, 10) == [slice(0, 10), slice(0, 20)]
+            # marking the entry as used needs the write lock so the cache is skipped
+            with pyresample.config.set(cache_geometry_slices_max_entries=10), \
+                    pytest.warns(UserWarning, match="locked"):
+                assert get_slices(0, 10) == [slice(0, 10), slice(0, 20)]
+        finally:
+            writer.rollback()
+            writer.close()
+        assert sqlite3.connect(db_path).execute("SELECT last_used FROM entries").fetchall() == last_used
+    assert len(calls) == 2
+
+
+def test_sqlite_cache_damaged_database(tmp_path):
+    """Test that a damaged database file makes calls run uncached."""
+    get_slices, calls = _create_cached_func()
+    db_path = tmp_path / "geometry_slices_v1" / SQLITE_FILENAME
+    db_path.parent.mkdir()
+    db_path.write_bytes(b"not a database" * 100)
+    with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=True,
+                               cache_geometry_slices_backend="sqlite"):
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="Cannot read from the cache"):
+                assert get_slices(0, 10) == [slice(0, 10), slice(0, 20)]
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_cache_store_failure(tmp_path, backend):
+    """Test that results are still returned if they can't be written to the cache."""
+    get_slices, calls = _create_cached_func()
+    store_class = _CACHE_STORES[backend]
+    error = OSError("No space left on device") if backend == "json" else sqlite3.OperationalError("disk I/O error")
+    with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=True,
+                               cache_geometry_slices_backend=backend), \
+            mock.patch.object(store_class, "store", side_effect=error), \
+            pytest.warns(UserWarning, match="Cannot write to the cache"):
+        assert get_slices(0, 10) == [slice(0, 10), slice(0, 20)]
+    assert len(calls) == 1
+    assert get_slices.cache_info() == CacheInfo(hits=0, misses=1)
+
+
+def test_json_cache_unreadable_directory(tmp_path):
+    """Test that a cache directory that can't be used makes calls run uncached."""
+    get_slices, calls = _create_cached_func()
+    cache_file = tmp_path / "not_a_directory"
+    cache_file.touch()
+    with pyresample.config.set(cache_dir=cache_file, cache_geometry_slices=True):
+        with pytest.warns(UserWarning, match="Cannot read from the cache"):
+            assert get_slices(0, 10) == [slice(0, 10), slice(0, 20)]
+    assert len(calls) == 1
+
+
+def test_lru_cache():
+    """Test that the in-memory LRU cache removes the least recently used entries."""
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("b", 0) == 0
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_concurrent_access():
+    """Test that the in-memory LRU cache can be used from many threads at once."""
+    cache = LRUCache(4)
+
+    def _use_cache(idx):
+        key = idx % 10
+        value = cache.get(key)
+        if value is None:
+            cache.put(key, key * 2)
+            return key * 2
+        return value
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(_use_cache, range(10000)))
+    assert results == [idx % 10 * 2 for idx in range(10000)]
+    assert len(cache) == 4
@@ -349,26 +349,52 @@ class TestDaskEWAResampler:
         ('input_shape', 'input_dims', 'as_np'),
         [
             ((100,), ('y',), False),
-            ((4, 100, 50, 25), ('bands', 'y', 'x', 'time'), False),
             ((100,), ('y',), True),
             ((4, 100, 50, 25), ('bands', 'y', 'x', 'time'), True),
         ]
     )
     def test_bad_input(self, input_shape, input_dims, as_np):
-        """Check that 1D array inputs are not currently supported."""
+        """Check that 1D array inputs and N-D non-DataArray inputs are not supported."""
         output_shape = (200, 100)
         swath_data, source_swath, target_area = get_test_data(
             input_shape=input_shape, output_shape=output_shape,
             input_dims=input_dims,
         )
         swath_data.data = swath_data.data.astype(np.float32)
+        if as_np:
+            swath_data = swath_data.data
 
         resampler = DaskEWAResampler(source_swath, target_area)
 
-        exp_exc = ValueError if len(input_shape) != 4 else NotImplementedError
-        with pytest.raises(exp_exc):
+        with pytest.raises(ValueError):
             resampler.resample(swath_data, rows_per_scan=10)
 
+    @pytest.mark.parametrize('maximum_weight_mode', [False, True])
+    def test_nd_single_pass(self, maximum_weight_mode):
+        """Test that all non-spatial dimensions are resampled in one pass."""
+        swath_data, source_swath, target_area = get_test_data(
+            input_shape=(2, 100, 50, 3), input_dims=('time', 'y', 'x', 'level'))
+        swath_data = swath_data.assign_coords(time=[10, 20], level=[1000, 850, 500])
+        resampler = DaskEWAResampler(source_swath, target_area)
+        with mock.patch.object(dask_ewa, 'fornav_weights_and_sums_multi_wrapper',
+                               wraps=dask_ewa.fornav_weights_and_sums_multi_wrapper) as multi_fornav, \
+                dask.config.set(scheduler='sync'):
+            res = resampler.resample(swath_data, rows_per_scan=10, weight_delta_max=40,
+                                     maximum_weight_mode=maximum_weight_mode)
+            assert res.dims == ('time', 'level', 'y', 'x')
+            assert res.shape == (2, 3) + target_area.shape
+            assert res.data.numblocks[:2] == (1, 1)
+            np.testing.assert_array_equal(res.coords['level'], [1000, 850, 500])
+            res = res.compute()
+        # at most one call per input block (single output chunk) for all 6 time/level combinations
+        assert 0 < multi_fornav.call_count <= _get_num_chunks(source_swath, DaskEWAResampler)
+
+        for time_idx in range(2):
+            for level_idx in range(3):
+                band_res = resampler.resample(swath_data[time_idx, :, :, level_idx], rows_per_scan=10,
+                                              weight_delta_max=40, maximum_weight_mode=maximum_weight_mode)
+                np.testing.assert_array_equal(res[time_idx, level_idx].values, band_res.values)
+
     def test_multiple_targets(self):
         """Test that multiple targets produce unique results."""
         input_shape = (100, 50)
@@ -385,3 +411,131 @@ class TestDaskEWAResampler:
 
         assert res1.name != res2.name
         assert res1.compute().shape != res2.compute().shape
+
+    @pytest.mark.parametrize('persist', [False, True])
+    @pytest.mark.parametrize('chunks', [None, (50, 25)])
+    def test_persist(self, persist, chunks):
+        """Test that persisting and skipping non-overlapping chunks gives the same result."""
+        swath_data, source_swath, target_area = get_test_data()
+        exp = DaskEWAResampler(source_swath, target_area).resample(
+            swath_data, rows_per_scan=10, chunks=chunks).compute()
+
+        resampler = DaskEWAResampler(source_swath, target_area)
+        res = resampler.resample(swath_data, rows_per_scan=10, persist=persist, chunks=chunks)
+        num_in_blocks = _get_num_chunks(source_swath, DaskEWAResampler)
+        num_fornav_tasks = sum(1 for key in dict(res.data.__dask_graph__())
+                               if isinstance(key, tuple) and key[0].startswith('fornav-')
+                               and not key[0].startswith('fornav-combine-'))
+        if persist:
+            assert len(resampler.cache['ll2cr_blocks']) < num_in_blocks
+        if persist and chunks is not None:
+            # only input block and output chunk pairs that overlap
+            assert num_fornav_tasks < len(resampler.cache['ll2cr_blocks']) * res.data.npartitions
+        else:
+            assert num_fornav_tasks == len(resampler.cache['ll2cr_blocks']) * res.data.npartitions
+        np.testing.assert_allclose(res.compute(), exp)
+
+    @pytest.mark.parametrize('output_proj', [
+        None,
+        # no overlap with the swath
+        '+proj=lcc +datum=WGS84 +ellps=WGS84 +lon_0=-55. +lat_0=25 +lat_1=25 +units=m +no_defs',
+    ])
+    def test_cache_dir(self, tmp_path, output_proj):
+        """Test that ll2cr results are stored in and reused from the cache directory."""
+        swath_data, source_swath, target_area = get_test_data(output_proj=output_proj)
+        exp = DaskEWAResampler(source_swath, target_area).resample(
+            swath_data, rows_per_scan=10).compute()
+
+        with mock.patch.object(dask_ewa, 'll2cr', wraps=dask_ewa.ll2cr) as ll2cr:
+            resampler = DaskEWAResampler(source_swath, target_area)
+            res = resampler.resample(swath_data, rows_per_scan=10, cache_dir=str(tmp_path))
+            np.testing.assert_allclose(res.compute(), exp)
+            ll2cr_calls = ll2cr.call_count
+            assert ll2cr_calls == _get_num_chunks(source_swath, DaskEWAResampler)
+            entries = list(tmp_path.glob("ewa_ll2cr_*"))
+            assert len(entries) == 1
+
+            # a new resampler (as in another process) reuses the stored results
+            resampler = DaskEWAResampler(source_swath, target_area)
+            res = resampler.resample(_create_second_test_data(swath_data), rows_per_scan=10,
+                                     cache_dir=str(tmp_path))
+            np.testing.assert_allclose(res.compute(), exp)
+            assert ll2cr.call_count == ll2cr_calls
+            assert list(tmp_path.glob("ewa_ll2cr_*")) == entries
+            num_overlapping = len(list(entries[0].glob("block_*.npy")))
+            assert len(resampler.cache['ll2cr_blocks']) == num_overlapping
+
+    @pytest.mark.parametrize('maximum_weight_mode', [False, True])
+    def test_bands_single_pass(self, maximum_weight_mode):
+        """Test that all bands are resampled in one fornav pass matching resampling every band alone."""
+        swath_data, source_swath, target_area = get_test_data(
+            input_shape=(3, 100, 50), input_dims=('bands', 'y', 'x'))
+        resampler = DaskEWAResampler(source_swath, target_area)
+        with mock.patch.object(dask_ewa, 'fornav_weights_and_sums_multi_wrapper',
+                               wraps=dask_ewa.fornav_weights_and_sums_multi_wrapper) as multi_fornav, \
+                mock.patch.object(dask_ewa, 'fornav_weights_and_sums_wrapper',
+                                  wraps=dask_ewa.fornav_weights_and_sums_wrapper) as single_fornav, \
+                dask.config.set(scheduler='sync'):
+            res = resampler.resample(swath_data, rows_per_scan=10, weight_delta_max=40,
+                                     maximum_weight_mode=maximum_weight_mode).compute()
+        assert single_fornav.call_count == 0
+        assert multi_fornav.call_count > 0
+        assert res.dims == ('bands', 'y', 'x')
+
+        for band_idx in range(3):
+            band_res = resampler.resample(swath_data[band_idx], rows_per_scan=10, weight_delta_max=40,
+                                          maximum_weight_mode=maximum_weight_mode)
+            np.testing.assert_array_equal(res[band_idx].values, band_res.values)
+
+    def test_ewa_params_shared(self):
+        """Test that the EWA parameters of every ll2cr block are computed once for all data arrays."""
+        swath_data, source_swath, target_area = get_test_data()
+        resampler = DaskEWAResampler(source_swath, target_area)
+        exp = resampler.resample(swath_data, rows_per_scan=10, chunks=20).compute()
+        num_chunks = _get_num_chunks(source_swath, DaskEWAResampler)
+        with mock.patch.object(dask_ewa, 'compute_ewa_parameters_wrapper',
+                               wraps=dask_ewa.compute_ewa_parameters_wrapper) as ewa_params_func, \
+                dask.config.set(scheduler='sync'):
+            res1 = resampler.resample(swath_data, rows_per_scan=10, chunks=20)
+            res2 = resampler.resample(swath_data * 2, rows_per_scan=10, chunks=20)
+            res1, res2 = dask.compute(res1, res2)
+        assert 0 < ewa_params_func.call_count <= num_chunks
+        assert len(resampler.cache['ewa_params']) == 1
+        np.testing.assert_array_equal(res1, exp)
+        np.testing.assert_allclose(res2, exp * 2, rtol=1e-6)
+
+    def test_float32_navigation(self):
+        """Test that 32-bit column/row arrays are only used when requested."""
+        from pyresample.geometry import SwathDefinition
+        swath_data, source_swath, target_area = get_test_data()
+        exp = DaskEWAResampler(source_swath, target_area).resample(
+            swath_data, rows_per_scan=10).compute()
+
+        source_swath32 = SwathDefinition(source_swath.lons.astype(np.float32),
+                                         source_swath.lats.astype(np.float32))
+        resampler = DaskEWAResampler(source_swath32, target_area)
+        resampler.resample(swath_data, rows_per_scan=10).compute()
+        assert resampler.cache['ll2cr_result'].dtype == np.float64
+        assert _overlapping_ll2cr_dtypes(resampler) == {np.dtype(np.float64)}
+
+        resampler = DaskEWAResampler(source_swath32, target_area)
+        res = resampler.resample(swath_data, rows_per_scan=10, ll2cr_dtype=np.float32).compute()
+        assert resampler.cache['ll2cr_result'].dtype == np.float32
+        assert _overlapping_ll2cr_dtypes(resampler) == {np.dtype(np.float32)}
+        np.testing.assert_allclose(res, exp, atol=1e-3)
+
+    def test_float32_navigation_cache_dir(self, tmp_path):
+        """Test that 32-bit and 64-bit column/row arrays are cached separately."""
+        swath_data, source_swath, target_area = get_test_data()
+        for ll2cr_dtype in (np.float64, np.float32):
+            resampler = DaskEWAResampler(source_swath, target_area)
+            resampler.resample(swath_data, rows_per_scan=10, cache_dir=str(tmp_path), ll2cr_dtype=ll2cr_dtype)
+            assert _overlapping_ll2cr_dtypes(resampler) == {np.dtype(ll2cr_dtype)}
+        assert len(list(tmp_path.iterdir())) == 2
+
+
+def _overlapping_ll2cr_dtypes(resampler):
+    ll2cr_result = resampler.cache['ll2cr_result']
+    ll2cr_blocks = dask.compute(*[ll2cr_result.blocks[block_key[1:]].to_delayed().item()
+                                  for block_key in resampler.cache['ll2cr_blocks']])
+    return {block.dtype for block in ll2cr_blocks if not isinstance(block[0], tuple)}
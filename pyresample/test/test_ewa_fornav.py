@@ -18,6 +18,7 @@
 """Test EWA fornav module."""
 import logging
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -191,3 +192,89 @@ class TestFornavWrapper(unittest.TestCase):
         # output except outside the swath
         self.assertTrue(((out == 1) | np.isnan(out)).all(),
                         msg="Unexpected interpolation values were returned")
+
+    def test_fornav_threads(self):
+        """Test that resampling output tiles in multiple threads gives the same result as one thread."""
+        from pyresample.ewa import fornav
+        swath_shape = (1600, 800)
+        rows = np.empty(swath_shape, dtype=np.float32)
+        rows[:] = np.linspace(-500, 900, 1600)[:, None]
+        cols = np.empty(swath_shape, dtype=np.float32)
+        cols[:] = np.linspace(-100, 900, 800)
+        # a scan without valid geolocation
+        rows[32:48] = np.nan
+        rng = np.random.default_rng(42)
+        data = (rng.random(swath_shape, dtype=np.float32),
+                rng.random(swath_shape, dtype=np.float32))
+        area = None
+
+        exp_out = tuple(np.empty((1000, 1000), dtype=np.float32) for _ in data)
+        exp_points, exp = fornav(cols, rows, area, data, rows_per_scan=16, out=exp_out)
+        out = tuple(np.empty((1000, 1000), dtype=np.float32) for _ in data)
+        points, res = fornav(cols, rows, area, data, rows_per_scan=16, out=out,
+                             num_threads=4)
+        self.assertEqual(list(points), list(exp_points))
+        for res_arr, exp_arr in zip(res, exp):
+            np.testing.assert_array_equal(res_arr, exp_arr)
+            # grid rows beyond the swath are not covered
+            self.assertTrue(np.isnan(res_arr[-50:]).all())
+
+        with self.assertRaisesRegex(ValueError, "must be a factor of the total number of input rows"):
+            fornav(cols, rows, area, data, rows_per_scan=15, out=out, num_threads=4)
+
+    def test_fornav_threads_single_scan(self):
+        """Test that a swath treated as one scan is resampled without tiles."""
+        from pyresample.ewa import fornav
+        from pyresample.ewa import ewa as ewa_module
+        swath_shape = (160, 80)
+        rows = np.empty(swath_shape, dtype=np.float32)
+        rows[:] = np.linspace(-10, 110, 160)[:, None]
+        cols = np.empty(swath_shape, dtype=np.float32)
+        cols[:] = np.linspace(-5, 105, 80)
+        data = np.random.default_rng(42).random(swath_shape, dtype=np.float32)
+
+        exp_points, exp = fornav(cols, rows, None, data, out=np.empty((100, 100), dtype=np.float32))
+        with mock.patch.object(ewa_module, "_fornav_tiles") as fornav_tiles:
+            points, res = fornav(cols, rows, None, data, out=np.empty((100, 100), dtype=np.float32),
+                                 num_threads=4)
+        fornav_tiles.assert_not_called()
+        self.assertEqual(points, exp_points)
+        np.testing.assert_array_equal(res, exp)
+
+    def test_scan_selection(self):
+        """Test that consecutive scans are selected without copying the swath arrays."""
+        from pyresample.ewa.ewa import _scan_selection
+        scan_index, row_index = _scan_selection(np.array([False, True, True, False]), 16)
+        self.assertEqual(scan_index, slice(1, 3))
+        self.assertEqual(row_index, slice(16, 48))
+
+        scan_mask = np.array([True, False, True, False])
+        scan_index, row_index = _scan_selection(scan_mask, 16)
+        np.testing.assert_array_equal(scan_index, scan_mask)
+        np.testing.assert_array_equal(np.flatnonzero(row_index), np.r_[0:16, 32:48])
+
+    def test_fornav_precomputed_ewa_params(self):
+        """Test that precomputed EWA parameters give the same result as computing them on the fly."""
+        from pyresample.ewa import ewa_parameters, fornav
+        swath_shape = (160, 80)
+        rows = np.empty(swath_shape, dtype=np.float32)
+        rows[:] = np.linspace(-10, 110, 160)[:, None]
+        cols = np.empty(swath_shape, dtype=np.float32)
+        cols[:] = np.linspace(-5, 105, 80)
+        data = np.random.default_rng(42).random(swath_shape, dtype=np.float32)
+
+        ewa_params = ewa_parameters(cols, rows, rows_per_scan=16)
+        self.assertEqual(ewa_params.shape, (10, 80, 6))
+        self.assertEqual(ewa_params.dtype, np.float32)
+        exp_points, exp = fornav(cols, rows, None, data, rows_per_scan=16,
+                                 out=np.empty((100, 100), dtype=np.float32))
+        for num_threads in (1, 2):
+            points, res = fornav(cols, rows, None, data, rows_per_scan=16,
+                                 out=np.empty((100, 100), dtype=np.float32),
+                                 num_threads=num_threads, ewa_params=ewa_params)
+            self.assertEqual(points, exp_points)
+            np.testing.assert_array_equal(res, exp)
+
+        with self.assertRaises(ValueError):
+            fornav(cols, rows, None, data, rows_per_scan=16,
+                   out=np.empty((100, 100), dtype=np.float32), ewa_params=ewa_params[:5])
@@ -19,6 +19,7 @@
 
 import logging
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -121,6 +122,30 @@ class TestLL2CRStatic(unittest.TestCase):
                                              cw, ch, w, h, ox, oy)
         self.assertEqual(points_in_grid, 0, "none of these test points should fall in this grid")
 
+    def test_lcc_float32(self):
+        """Test that 32-bit navigation projected in row blocks matches 64-bit navigation."""
+        from pyresample.ewa import _ll2cr
+        lon_arr = create_test_longitude(-95.0, -75.0, (50, 100), dtype=np.float64)
+        lat_arr = create_test_latitude(18.0, 40.0, (50, 100), dtype=np.float64)
+        lon_arr[10, 10] = np.nan
+        lon_arr32 = lon_arr.astype(np.float32)
+        lat_arr32 = lat_arr.astype(np.float32)
+        lon_arr = lon_arr32.astype(np.float64)
+        lat_arr = lat_arr32.astype(np.float64)
+        grid_info = static_lcc.copy()
+        args = (grid_info["proj4_definition"], grid_info["cell_width"], grid_info["cell_height"],
+                grid_info["width"], grid_info["height"], grid_info["origin_x"], grid_info["origin_y"])
+        points_in_grid = _ll2cr.ll2cr_static(lon_arr, lat_arr, np.nan, *args)
+        # multiple blocks of rows with a smaller last block
+        with mock.patch.object(_ll2cr, "SCRATCH_SIZE", 7 * 100):
+            points_in_grid32 = _ll2cr.ll2cr_static(lon_arr32, lat_arr32, np.float32(np.nan), *args)
+        self.assertEqual(points_in_grid32, points_in_grid)
+        self.assertEqual(points_in_grid32, lon_arr.size - 1)
+        self.assertEqual(lon_arr32.dtype, np.float32)
+        np.testing.assert_allclose(lon_arr32, lon_arr, rtol=1e-6)
+        np.testing.assert_allclose(lat_arr32, lat_arr, rtol=1e-6)
+        self.assertTrue(np.isnan(lon_arr32[10, 10]))
+
 
 class TestLL2CRDynamic(unittest.TestCase):
     """Test ll2cr when given partial area definition information."""
@@ -222,3 +247,16 @@ class TestLL2CRWrapper(unittest.TestCase):
         self.assertIs(lon_arr, lon_res)
         self.assertIs(lat_arr, lat_res)
         self.assertEqual(points_in_grid, lon_arr.size, "all these test points should fall in this grid")
+
+        lon_arr32 = create_test_longitude(-95.0, -75.0, (50, 100), dtype=np.float32)
+        lat_arr32 = create_test_latitude(18.0, 40.0, (50, 100), dtype=np.float32)
+        swath_def = SwathDefinition(lon_arr32, lat_arr32)
+        points_in_grid32, lon_res32, lat_res32 = ll2cr(swath_def, area, fill=np.nan, copy=False,
+                                                       dtype=np.float32)
+        self.assertEqual(points_in_grid32, points_in_grid)
+        self.assertIs(lon_arr32, lon_res32)
+        self.assertIs(lat_arr32, lat_res32)
+        np.testing.assert_allclose(lon_res32, lon_res, atol=1e-2)
+        np.testing.assert_allclose(lat_res32, lat_res, atol=1e-2)
+        with self.assertRaises(ValueError):
+            ll2cr(swath_def, area, dtype=np.int32)
@@ -1041,6 +1041,108 @@ class TestAreaDefinition:
         assert lon.dtype == np.dtype("f8", )
         assert isinstance(lon, dask_array)
 
+    @pytest.mark.parametrize("chunks", [None, 4])
+    def test_get_lonlats_process_cache(self, create_test_area, chunks):
+        """Test that lon/lat arrays are shared between equal areas when caching is enabled."""
+        from pyresample._caching import lonlat_cache
+        proj_dict = {'proj': 'stere', 'lat_0': '50.00', 'lon_0': '8.00'}
+        area_extent = (-1370912.72, -909968.64000000001, 1029087.28, 1490031.3600000001)
+        area_def = create_test_area(proj_dict, 80, 80, area_extent)
+        area_def2 = create_test_area(proj_dict, 80, 80, area_extent)
+        lonlat_cache.clear()
+        with pyresample.config.set(cache_lonlats=True):
+            lons, lats = area_def.get_lonlats(chunks=chunks)
+            with patch("pyresample.geometry._invproj") as invproj, \
+                    patch("pyresample.geometry.pyproj.Transformer") as transformer:
+                lons2, lats2 = area_def2.get_lonlats(chunks=chunks)
+            invproj.assert_not_called()
+            transformer.from_crs.assert_not_called()
+            assert lons2 is lons
+            assert lats2 is lats
+            if chunks is None:
+                assert not lons.flags.writeable
+            lons3, _ = area_def.get_lonlats(chunks=chunks, dtype=np.float32)
+            assert lons3 is not lons
+            assert lons3.dtype == np.float32
+            assert len(lonlat_cache) == 2
+        lonlat_cache.clear()
+
+    def test_get_lonlats_process_cache_max_size(self, create_test_area):
+        """Test that the least recently used lon/lat arrays are removed from the cache."""
+        from pyresample._caching import lonlat_cache
+        proj_dict = {'proj': 'stere', 'lat_0': '50.00', 'lon_0': '8.00'}
+        area_extent = (-1370912.72, -909968.64000000001, 1029087.28, 1490031.3600000001)
+        area_def = create_test_area(proj_dict, 10, 10, area_extent)
+        area_def2 = create_test_area(proj_dict, 10, 12, area_extent)
+        lonlat_cache.clear()
+        with pyresample.config.set(cache_lonlats=True, cache_lonlats_max_size=2 * 10 * 12 * 8):
+            area_def.get_lonlats()
+            assert len(lonlat_cache) == 1
+            area_def2.get_lonlats()
+            assert len(lonlat_cache) == 1
+            assert lonlat_cache.size == 2 * 10 * 12 * 8
+        lonlat_cache.clear()
+
+    def test_get_lonlats_process_cache_too_large(self, create_test_area):
+        """Test that lon/lat arrays larger than the cache are not cached and stay writable."""
+        from pyresample._caching import lonlat_cache
+        proj_dict = {'proj': 'stere', 'lat_0': '50.00', 'lon_0': '8.00'}
+        area_extent = (-1370912.72, -909968.64000000001, 1029087.28, 1490031.3600000001)
+        area_def = create_test_area(proj_dict, 10, 10, area_extent)
+        lonlat_cache.clear()
+        with pyresample.config.set(cache_lonlats=True, cache_lonlats_max_size=2 * 10 * 10 * 8 - 1):
+            lons, lats = area_def.get_lonlats()
+            assert len(lonlat_cache) == 0
+            assert lons.flags.writeable
+            assert lats.flags.writeable
+            lons2, _ = area_def.get_lonlats()
+            assert lons2 is not lons
+        lonlat_cache.clear()
+
+    @pytest.mark.parametrize(
+        ("crs", "area_extent"),
+        [
+            ("EPSG:4326", (-180.0, -90.0, 180.0, 90.0)),
+            ("+proj=longlat +pm=180 +datum=WGS84", (-170.0, -80.0, 170.0, 80.0)),
+            ("+proj=eqc +lat_ts=30 +lat_0=5 +lon_0=10 +datum=WGS84", (-2e7, -9e6, 2e7, 9e6)),
+        ]
+    )
+    @pytest.mark.parametrize("chunks", [None, (10, 8)])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    @pytest.mark.parametrize("data_slice", [None, (slice(2, 15), slice(5, 30)), (0, slice(None))])
+    def test_get_lonlats_separable_crs(self, create_test_area, crs, area_extent, chunks, dtype, data_slice):
+        """Test that lat/lon-like areas only transform 1D vectors and match the 2D transformation."""
+        from pyproj import Transformer
+
+        from pyresample.utils.proj4 import get_geodetic_crs_with_no_datum_shift
+        area_def = create_test_area(crs, 37, 23, area_extent)
+        x, y = area_def.get_proj_coords(data_slice=data_slice, dtype=dtype)
+        gcrs = get_geodetic_crs_with_no_datum_shift(area_def.crs)
+        exp_lons, exp_lats = Transformer.from_crs(area_def.crs, gcrs, always_xy=True).transform(x, y)
+
+        with patch("pyresample.geometry._invproj") as invproj:
+            lons, lats = area_def.get_lonlats(chunks=chunks, dtype=dtype, data_slice=data_slice)
+            if chunks is not None:
+                assert isinstance(lons, da.Array)
+                assert lons.chunks == lats.chunks
+                lons, lats = da.compute(lons, lats)
+        invproj.assert_not_called()
+        assert lons.shape == exp_lons.shape[-lons.ndim:]
+        assert lons.dtype == dtype
+        assert lats.dtype == dtype
+        assert lons.flags.writeable
+        np.testing.assert_allclose(lons, exp_lons.astype(dtype).reshape(lons.shape))
+        np.testing.assert_allclose(lats, exp_lats.astype(dtype).reshape(lats.shape))
+
+    def test_get_lonlats_rotated_pole_not_separable(self, create_test_area):
+        """Test that rotated lat/lon CRSs still transform every pixel."""
+        from pyresample.geometry import _has_separable_lonlats
+        crs = "+proj=ob_tran +o_proj=longlat +o_lon_p=-40 +o_lat_p=22 +lon_0=10 +datum=WGS84"
+        area_def = create_test_area(crs, 10, 10, (-10.0, -10.0, 10.0, 10.0))
+        assert not _has_separable_lonlats(area_def.crs)
+        assert _has_separable_lonlats(CRS("EPSG:4326"))
+        assert not _has_separable_lonlats(CRS("EPSG:3857"))
+
     def test_area_def_geocentric_resolution(self, create_test_area):
         """Test the AreaDefinition.geocentric_resolution method."""
         area_extent = (-5570248.477339745, -5561247.267842293, 5567248.074173927, 5570248.477339745)
@@ -1682,7 +1784,7 @@ class TestAreaDefGetAreaSlices:
         crop_area = create_test_area({'proj': 'latlong'},
                                      100, 100,
                                      (15.9689, 58.5284, 16.4346, 58.6995))
-        cache_glob = str(tmp_path / "geometry_slices_v1" / "*.json")
+        cache_glob = str(tmp_path / "geometry_slices_v2" / "*.json")
         with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=cache_slices):
             assert len(glob(cache_glob)) == 0
             slice_x, slice_y = src_area.get_area_slices(crop_area)
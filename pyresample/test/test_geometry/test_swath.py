@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Test AreaDefinition objects."""
+from unittest import mock
+
 import dask.array as da
 import numpy as np
 import pytest
@@ -71,6 +73,14 @@ def _gen_swath_def_numpy_small(create_test_swath):
     return swath_def
 
 
+def _has_xxhash():
+    try:
+        import xxhash  # noqa
+    except ImportError:
+        return False
+    return True
+
+
 def _gen_swath_lons_lats():
     swath_shape = (50, 10)
     lon_start, lon_stop, lat_start, lat_stop = (3.0, 12.0, 75.0, 26.0)
@@ -115,6 +125,57 @@ class TestSwathHashability:
         swath_def_subset = _gen_swath_def_numpy_small_noncontiguous(create_test_swath)
         assert hash(swath_def) != hash(swath_def_subset)
 
+    def test_default_hash_method_is_unchanged(self, create_test_swath):
+        """Test that the default method hashes the full array buffers with SHA-1."""
+        import hashlib
+        lons, lats = _gen_swath_lons_lats()
+        exp = hashlib.sha1(lons.tobytes() + lats.tobytes()).hexdigest()  # nosec: B324
+        assert create_test_swath(lons, lats).update_hash().hexdigest() == exp
+
+    @pytest.mark.parametrize("method", ["blake2b", "fingerprint"])
+    def test_hash_methods(self, method, create_test_swath):
+        """Test hashing numpy swaths with the other hash methods."""
+        import pyresample
+        with pyresample.config.set(geometry_hash_method=method):
+            swath_def = _gen_swath_def_numpy(create_test_swath)
+            assert hash(swath_def) == hash(_gen_swath_def_numpy(create_test_swath))
+            assert hash(swath_def) != hash(_gen_swath_def_numpy_small(create_test_swath))
+            assert (hash(_gen_swath_def_numpy_small(create_test_swath)) !=
+                    hash(_gen_swath_def_numpy_small_noncontiguous(create_test_swath)))
+            lons, lats = _gen_swath_lons_lats()
+            assert hash(swath_def) != hash(create_test_swath(lons, lats + 1))
+            # dask arrays are still identified by their name
+            dask_swath_def = _gen_swath_def_xarray_dask(create_test_swath)
+            assert hash(dask_swath_def) == hash(_gen_swath_def_xarray_dask(create_test_swath))
+
+    def test_hash_method_digests_are_stored(self, create_test_swath):
+        """Test that the array digests are only computed once per swath and hash method."""
+        import pyresample
+        hash_func = mock.Mock(side_effect=lambda arr, num_threads: arr.tobytes()[:8])
+        swath_def = _gen_swath_def_numpy(create_test_swath)
+        with pyresample.config.set(geometry_hash_method=hash_func):
+            exp = swath_def.update_hash().hexdigest()
+            assert swath_def.update_hash().hexdigest() == exp
+        assert hash_func.call_count == 2
+        with pyresample.config.set(geometry_hash_method="blake2b"):
+            assert swath_def.update_hash().hexdigest() != exp
+        with pytest.raises(ValueError, match="Unknown geometry hash method"), \
+                pyresample.config.set(geometry_hash_method="unknown"):
+            swath_def.update_hash()
+
+    @pytest.mark.parametrize("method", ["blake2b", pytest.param("xxhash", marks=pytest.mark.skipif(
+        not _has_xxhash(), reason="xxhash is not installed"))])
+    def test_block_hash_threads(self, method):
+        """Test that the array digests don't depend on the number of threads."""
+        from pyresample import _hashing
+        arr = np.random.default_rng(0).random((100, 30))
+        hash_func = _hashing.HASH_METHODS[method]
+        with mock.patch.object(_hashing, "BLOCK_NBYTES", 1000):
+            digest = hash_func(arr, 4)
+            assert digest == hash_func(arr, 1)
+            assert digest != hash_func(arr[:-1], 4)
+            assert digest != hash_func(arr.astype(np.float32), 4)
+
 
 class TestSwathDefinition:
     """Test the SwathDefinition."""
@@ -119,6 +119,24 @@ class TestOGradientResampler:
         res = np.array(self.resampler.dst_mosaic_locations)[covered_src_chunks]
         assert all([all(loc == (0, 0)) for loc in list(res)])
 
+    def test_get_chunk_mappings_cached(self):
+        """Test that chunk mappings are reused for the same geometries and chunks."""
+        from pyresample.gradient import StackingGradientSearchResampler, _chunk_mappings_cache
+        _chunk_mappings_cache.clear()
+        chunks = (10, 10)
+        self.resampler._get_projection_coordinates(chunks)
+        self.resampler.get_chunk_mappings()
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=".*which is still EXPERIMENTAL.*", category=UserWarning)
+            resampler = StackingGradientSearchResampler(self.src_area, self.dst_area)
+        resampler._get_projection_coordinates(chunks)
+        with mock.patch.object(resampler, "_get_src_poly") as get_src_poly:
+            resampler.get_chunk_mappings()
+        get_src_poly.assert_not_called()
+        assert resampler.coverage_status == self.resampler.coverage_status
+        assert resampler.src_slices == self.resampler.src_slices
+        _chunk_mappings_cache.clear()
+
     def test_get_src_poly_area(self):
         """Test defining source chunk polygon for AreaDefinition."""
         chunks = (10, 10)
@@ -622,6 +640,25 @@ def test_check_overlap():
     assert check_overlap(poly1, poly2) is False
 
 
+def test_polygon_index_matches_check_overlap():
+    """Test that the spatial index of target polygons gives the same overlaps as check_overlap."""
+    from shapely.geometry import Polygon
+
+    from pyresample.gradient import _PolygonIndex, check_overlap
+
+    dst_polys = [Polygon(((x, y), (x, y + 1), (x + 1, y + 1), (x + 1, y)))
+                 for x in range(5) for y in range(5)]
+    dst_polys[3] = None
+    dst_polys[7] = False
+    index = _PolygonIndex(dst_polys)
+    src_polys = [Polygon(((1.5, 1.5), (1.5, 3.5), (2.5, 3.5), (2.5, 1.5))),
+                 Polygon(((10, 10), (10, 11), (11, 11), (11, 10))),
+                 None, False]
+    for src_poly in src_polys:
+        expected = [check_overlap(src_poly, dst_poly) for dst_poly in dst_polys]
+        assert index.overlaps(src_poly) == expected
+
+
 def test_get_border_lonlats_geos():
     """Test that correct methods are called in get_border_lonlats() with geos inputs."""
     from pyresample.gradient import get_border_lonlats
@@ -708,6 +708,27 @@ class Test(unittest.TestCase):
         expected = 1461.8428378742638
         self.assertAlmostEqual(cross_sum, expected)
 
+    def test_gauss_from_sample_blocks(self):
+        lons, lats = np.meshgrid(np.linspace(5, 11, 120), np.linspace(47, 53, 100))
+        swath_def = geometry.SwathDefinition(lons=lons, lats=lats)
+        area_def = self.area_def.copy(height=80, width=80)
+        data = np.ma.masked_greater(np.random.default_rng(1).random(lons.shape), 0.9)
+        data_multi = np.ma.dstack((data, data * 2))
+        neighbour_info = kd_tree.get_neighbour_info(swath_def, area_def, 50000, neighbours=16)
+        weight_funcs = [lambda r: np.exp(-r ** 2 / 25000. ** 2), lambda r: 1 / (r + 1)]
+
+        exp = kd_tree.get_sample_from_neighbour_info('custom', area_def.shape, data_multi, *neighbour_info,
+                                                     weight_funcs=weight_funcs, fill_value=None, with_uncert=True)
+        with mock.patch.object(kd_tree, '_resample_block_with_weights',
+                               wraps=kd_tree._resample_block_with_weights) as resample_block:
+            res = kd_tree.get_sample_from_neighbour_info('custom', area_def.shape, data_multi, *neighbour_info,
+                                                         weight_funcs=weight_funcs, fill_value=None,
+                                                         with_uncert=True, nprocs=2, block_size=1000)
+        assert resample_block.call_count == -(-neighbour_info[2].shape[0] // 1000)
+        for exp_arr, res_arr in zip(exp, res):
+            np.testing.assert_array_equal(np.ma.getmaskarray(res_arr), np.ma.getmaskarray(exp_arr))
+            np.testing.assert_array_equal(res_arr.compressed(), exp_arr.compressed())
+
     def test_masked_multi_from_sample(self):
         data = np.ones((50, 10))
         data[:, 5:] = 2
@@ -894,6 +915,17 @@ class TestXArrayResamplerNN(unittest.TestCase):
         expected = 15874591.0
         self.assertEqual(cross_sum, expected)
 
+    def test_nearest_swath_2d_mask_to_area_1n_partitioned(self):
+        """Test 2D swath definition to 2D area definition with one KD-tree per source chunk."""
+        from pyresample.kd_tree import XArrayResamplerNN
+        data = self.data_2d
+        resampler = XArrayResamplerNN(self.swath_def_2d, self.area_def,
+                                      radius_of_influence=50000,
+                                      neighbours=1, partition_kdtree=True)
+        resampler.get_neighbour_info(mask=data.isnull())
+        res = resampler.get_sample_from_neighbour_info(data).values
+        self.assertEqual(np.nansum(res), 15874591.0)
+
     def test_nearest_area_2d_to_area_1n(self):
         """Test 2D area definition to 2D area definition; 1 neighbor."""
         import dask.array as da
@@ -97,6 +97,30 @@ class TestResampleBlocksArea2Area:
         assert np.nanmax(res) == 6
         assert res[40, 40] != res[39, 39]
 
+    @pytest.mark.parametrize("cache_slices", [False, True])
+    def test_resample_blocks_caches_chunk_slices(self, tmp_path, cache_slices):
+        """Test resample_blocks loads the slices of the source chunks from the cache."""
+        from glob import glob
+        from unittest import mock
+
+        import pyresample
+        from pyresample.resampler import resample_blocks
+        from pyresample.slicer import Slicer
+
+        def fun(data, block_info=None, **kwargs):
+            return np.full(block_info[None]["chunk-shape"], np.mean(data))
+
+        some_array = da.arange(np.prod(self.src_area.shape)).reshape(self.src_area.shape).rechunk(chunks=40)
+        cache_glob = str(tmp_path / "geometry_slices_v2" / "*.json")
+        with pyresample.config.set(cache_dir=tmp_path, cache_geometry_slices=cache_slices):
+            exp = resample_blocks(fun, self.src_area, [some_array], self.dst_area, chunk_size=40, dtype=float)
+            assert len(glob(cache_glob)) == int(cache_slices)
+            with mock.patch.object(Slicer, "_compute_chunk_slices",
+                                   side_effect=Slicer._compute_chunk_slices, autospec=True) as compute_slices:
+                res = resample_blocks(fun, self.src_area, [some_array], self.dst_area, chunk_size=40, dtype=float)
+            assert compute_slices.call_count == int(not cache_slices)
+        np.testing.assert_array_equal(res.compute(), exp.compute())
+
     def test_resample_blocks_can_run_without_input(self):
         """Test resample_blocks can be run without input data."""
         from pyresample.resampler import resample_blocks
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Pyresample developers
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for resampler cache objects."""
+
+import os
+
+import dask.array as da
+import numpy as np
+import pytest
+
+from pyresample.future.resamplers import ZarrResampleCache
+
+
+def _test_arrays(size=100):
+    return {
+        "valid_input_index": da.ones((size,), dtype=bool, chunks=30),
+        "index_array": da.arange(size * 2, chunks=50).reshape((size, 2, 1)),
+    }
+
+
+class TestZarrResampleCache:
+    """Test the directory-backed zarr cache."""
+
+    def test_store_and_load(self, tmp_path):
+        cache = ZarrResampleCache(tmp_path)
+        assert "abc" not in cache
+        arrays = _test_arrays()
+        cache.store("abc", arrays)
+        assert "abc" in cache
+
+        loaded = cache.load("abc")
+        assert set(loaded) == set(arrays)
+        for name, arr in arrays.items():
+            assert isinstance(loaded[name], da.Array)
+            assert loaded[name].dtype == arr.dtype
+            np.testing.assert_array_equal(loaded[name].compute(), arr.compute())
+
+    def test_load_missing(self, tmp_path):
+        cache = ZarrResampleCache(tmp_path)
+        with pytest.raises(KeyError):
+            cache.load("abc")
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ZarrResampleCache(tmp_path)
+        cache.store("first", _test_arrays())
+        cache.store("second", _test_arrays())
+        entry_size = sum(f.stat().st_size for f in (tmp_path / "first").rglob("*") if f.is_file())
+        # make 'first' older than 'second' and then use it so it is the most recently used
+        os.utime(tmp_path / "first", (0, 0))
+        os.utime(tmp_path / "second", (1, 1))
+        cache.load("first")
+
+        cache.max_size = entry_size * 2
+        cache.store("third", _test_arrays())
+        assert "first" in cache
+        assert "second" not in cache
+        assert "third" in cache
+
+    def test_clear(self, tmp_path):
+        cache = ZarrResampleCache(tmp_path)
+        cache.store("abc", _test_arrays())
+        cache.clear()
+        assert "abc" not in cache
+        assert not list(tmp_path.iterdir())
@@ -28,6 +28,7 @@ from pytest_lazy_fixtures import lf
 
 from pyresample.future.geometry import AreaDefinition, SwathDefinition
 from pyresample.future.resamplers import KDTreeNearestXarrayResampler
+from pyresample.future.resamplers._transform_utils import lonlat2xyz
 from pyresample.test.utils import assert_maximum_dask_computes, assert_warnings_contain, catch_warnings
 from pyresample.utils.errors import PerformanceWarning
 
@@ -225,6 +226,76 @@ class TestNearestNeighborResampler:
         assert res.shape[:2] == resampler.target_geo_def.shape
 
 
+class TestNearestNeighborResamplerMultipleNeighbors:
+    """Test the KDTreeNearestXarrayResampler with more than one neighbor."""
+
+    @pytest.mark.parametrize(
+        ("weight_type", "weight_kwargs", "legacy_weight_func"),
+        [
+            ("gauss", {"sigma": 25000}, lambda r: np.exp(-r ** 2 / 25000.0 ** 2)),
+            ("idw", {"power": 2}, lambda r: 1 / np.maximum(r, 1e-6) ** 2),
+        ]
+    )
+    def test_weighted_matches_legacy(self, swath_def_2d_xarray_dask, data_2d_float32_xarray_dask,
+                                     area_def_stere_target, weight_type, weight_kwargs, legacy_weight_func):
+        """Test that weighted resampling matches the legacy numpy-only implementation."""
+        from pyresample import kd_tree
+        from pyresample.geometry import SwathDefinition as LegacySwathDefinition
+
+        resampler = KDTreeNearestXarrayResampler(swath_def_2d_xarray_dask, area_def_stere_target)
+        with assert_maximum_dask_computes(0):
+            res = resampler.resample(data_2d_float32_xarray_dask, mask_area=False,
+                                     radius_of_influence=50000, neighbors=4,
+                                     weight_type=weight_type, **weight_kwargs)
+        assert isinstance(res.data, da.Array)
+        assert res.dtype == np.float32
+        _check_common_metadata(res, True)
+
+        lons = swath_def_2d_xarray_dask.lons.values
+        lats = swath_def_2d_xarray_dask.lats.values
+        expected = kd_tree.resample_custom(
+            LegacySwathDefinition(lons, lats), data_2d_float32_xarray_dask.values, area_def_stere_target,
+            50000, legacy_weight_func, neighbours=4, fill_value=np.nan, reduce_data=False)
+        np.testing.assert_allclose(res.values, expected, rtol=1e-4)
+
+    def test_weighted_ignores_nan_values(self, area_def_stere_source, data_2d_float32_xarray_dask,
+                                         area_def_stere_target):
+        """Test that NaN source pixels are not included in the weighted result."""
+        data = data_2d_float32_xarray_dask.where(data_2d_float32_xarray_dask != 0)
+        resampler = KDTreeNearestXarrayResampler(area_def_stere_source, area_def_stere_target)
+        res = resampler.resample(data, mask_area=False, radius_of_influence=500000, neighbors=8,
+                                 weight_type="gauss", sigma=50000).values
+        valid_data = data.values[~np.isnan(data.values)]
+        valid_res = res[~np.isnan(res)]
+        assert valid_res.size > 0
+        assert valid_res.min() >= valid_data.min()
+        assert valid_res.max() <= valid_data.max()
+
+    def test_nearest_with_multiple_neighbors(self, area_def_stere_source, data_2d_float32_xarray_dask,
+                                             area_def_stere_target):
+        """Test that 'nearest' weighting with more neighbors matches 1 neighbor."""
+        resampler = KDTreeNearestXarrayResampler(area_def_stere_source, area_def_stere_target)
+        res1 = resampler.resample(data_2d_float32_xarray_dask, radius_of_influence=50000)
+        res4 = resampler.resample(data_2d_float32_xarray_dask, radius_of_influence=50000, neighbors=4)
+        np.testing.assert_array_equal(res4.values, res1.values)
+
+    @pytest.mark.parametrize("neighbors", [1, 4])
+    def test_gauss_requires_sigma(self, area_def_stere_source, data_2d_float32_xarray_dask,
+                                  area_def_stere_target, neighbors):
+        """Test that gaussian weighting without sigma fails."""
+        resampler = KDTreeNearestXarrayResampler(area_def_stere_source, area_def_stere_target)
+        with pytest.raises(ValueError, match=".*sigma.*"):
+            resampler.resample(data_2d_float32_xarray_dask, neighbors=neighbors, weight_type="gauss")
+
+    @pytest.mark.parametrize("neighbors", [1, 4])
+    def test_unknown_weight_type(self, area_def_stere_source, data_2d_float32_xarray_dask,
+                                 area_def_stere_target, neighbors):
+        """Test that an unknown weight type fails even if it wouldn't be used."""
+        resampler = KDTreeNearestXarrayResampler(area_def_stere_source, area_def_stere_target)
+        with pytest.raises(ValueError, match="Unknown weight type 'gaus'"):
+            resampler.resample(data_2d_float32_xarray_dask, neighbors=neighbors, weight_type="gaus")
+
+
 class TestInvalidUsageNearestNeighborResampler:
     """Test the resampler being given input that should raise an error.
 
@@ -300,3 +371,194 @@ class TestInvalidUsageNearestNeighborResampler:
                 resampler.precompute(mask=data_2d_float32_xarray_dask.notnull())
             else:
                 resampler.resample(data_2d_float32_xarray_dask)
+
+
+class TestNearestNeighborResamplerPartitioned:
+    """Test the KDTreeNearestXarrayResampler with one KD-tree per source chunk."""
+
+    @pytest.mark.parametrize("neighbors", [1, 4])
+    def test_partitioned_matches_single_tree(self, swath_def_2d_xarray_dask, data_2d_float32_xarray_dask,
+                                             area_def_stere_target, neighbors):
+        """Test that partitioned KD-trees produce the same result as a single KD-tree."""
+        kwargs = {"radius_of_influence": 50000, "neighbors": neighbors, "weight_type": "gauss", "sigma": 25000}
+        resampler = KDTreeNearestXarrayResampler(swath_def_2d_xarray_dask, area_def_stere_target)
+        expected = resampler.resample(data_2d_float32_xarray_dask, **kwargs).values
+
+        resampler = KDTreeNearestXarrayResampler(swath_def_2d_xarray_dask, area_def_stere_target,
+                                                 partition_kdtree=True)
+        # only the source coordinates and the bounding spheres are computed while building the graph
+        with assert_maximum_dask_computes(1):
+            res = resampler.resample(data_2d_float32_xarray_dask, **kwargs)
+        np.testing.assert_allclose(res.values, expected)
+
+    def test_partitioned_query_only_depends_on_overlapping_partitions(self):
+        """Test that distant partitions are not part of the target chunk queries."""
+        from pyresample.future.resamplers import nearest
+
+        lons, lats = np.meshgrid(np.linspace(0, 10, 20), np.linspace(80, 0, 100))
+        swath_def = SwathDefinition(xr.DataArray(da.from_array(lons, chunks=(10, 20)), dims=("y", "x")),
+                                    xr.DataArray(da.from_array(lats, chunks=(10, 20)), dims=("y", "x")))
+        data = xr.DataArray(da.from_array(np.arange(lons.size, dtype=np.float64).reshape(lons.shape),
+                                          chunks=(10, 20)), dims=("y", "x"))
+        area_def = AreaDefinition("EPSG:4326", (10, 10), (2, 10, 8, 16))
+        resampler = KDTreeNearestXarrayResampler(swath_def, area_def)
+        expected = resampler.resample(data, radius_of_influence=100000).values
+
+        resampler = KDTreeNearestXarrayResampler(swath_def, area_def, partition_kdtree=True)
+        with mock.patch.object(nearest, "_KDTreePartition", wraps=nearest._KDTreePartition) as partition_cls:
+            res = resampler.resample(data, radius_of_influence=100000).values
+        np.testing.assert_array_equal(res, expected)
+        assert not np.isnan(res).all()
+        # only the 2 or 3 chunks of source rows around 10-16 degrees north are built
+        assert 0 < partition_cls.call_count <= 3
+
+    def test_partitioned_query_computes_source_coordinates_once(self):
+        """Test that the KD-trees are built from the source coordinates computed for the bounding spheres."""
+        lons, lats = np.meshgrid(np.linspace(0, 10, 20), np.linspace(80, 0, 100))
+        lon_chunk_calls = []
+
+        def _count_chunk(chunk):
+            if chunk.shape == (10, 20):
+                lon_chunk_calls.append(chunk.shape)
+            return chunk
+
+        dask_lons = da.from_array(lons, chunks=(10, 20)).map_blocks(_count_chunk)
+        swath_def = SwathDefinition(xr.DataArray(dask_lons, dims=("y", "x")),
+                                    xr.DataArray(da.from_array(lats, chunks=(10, 20)), dims=("y", "x")))
+        area_def = AreaDefinition("EPSG:4326", (10, 10), (2, 10, 8, 16))
+        resampler = KDTreeNearestXarrayResampler(swath_def, area_def, partition_kdtree=True)
+        valid_input_index, kdtree = resampler._create_resample_kdtree()
+        target_lons, target_lats = area_def.get_lonlats(chunks=5)
+        valid_output_index = da.ones(target_lons.shape, dtype=bool, chunks=5)
+        res, _ = resampler._query_partitioned_kdtree(kdtree, target_lons, target_lats, valid_input_index,
+                                                     valid_output_index, None, 1, 100000, 0)
+        assert len(lon_chunk_calls) == dask_lons.numblocks[0]
+        res.compute()
+        assert len(lon_chunk_calls) == dask_lons.numblocks[0]
+
+    def test_partitioned_kdtree_skips_distant_partitions(self):
+        """Test that only partitions near the query points are searched."""
+        from pyresample.future.resamplers.nearest import PartitionedKDTree, _KDTreePartition
+
+        lons = np.array([[0.0, 0.1], [0.2, 0.3]])
+        lats = np.array([[0.0, 0.0], [60.0, 60.0]])
+        partitions = [_KDTreePartition(lons[:1], lats[:1]), _KDTreePartition(lons[1:], lats[1:])]
+        kdtree = PartitionedKDTree(partitions)
+        assert kdtree.n == 4
+        query_pts = lonlat2xyz(np.array([0.25]), np.array([60.0]))
+        partitions[0].kdtree = mock.Mock(wraps=partitions[0].kdtree)
+        dists, idxs = kdtree.query(query_pts, k=2, distance_upper_bound=100000)
+        partitions[0].kdtree.query.assert_not_called()
+        np.testing.assert_array_equal(np.sort(idxs[0]), [2, 3])
+        assert np.all(np.isfinite(dists))
+
+
+class TestNearestNeighborResamplerGridLookup:
+    """Test the KDTreeNearestXarrayResampler between areas on aligned grids."""
+
+    @pytest.mark.parametrize(
+        ("crs", "src_extent", "dst_extent"),
+        [
+            # target pixel centers away from source pixel edges so geocentric and grid distances agree
+            ("EPSG:4326", (-20.0, 30.0, 30.0, 70.0), (-10.0, 40.0, 25.5, 66.5)),
+            ("+proj=stere +lat_0=52 +lat_ts=52 +lon_0=5 +ellps=WGS84",
+             (-1370912.72, -909968.64, 1029087.28, 1490031.36),
+             (-1000000.0, -500000.0, 900000.0, 1400000.0)),
+        ]
+    )
+    def test_grid_lookup_matches_kdtree(self, crs, src_extent, dst_extent):
+        """Test that the grid index lookup produces the same result as the KD-tree without building it."""
+        src_area = AreaDefinition(crs, (40, 50), src_extent)
+        dst_area = AreaDefinition(crs, (53, 71), dst_extent)
+        data = xr.DataArray(da.from_array(np.arange(40 * 50, dtype=np.float32).reshape((40, 50)), chunks=15),
+                            dims=("y", "x"))
+        resampler = KDTreeNearestXarrayResampler(src_area, dst_area)
+        expected = resampler.resample(data, radius_of_influence=100000).values
+
+        resampler = KDTreeNearestXarrayResampler(src_area, dst_area, grid_lookup=True)
+        with mock.patch("pyresample.future.resamplers.nearest.KDTree") as kdtree, \
+                assert_maximum_dask_computes(0):
+            res = resampler.resample(data, radius_of_influence=100000)
+        kdtree.assert_not_called()
+        _check_common_metadata(res, True)
+        assert not np.isnan(expected).any()
+        np.testing.assert_array_equal(res.values, expected)
+
+    def test_grid_lookup_is_opt_in(self, area_def_stere_source):
+        """Test that the KD-tree is used between aligned grids unless the grid lookup is requested."""
+        from pyresample.future.resamplers import nearest
+
+        dst_area = area_def_stere_source[10:40, 2:8]
+        resampler = KDTreeNearestXarrayResampler(area_def_stere_source, dst_area)
+        with mock.patch.object(nearest, "get_grid_index_vectors") as get_grid_index_vectors:
+            resampler.precompute(radius_of_influence=50000)
+        get_grid_index_vectors.assert_not_called()
+
+    def test_grid_lookup_excludes_invalid_source_pixels(self):
+        """Test that source pixels with invalid lon/lats are not used by the grid lookup."""
+        crs = "+proj=geos +h=35785831 +ellps=WGS84"
+        src_area = AreaDefinition(crs, (40, 40), (-5570248.0, -5570248.0, 5570248.0, 5570248.0))
+        dst_area = AreaDefinition(crs, (20, 20), (-5570248.0, 0.0, 0.0, 5570248.0))
+        data = xr.DataArray(da.ones((40, 40), dtype=np.float32, chunks=15), dims=("y", "x"))
+        resampler = KDTreeNearestXarrayResampler(src_area, dst_area, grid_lookup=True)
+        res = resampler.resample(data, radius_of_influence=50000).values
+
+        src_lons, _ = src_area.get_lonlats()
+        off_disk = ~np.isfinite(src_lons[:20, :20])
+        assert off_disk.any() and not off_disk.all()
+        np.testing.assert_array_equal(np.isnan(res), off_disk)
+
+    def test_grid_lookup_in_cache_key(self, tmp_path, area_def_stere_source):
+        """Test that neighbor info of the grid lookup and the KD-tree are cached separately."""
+        dst_area = area_def_stere_source[10:40, 2:8]
+        for grid_lookup in (False, True):
+            resampler = KDTreeNearestXarrayResampler(area_def_stere_source, dst_area, cache=str(tmp_path),
+                                                     grid_lookup=grid_lookup)
+            resampler.precompute(radius_of_influence=50000)
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_grid_lookup_wraps_longitudes(self):
+        """Test that target longitudes are wrapped to the source grid for geographic CRSs."""
+        from pyresample.future.resamplers.nearest import get_grid_index_vectors
+
+        src_area = AreaDefinition("EPSG:4326", (180, 360), (-180.0, -90.0, 180.0, 90.0))
+        dst_area = AreaDefinition("EPSG:4326", (10, 20), (170.0, 0.0, 190.0, 10.0))
+        rows, cols = get_grid_index_vectors(src_area, dst_area)
+        np.testing.assert_array_equal(rows, np.arange(80, 90))
+        np.testing.assert_array_equal(cols, np.r_[350:360, 0:10])
+
+    def test_grid_lookup_not_aligned(self, area_def_stere_source, area_def_stere_target):
+        """Test that areas with different CRSs are not considered aligned grids."""
+        from pyresample.future.resamplers.nearest import get_grid_index_vectors
+
+        assert get_grid_index_vectors(area_def_stere_source, area_def_stere_target) is None
+
+
+class TestNearestNeighborResamplerCache:
+    """Test the KDTreeNearestXarrayResampler with an on-disk cache."""
+
+    def test_cache_reused_between_resamplers(self, tmp_path, area_def_stere_source, data_2d_float32_xarray_dask,
+                                             area_def_stere_target):
+        """Test that a second resampler loads the neighbor info from the cache directory."""
+        resampler = KDTreeNearestXarrayResampler(
+            area_def_stere_source, area_def_stere_target, cache=str(tmp_path))
+        res = resampler.resample(data_2d_float32_xarray_dask, radius_of_influence=50000)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        resampler2 = KDTreeNearestXarrayResampler(
+            area_def_stere_source, area_def_stere_target, cache=str(tmp_path))
+        with mock.patch.object(resampler2, "_get_neighbor_info") as get_info, \
+                assert_maximum_dask_computes(0):
+            res2 = resampler2.resample(data_2d_float32_xarray_dask, radius_of_influence=50000)
+        get_info.assert_not_called()
+        assert isinstance(res2.data, da.Array)
+        np.testing.assert_allclose(res2.values, res.values)
+        assert float(np.nansum(res2.values)) == 303048.0
+
+    def test_mask_not_cached(self, tmp_path, swath_def_2d_xarray_dask, data_2d_float32_xarray_dask,
+                             area_def_stere_target):
+        """Test that masked neighbor info is not stored in the cache."""
+        resampler = KDTreeNearestXarrayResampler(
+            swath_def_2d_xarray_dask, area_def_stere_target, cache=str(tmp_path))
+        resampler.resample(data_2d_float32_xarray_dask, radius_of_influence=50000)
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Pyresample developers
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the sparse matrix resampler."""
+
+import warnings
+from unittest import mock
+
+import dask
+import dask.array as da
+import numpy as np
+import pytest
+import xarray as xr
+
+from pyresample import kd_tree
+from pyresample.future.resamplers import ResampleCache, SparseMatrixResampler
+from pyresample.future.resamplers import sparse
+from pyresample.geometry import AreaDefinition, SwathDefinition
+
+pytest.importorskip("scipy")
+
+LCC = {"proj": "lcc", "lat_0": 45, "lon_0": 10, "lat_1": 45, "ellps": "WGS84"}
+
+
+class _DictCache(ResampleCache):
+    def __init__(self):
+        self.entries = {}
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def load(self, key):
+        return self.entries[key]
+
+    def store(self, key, arrays):
+        self.entries[key] = arrays
+
+    def clear(self):
+        self.entries.clear()
+
+
+@pytest.fixture
+def swath_def():
+    """Create a small swath over the target areas."""
+    lons, lats = np.meshgrid(np.linspace(5, 15, 80), np.linspace(42, 48, 70))
+    lons = lons + np.linspace(0, 0.5, 70)[:, np.newaxis]
+    return SwathDefinition(lons, lats)
+
+
+@pytest.fixture
+def area_def():
+    """Create a small LCC area partly covered by the swath."""
+    return AreaDefinition("lcc", "lcc", "lcc", LCC, 60, 50, (-300000, -250000, 300000, 250000))
+
+
+@pytest.fixture
+def swath_data():
+    """Create random data for the swath."""
+    return np.random.default_rng(42).random((70, 80))
+
+
+def _resample_with_ewa(swath_def, area_def, data):
+    from pyresample.ewa import fornav, ll2cr
+    _, cols, rows = ll2cr(swath_def, area_def)
+    return fornav(cols, rows, area_def, data, rows_per_scan=10)[1]
+
+
+def _resample_with_bilinear(swath_def, area_def, data):
+    from pyresample.bilinear import NumpyBilinearResampler
+    resampler = NumpyBilinearResampler(swath_def, area_def, 50000)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return resampler.resample(data, fill_value=np.nan)
+
+
+@pytest.mark.parametrize(
+    ("method", "kwargs", "resample_func", "atol"),
+    [
+        ("nearest", {"radius_of_influence": 30000},
+         lambda src, dst, data: kd_tree.resample_nearest(src, data, dst, 30000, fill_value=np.nan), 0),
+        ("gauss", {"radius_of_influence": 30000, "sigma": 10000},
+         lambda src, dst, data: kd_tree.resample_gauss(src, data, dst, 30000, sigmas=10000, fill_value=np.nan),
+         1e-12),
+        ("custom", {"radius_of_influence": 30000, "weight_func": lambda dist: 1 / (dist + 1)},
+         lambda src, dst, data: kd_tree.resample_custom(src, data, dst, 30000, lambda dist: 1 / (dist + 1),
+                                                        fill_value=np.nan), 1e-12),
+        ("ewa", {"rows_per_scan": 10}, _resample_with_ewa, 1e-6),
+        ("bilinear", {"radius_of_influence": 50000}, _resample_with_bilinear, 1e-12),
+    ])
+def test_methods_match_original_resamplers(swath_def, area_def, swath_data, method, kwargs, resample_func, atol):
+    """Test that the weight matrices reproduce the resamplers they were created from."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        exp = resample_func(swath_def, area_def, swath_data)
+    resampler = SparseMatrixResampler(swath_def, area_def)
+    res = resampler.resample(swath_data, method=method, **kwargs)
+    assert res.shape == area_def.shape
+    np.testing.assert_array_equal(np.isnan(res), np.isnan(exp))
+    assert not np.isnan(res).all()
+    np.testing.assert_allclose(res, exp, atol=atol, rtol=0)
+
+
+def test_dask_blocks_and_bands(swath_def, area_def, swath_data):
+    """Test that blockwise resampling of dask arrays matches resampling numpy arrays."""
+    resampler = SparseMatrixResampler(swath_def, area_def)
+    resampler.precompute(method="gauss", radius_of_influence=30000, sigma=10000)
+    data = np.stack([swath_data, swath_data * 2, swath_data + 1])
+    exp = resampler.resample(data)
+    dask_data = da.from_array(data, chunks=(1, 20, 30))
+    with mock.patch.object(sparse, "_weight_sums", wraps=sparse._weight_sums) as weight_sums, \
+            dask.config.set(scheduler="sync"):
+        res = resampler.resample(dask_data, chunks=17)
+        assert isinstance(res, da.Array)
+        assert res.chunks[0] == (3,)
+        num_out_chunks = len(res.chunks[1]) * len(res.chunks[2])
+        res = res.compute()
+    np.testing.assert_allclose(res, exp, rtol=1e-12)
+    # only the output chunk and input block pairs with weights are computed
+    assert 0 < weight_sums.call_count < num_out_chunks * dask_data.numblocks[1] * dask_data.numblocks[2]
+
+
+def test_dataarray(swath_def, area_def, swath_data):
+    """Test resampling DataArrays with the geolocation dimensions first."""
+    resampler = SparseMatrixResampler(swath_def, area_def)
+    data = xr.DataArray(da.from_array(np.stack([swath_data, swath_data]).transpose(1, 2, 0), chunks=35),
+                        dims=("y", "x", "bands"), attrs={"name": "test"})
+    res = resampler.resample(data, method="nearest", radius_of_influence=30000)
+    assert res.dims == ("bands", "y", "x")
+    assert res.attrs["name"] == "test"
+    assert res.attrs["area"] is area_def
+    assert "x" in res.coords and "y" in res.coords
+    exp = resampler.resample(swath_data)
+    np.testing.assert_array_equal(res.values[1], exp)
+
+
+def test_invalid_values_are_excluded(swath_def, area_def, swath_data):
+    """Test that the weights of NaN source values are not used."""
+    resampler = SparseMatrixResampler(swath_def, area_def)
+    resampler.precompute(method="ewa", rows_per_scan=10)
+    data = np.full(swath_data.shape, 5.0)
+    data[:, :40] = np.nan
+    res = resampler.resample(data)
+    valid = ~np.isnan(res)
+    assert valid.any()
+    np.testing.assert_allclose(res[valid], 5.0)
+    assert valid.sum() < (~np.isnan(resampler.resample(swath_data))).sum()
+
+    res = resampler.resample(np.full(swath_data.shape, np.nan), fill_value=-1)
+    np.testing.assert_array_equal(res, -1)
+
+
+def test_save_and_load(tmp_path, swath_def, area_def, swath_data):
+    """Test saving and loading the weights."""
+    resampler = SparseMatrixResampler(swath_def, area_def)
+    with pytest.raises(ValueError):
+        resampler.save_resampling_info(tmp_path / "weights.npz")
+    resampler.precompute(method="ewa", rows_per_scan=10)
+    resampler.save_resampling_info(tmp_path / "weights.npz")
+
+    new_resampler = SparseMatrixResampler(swath_def, area_def)
+    new_resampler.load_resampling_info(tmp_path / "weights.npz")
+    assert new_resampler.weight_sum_min == resampler.weight_sum_min == 0.01
+    np.testing.assert_array_equal(new_resampler.resample(swath_data), resampler.resample(swath_data))
+
+
+def test_cache(swath_def, area_def, swath_data):
+    """Test that the weights are stored in and loaded from the resampler's cache."""
+    cache = _DictCache()
+    resampler = SparseMatrixResampler(swath_def, area_def, cache=cache)
+    exp = resampler.resample(swath_data, method="nearest", radius_of_influence=30000)
+    assert len(cache.entries) == 1
+
+    resampler = SparseMatrixResampler(swath_def, area_def, cache=cache)
+    with mock.patch.dict(sparse._WEIGHT_BUILDERS, nearest=None):
+        res = resampler.resample(swath_data, method="nearest", radius_of_influence=30000)
+    np.testing.assert_array_equal(res, exp)
+
+    # functions can't be hashed
+    resampler.precompute(method="custom", radius_of_influence=30000, weight_func=np.ones_like)
+    assert len(cache.entries) == 1
+
+
+def test_bad_input(swath_def, area_def, swath_data):
+    """Test errors for weights and data not matching the geometries."""
+    with pytest.raises(ValueError, match="shape"):
+        SparseMatrixResampler(swath_def, area_def, weights=np.ones((2, 3)))
+    resampler = SparseMatrixResampler(swath_def, area_def)
+    with pytest.raises(ValueError, match="Unknown method"):
+        resampler.precompute(method="unknown")
+    resampler.precompute(method="nearest", radius_of_influence=30000)
+    with pytest.raises(ValueError):
+        resampler.resample(swath_data[:10])
+    with pytest.raises(ValueError):
+        resampler.resample(xr.DataArray(swath_data, dims=("a", "b")))
@@ -19,6 +19,7 @@
 
 import unittest
 
+import numpy as np
 import pytest
 import xarray as xr
 
@@ -267,7 +268,116 @@ class TestSwathSlicer(unittest.TestCase):
         poly = slicer.get_polygon_to_contain()
         assert isinstance(poly, Polygon)
 
+    def test_swath_chunk_polygons_are_computed_once(self):
+        """Test that the chunk polygons match the chunk edges and are computed in one dask compute."""
+        from shapely.geometry import Polygon
+
+        from pyresample.slicer import _get_chunk_polygons_for_swath_to_crop, expand_slice
+        from pyresample.test.utils import assert_maximum_dask_computes
+        lons = xr.DataArray(self.lons + 0.5)
+        lats = xr.DataArray(self.lats)
+        swath = SwathDefinition(lons, lats)
+        with assert_maximum_dask_computes(1):
+            chunk_polygons = _get_chunk_polygons_for_swath_to_crop(swath)
+        with assert_maximum_dask_computes(0):
+            assert _get_chunk_polygons_for_swath_to_crop(SwathDefinition(lons, lats)) is chunk_polygons
+
+        assert len(chunk_polygons) == 10 * 5
+        poly, (line_slice, col_slice) = chunk_polygons[13]
+        assert (line_slice, col_slice) == (slice(19, 31), slice(29, 41))
+        assert col_slice == expand_slice(slice(30, 40))
+        edge_lons, edge_lats = swath[line_slice, col_slice].get_edge_lonlats(10)
+        assert poly.equals_exact(Polygon(zip(edge_lons, edge_lats)), 0)
+
+    def test_swath_chunk_polygons_without_invalid_coordinates(self):
+        """Test that invalid coordinates are removed from the chunk polygons."""
+        from pyresample.slicer import _get_chunk_polygons_for_swath_to_crop
+        lons, lats = (arr.compute() for arr in (self.lons, self.lats))
+        lons[0, 0] = np.nan
+        swath = SwathDefinition(lons, lats)
+        chunk_polygons = _get_chunk_polygons_for_swath_to_crop(swath)
+        assert len(chunk_polygons) == 1
+        poly, slices = chunk_polygons[0]
+        assert slices == (slice(0, 101), slice(0, 51))
+        assert len(poly.exterior.coords) == 4 * 10 - 2 + 1
+        assert not np.isnan(poly.exterior.coords).any()
+
     def test_cannot_slice_a_string(self):
         """Test that we cannot slice a string."""
         with pytest.raises(NotImplementedError):
             create_slicer("my_funky_area", self.dst_area)
+
+
+def _get_slices_chunk_by_chunk(src_area, dst_area, chunks):
+    from pyresample.slicer import _enumerate_chunk_slices
+    res = {}
+    for position, slices in _enumerate_chunk_slices(chunks):
+        try:
+            res[position] = create_slicer(src_area, dst_area[tuple(slices)]).get_slices()
+        except IncompatibleAreas:
+            res[position] = None
+    return res
+
+
+class TestChunkSlices:
+    """Test slicing all the chunks of the area to contain at once."""
+
+    dst_area = AreaDefinition("euro40", "euro40", None,
+                              {"proj": "stere", "lon_0": 14.0, "lat_0": 90.0, "lat_ts": 60.0, "ellps": "bessel"},
+                              102, 102,
+                              (-2717181.7304994687, -5571048.14031214, 1378818.2695005313, -1475048.1403121399))
+    chunks = ((30, 30, 30, 12), (40, 40, 22))
+
+    @pytest.mark.parametrize(
+        "src_area",
+        [
+            AreaDefinition("geos", "geos", None, {"ellps": "WGS84", "h": "35785831", "proj": "geos"},
+                           100, 100, (5550000.0, 5550000.0, -5550000.0, -5550000.0)),
+            AreaDefinition("lcc", "lcc", None, {"proj": "lcc", "lat_0": 60, "lon_0": 0, "lat_1": 60, "ellps": "WGS84"},
+                           200, 150, (-3000000, -2000000, 1000000, 1000000)),
+            create_area_def("latlon", 4326, resolution=0.5, area_extent=(-20, 30, 30, 80)),
+        ])
+    def test_area_chunk_slices_match_single_chunk_slices(self, src_area):
+        """Test that the chunk slices are the same as when slicing the chunks one by one."""
+        slicer = create_slicer(src_area, self.dst_area)
+        res = slicer.get_chunk_slices(self.chunks)
+        assert res == _get_slices_chunk_by_chunk(src_area, self.dst_area, self.chunks)
+        assert len(res) == 12
+        assert any(slices is not None for slices in res.values())
+
+    def test_area_chunk_slices_outside_of_source(self):
+        """Test that chunks not overlapping the source area get None."""
+        src_area = AreaDefinition("lcc", "lcc", None,
+                                  {"proj": "lcc", "lat_0": 60, "lon_0": 0, "lat_1": 60, "ellps": "WGS84"},
+                                  100, 100, (-1000000, -1000000, 0, 0))
+        res = create_slicer(src_area, self.dst_area).get_chunk_slices(self.chunks)
+        assert res == _get_slices_chunk_by_chunk(src_area, self.dst_area, self.chunks)
+        assert None in res.values()
+
+    def test_swath_chunk_slices_match_single_chunk_slices(self):
+        """Test that the chunk slices of swaths are the same as when slicing the chunks one by one."""
+        import dask.array as da
+        lons, lats = np.meshgrid(np.linspace(-10, 40, 60), np.linspace(75, 40, 80))
+        swath = SwathDefinition(da.from_array(lons, chunks=20), da.from_array(lats, chunks=20))
+        res = create_slicer(swath, self.dst_area).get_chunk_slices(self.chunks)
+        assert res == _get_slices_chunk_by_chunk(swath, self.dst_area, self.chunks)
+
+    def test_chunk_slices_without_vectorized_shapely(self):
+        """Test that every chunk is sliced separately without shapely 2."""
+        from unittest import mock
+        src_area = AreaDefinition("lcc", "lcc", None,
+                                  {"proj": "lcc", "lat_0": 60, "lon_0": 0, "lat_1": 60, "ellps": "WGS84"},
+                                  200, 150, (-3000000, -2000000, 1000000, 1000000))
+        slicer = create_slicer(src_area, self.dst_area)
+        exp = slicer.get_chunk_slices(self.chunks)
+        with mock.patch("pyresample.slicer.shapely_polygons", None), \
+                mock.patch.object(type(slicer), "_get_slices_from_chunk_edges") as vectorized:
+            assert slicer.get_chunk_slices(self.chunks) == exp
+        vectorized.assert_not_called()
+
+    def test_transformers_are_reused(self):
+        """Test that the transformers are shared between slicers of the same projections."""
+        src_area = create_area_def("latlon", 4326, resolution=0.5, area_extent=(-20, 30, 30, 80))
+        first = create_slicer(src_area, self.dst_area)
+        second = create_slicer(src_area, self.dst_area[:50, :50])
+        assert first._transformer is second._transformer
@@ -64,3 +64,24 @@ class SpatialMPTest(unittest.TestCase):
         self.assertIs(type(coords_float32[0, 0]), np.float32)
         self.assertIs(type(coords_float[0, 0]), np.float64)
         self.assertTrue(np.issubdtype(coords_int.dtype, np.floating))
+
+    def test_ckdtree_mp(self):
+        """Test the threaded KD-tree gives the same result as pykdtree."""
+        from pykdtree.kdtree import KDTree
+
+        rng = np.random.default_rng(42)
+        data = rng.random((1000, 3))
+        query_pts = rng.random((100, 3))
+        for dtype in (np.float64, np.float32):
+            kdtree = sp.cKDTree_MP(data.astype(dtype), nprocs=2)
+            ref_kdtree = KDTree(data.astype(dtype))
+            for k in (1, 4):
+                dists, idxs = kdtree.query(query_pts.astype(dtype), k=k, distance_upper_bound=0.1)
+                exp_dists, exp_idxs = ref_kdtree.query(query_pts.astype(dtype), k=k, distance_upper_bound=0.1)
+                self.assertEqual(idxs.dtype, np.int64)
+                self.assertEqual(dists.dtype, dtype)
+                self.assertEqual(idxs.shape, exp_idxs.shape)
+                np.testing.assert_array_equal(idxs, exp_idxs)
+                valid = idxs < kdtree.n
+                np.testing.assert_allclose(dists[valid], exp_dists[valid], rtol=1e-5)
+                self.assertTrue(np.all(np.isinf(dists[~valid])))
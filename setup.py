@@ -42,6 +42,7 @@ extras_require = {'numexpr': ['numexpr'],
                   'gradient_search': ['shapely'],
                   'xarray_bilinear': ['xarray', 'dask', 'zarr'],
                   'odc-geo': ['odc-geo'],
+                  'sparse': ['scipy'],
                   'tests': test_requires}
 
 all_extras = []
@@ -70,6 +71,13 @@ extensions = [
               cython_directives={"language_level": 3},
               define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
               ),
+    Extension("pyresample.bucket._bucket",
+              sources=["pyresample/bucket/_bucket.pyx"],
+              include_dirs=[np.get_include()],
+              extra_compile_args=extra_compile_args,
+              cython_directives={"language_level": 3},
+              define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+              ),
     Extension("pyresample.gradient._gradient_search",
               sources=["pyresample/gradient/_gradient_search.pyx"],
               include_dirs=[np.get_include()],
@@ -84,6 +92,7 @@ cmdclass = versioneer.get_cmdclass(cmdclass={"build_ext": build_ext})
 entry_points = {
     "pyresample.resamplers": [
         "nearest = pyresample.future.resamplers.nearest:KDTreeNearestXarrayResampler",
+        "sparse = pyresample.future.resamplers.sparse:SparseMatrixResampler",
     ],
 }
 